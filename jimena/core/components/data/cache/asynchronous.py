@@ -0,0 +1,210 @@
+""" This module contains implementations of local caching for asyncio """
+
+import asyncio
+import inspect
+import sys
+from collections import OrderedDict
+from functools import wraps
+from time import time
+
+from jimena.core.components.data.cache.local import (
+    BaseCacheEngine,
+    CacheEntry,
+    CacheRegistry,
+    LocalCacheEngine,
+    _NO_CACHE_KEY,
+    _NO_VALUE,
+    _get_cache_key,
+)
+
+
+class AsyncCacheEngine:
+    """
+    Cache in Memory for asyncio - LRU cache with coroutine methods
+
+    It is meant to be used from a single event loop, so it does not use thread locks. Concurrent misses of the same
+    key in get_or_compute wait for a single computation, sharing its result or its exception. The computation runs
+    in its own task, so it completes even if the caller that started it is cancelled.
+    """
+
+    DEFAULT_TIMEOUT = BaseCacheEngine.DEFAULT_TIMEOUT
+    DEFAULT_SIZE = BaseCacheEngine.DEFAULT_SIZE
+    COUNTERS = BaseCacheEngine.COUNTERS
+
+    normalize_timeout = BaseCacheEngine.normalize_timeout
+    normalize_size = BaseCacheEngine.normalize_size
+
+    def __init__(self):
+        self.memory_cache = OrderedDict()
+        self.expiry_index = []
+        self.counters = dict.fromkeys(self.COUNTERS, 0)
+        self.in_flight = dict()
+
+    def _get(self, key):
+        """
+            Method that returns the value of a key, or a marker if the key is not stored.
+
+        :param key: Key stored in cache.
+        :return: [Object] Value of key.
+        """
+        result = self.memory_cache.get(key)
+        if result and result.timeout > time():
+            self.counters["hits"] += 1
+            self.memory_cache.move_to_end(key)
+            return result.value
+        self.counters["misses"] += 1
+        if result:
+            self.counters["expirations"] += 1
+            del self.memory_cache[key]
+        return _NO_VALUE
+
+    def _set(self, key, value, timeout=None, size=None) -> None:
+        """
+            Method that update or create a pair {key:value} in cache for a limited time.
+
+        :param key: Key to update or create.
+        :param value: Value to update or create.
+        :param timeout: Value that represents the time (in seconds) of permanence of the pair {key:value}.
+        :param size: Maximum number of objects in cache.
+        """
+        timeout = self.normalize_timeout(timeout)
+        self.counters["expirations"] += len(
+            LocalCacheEngine.reap_expired(self.memory_cache, self.expiry_index)
+        )
+        self.memory_cache[key] = CacheEntry(timeout, value)
+        self.memory_cache.move_to_end(key)
+        LocalCacheEngine.index_expiry(
+            self.memory_cache, self.expiry_index, key, timeout
+        )
+        size = self.normalize_size(size)
+        while len(self.memory_cache) > size:
+            self.memory_cache.popitem(last=False)
+            self.counters["evictions"] += 1
+
+    async def get(self, key):
+        value = self._get(key)
+        return None if value is _NO_VALUE else value
+
+    async def set(self, key, value, timeout=None, size=None):
+        self._set(key, value, timeout, size)
+
+    async def exists(self, key):
+        result = self.memory_cache.get(key)
+        return True if result and result.timeout > time() else False
+
+    async def delete(self, key):
+        self.memory_cache.pop(key, None)
+
+    async def clear(self):
+        self.memory_cache = OrderedDict()
+        self.expiry_index = []
+
+    async def get_or_compute(self, key, factory, timeout=None, size=None):
+        """
+            Method that returns the value of a key, awaiting the coroutine returned by factory on miss and storing
+        its result. Concurrent misses of the same key await the same computation.
+
+        :param key: Key stored in cache.
+        :param factory: Callable without arguments that returns the coroutine computing the value.
+        :param timeout: Value that represents the time (in seconds) of permanence of the pair {key:value}.
+        :param size: Maximum number of objects in cache.
+        :return: [Object] Value of key.
+        :raises Exception: The exception raised by the coroutine.
+        """
+        value = self._get(key)
+        if value is not _NO_VALUE:
+            return value
+        task = self.in_flight.get(key)
+        if task is None:
+            # Computed in its own task, so cancelling a caller does not cancel the others
+            task = asyncio.ensure_future(self._compute(key, factory, timeout, size))
+            task.add_done_callback(self._retrieve_exception)
+            self.in_flight[key] = task
+        return await asyncio.shield(task)
+
+    @staticmethod
+    def _retrieve_exception(task) -> None:
+        """
+            Method that retrieves the exception of a computation, so it is not reported when every caller was
+        cancelled.
+
+        :param task: Task of the computation.
+        """
+        if not task.cancelled():
+            task.exception()
+
+    async def _compute(self, key, factory, timeout=None, size=None):
+        """
+            Method that awaits the coroutine returned by factory and stores its result.
+
+        :param key: Key to update or create.
+        :param factory: Callable without arguments that returns the coroutine computing the value.
+        :param timeout: Value that represents the time (in seconds) of permanence of the pair {key:value}.
+        :param size: Maximum number of objects in cache.
+        :return: [Object] Value of key.
+        """
+        try:
+            value = await factory()
+        finally:
+            del self.in_flight[key]
+        self._set(key, value, timeout, size)
+        return value
+
+    def stats(self) -> dict:
+        """
+            Method that returns a snapshot of the cache statistics, with the same fields as BaseCacheEngine.stats.
+
+        :return: [Dict] Cache statistics.
+        """
+        return {
+            **self.counters,
+            "entries": len(self.memory_cache),
+            "bytes": sum(
+                sys.getsizeof(entry.value) for entry in self.memory_cache.values()
+            ),
+        }
+
+
+# Decorators
+def async_local_cache(
+    key=None,
+    timeout=None,
+    size=None,
+    name=None,
+    key_function=None,
+    typed=False,
+):
+    # The size of each set trims the whole engine, so it is only set for the engines of a single function
+    if name is not None and size is not None:
+        raise ValueError(
+            f"size can not be set for the shared cache engine {name}, "
+            f"it is bounded by the size of the engine"
+        )
+
+    def async_local_cache_decorator(function):
+        if not inspect.iscoroutinefunction(function):
+            raise TypeError(
+                f"{function.__qualname__} is not a coroutine function, "
+                f"use in_memory_local_cache instead"
+            )
+        # Without a name, the function has its own engine instead of a shared one
+        own_engine = AsyncCacheEngine() if name is None else None
+
+        @wraps(function)
+        async def async_local_cache_decorator_function(*args, **kwargs):
+            cache_key = _get_cache_key(key, key_function, typed, function, args, kwargs)
+            if cache_key is _NO_CACHE_KEY:
+                return await function(*args, **kwargs)
+            engine = (
+                own_engine
+                if own_engine is not None
+                else CacheRegistry.get_engine(name, engine_class=AsyncCacheEngine)
+            )
+            return await engine.get_or_compute(
+                cache_key, lambda: function(*args, **kwargs), timeout, size
+            )
+
+        async_local_cache_decorator_function.cache_engine = own_engine
+        return async_local_cache_decorator_function
+
+    return async_local_cache_decorator
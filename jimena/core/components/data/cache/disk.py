@@ -0,0 +1,274 @@
+""" This module contains implementations of caching persisted on local disk """
+
+import os
+import pickle
+import sqlite3
+import threading
+from time import time
+
+from jimena.core.components.data.cache.local import BaseCacheEngine
+from jimena.core.components.tools.system import SystemTools
+
+
+class DiskCacheEngine(BaseCacheEngine):
+    """
+    Subclass of Base Cache - Cache persisted in a SQLite file on local disk
+
+    The pairs {key:value} survive restarts and can be shared by several processes on the same host. Values are
+    serialized with pickle. Reads never write to the file, so when the maximum size is exceeded the oldest stored
+    pairs are evicted first. The number of pairs is kept by triggers, so writes only run the eviction query when
+    the cache is over its size. By default the file is in the "disk" cache folder of the user, and it is checked
+    with SystemTools.check_private_path before it is opened.
+    """
+
+    DEFAULT_SIZE = 10000  # max elements in cache
+    DEFAULT_FILE_NAME = "cache.sqlite"
+    CONNECTION_TIMEOUT = 30.0  # seconds waiting for a lock held by another process
+    BATCH_SIZE = 500  # max keys bound to a single statement
+    # Updates the stored pair, since replacing it would not fire the delete trigger
+    UPSERT = (
+        "ON CONFLICT (key) DO UPDATE SET value = excluded.value, "
+        "timeout = excluded.timeout, stored = excluded.stored"
+    )
+
+    def __init__(self, path: str = None):
+        self.path = (
+            path
+            if path
+            else os.path.join(
+                SystemTools().get_user_cache_folder_path("disk"), self.DEFAULT_FILE_NAME
+            )
+        )
+        self.counters = dict.fromkeys(self.COUNTERS, 0)
+        self.lock = threading.RLock()
+        self._connection = None
+        self._connection_pid = None
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """
+            Method that returns the connection to the cache file of the current process.
+        The connection is reopened after a fork, since SQLite connections must not be shared between processes.
+
+        :return: [Connection] SQLite connection.
+        """
+        if self._connection is None or self._connection_pid != os.getpid():
+            if os.path.exists(self.path):
+                SystemTools().check_private_path(self.path)
+            connection = sqlite3.connect(
+                self.path,
+                timeout=self.CONNECTION_TIMEOUT,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, "
+                "timeout REAL NOT NULL, stored REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS cache_timeout ON cache (timeout)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS cache_stored ON cache (stored)"
+            )
+            # Number of pairs kept by triggers, so writes do not count them
+            connection.execute("BEGIN IMMEDIATE")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache_count ("
+                "id INTEGER PRIMARY KEY CHECK (id = 0), entries INTEGER NOT NULL)"
+            )
+            connection.execute(
+                "INSERT OR IGNORE INTO cache_count (id, entries) "
+                "SELECT 0, COUNT(*) FROM cache"
+            )
+            connection.execute(
+                "CREATE TRIGGER IF NOT EXISTS cache_insert AFTER INSERT ON cache "
+                "BEGIN UPDATE cache_count SET entries = entries + 1; END"
+            )
+            connection.execute(
+                "CREATE TRIGGER IF NOT EXISTS cache_delete AFTER DELETE ON cache "
+                "BEGIN UPDATE cache_count SET entries = entries - 1; END"
+            )
+            connection.execute("COMMIT")
+            self._connection = connection
+            self._connection_pid = os.getpid()
+        return self._connection
+
+    def get(self, key):
+        with self.lock:
+            row = (
+                self._get_connection()
+                .execute(
+                    "SELECT value, timeout FROM cache WHERE key = ?",
+                    (self.normalize_key(key),),
+                )
+                .fetchone()
+            )
+            if row and row[1] > time():
+                self.counters["hits"] += 1
+                return pickle.loads(row[0])
+            self.counters["misses"] += 1
+            if row:
+                self.counters["expirations"] += 1
+                self.delete(key)
+
+    def set(self, key, value, timeout=None, size=None):
+        value = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self.lock:
+            connection = self._get_connection()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.execute(
+                    "INSERT INTO cache (key, value, timeout, stored) "
+                    "VALUES (?, ?, ?, ?) " + self.UPSERT,
+                    (
+                        self.normalize_key(key),
+                        value,
+                        self.normalize_timeout(timeout),
+                        time(),
+                    ),
+                )
+                self.sweep_expired()
+                self.size_regulator(self.normalize_size(size))
+                connection.execute("COMMIT")
+            except Exception:
+                connection.execute("ROLLBACK")
+                raise
+
+    def get_many(self, keys):
+        keys = {self.normalize_key(key): key for key in keys}
+        normalized_keys = list(keys)
+        result, expired = {}, []
+        with self.lock:
+            connection = self._get_connection()
+            now = time()
+            for i in range(0, len(normalized_keys), self.BATCH_SIZE):
+                batch = normalized_keys[i : i + self.BATCH_SIZE]
+                rows = connection.execute(
+                    f"SELECT key, value, timeout FROM cache WHERE key IN "
+                    f"({', '.join('?' * len(batch))})",
+                    batch,
+                )
+                for normalized_key, value, timeout in rows:
+                    if timeout > now:
+                        result[keys[normalized_key]] = pickle.loads(value)
+                    else:
+                        expired.append(keys[normalized_key])
+            self.counters["hits"] += len(result)
+            self.counters["misses"] += len(keys) - len(result)
+            self.counters["expirations"] += len(expired)
+            if expired:
+                self.delete_many(expired)
+            return result
+
+    def set_many(self, mapping, timeout=None, size=None):
+        stored = time()
+        timeout = self.normalize_timeout(timeout)
+        rows = [
+            (
+                self.normalize_key(key),
+                pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL),
+                timeout,
+                stored,
+            )
+            for key, value in mapping.items()
+        ]
+        with self.lock:
+            connection = self._get_connection()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.executemany(
+                    "INSERT INTO cache (key, value, timeout, stored) "
+                    "VALUES (?, ?, ?, ?) " + self.UPSERT,
+                    rows,
+                )
+                self.sweep_expired()
+                self.size_regulator(self.normalize_size(size))
+                connection.execute("COMMIT")
+            except Exception:
+                connection.execute("ROLLBACK")
+                raise
+
+    def delete_many(self, keys):
+        with self.lock:
+            self._get_connection().executemany(
+                "DELETE FROM cache WHERE key = ?",
+                [(self.normalize_key(key),) for key in keys],
+            )
+
+    def exists(self, key):
+        with self.lock:
+            row = (
+                self._get_connection()
+                .execute(
+                    "SELECT 1 FROM cache WHERE key = ? AND timeout > ?",
+                    (self.normalize_key(key), time()),
+                )
+                .fetchone()
+            )
+            return row is not None
+
+    def delete(self, key):
+        with self.lock:
+            self._get_connection().execute(
+                "DELETE FROM cache WHERE key = ?", (self.normalize_key(key),)
+            )
+
+    def clear(self):
+        with self.lock:
+            self._get_connection().execute("DELETE FROM cache")
+
+    def size_regulator(self, size: int) -> None:
+        """
+            Method that regulates the size of the cache, removing the oldest stored pairs {key:value}.
+
+        :param size: Maximum number of objects in cache.
+        """
+        with self.lock:
+            connection = self._get_connection()
+            (entries,) = connection.execute(
+                "SELECT entries FROM cache_count"
+            ).fetchone()
+            if entries <= size:
+                return
+            cursor = connection.execute(
+                "DELETE FROM cache WHERE key IN (SELECT key FROM cache "
+                "ORDER BY stored, rowid LIMIT ?)",
+                (entries - size,),
+            )
+            self.counters["evictions"] += max(cursor.rowcount, 0)
+
+    def sweep_expired(self) -> int:
+        """
+            Method that removes all the expired pairs {key:value} of the cache.
+
+        :return: [Int] Number of pairs removed.
+        """
+        with self.lock:
+            cursor = self._get_connection().execute(
+                "DELETE FROM cache WHERE timeout <= ?", (time(),)
+            )
+            reaped = max(cursor.rowcount, 0)
+            self.counters["expirations"] += reaped
+            return reaped
+
+    def stats(self):
+        with self.lock:
+            entries, size = (
+                self._get_connection()
+                .execute("SELECT COUNT(*), COALESCE(SUM(LENGTH(value)), 0) FROM cache")
+                .fetchone()
+            )
+            return {**self.counters, "entries": entries, "bytes": size}
+
+    def close(self) -> None:
+        """
+        Method that closes the connection to the cache file.
+        """
+        with self.lock:
+            if self._connection is not None and self._connection_pid == os.getpid():
+                self._connection.close()
+            self._connection = None
+            self._connection_pid = None
@@ -1,15 +1,64 @@
 """ This module contains different implementations from local caching """
 
+import inspect
+import sys
 import threading
+import weakref
 from abc import ABC, abstractmethod
+from collections import ChainMap, OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+from heapq import heapify, heappop, heappush
+from itertools import count, islice
 from time import time
 
+from jimena.core.components.handler.logging import LoggingHandlerCore
+
+# Stale items allowed in an expiry or tag index before rebuilding it
+EXPIRY_INDEX_SLACK = 64
+
+_expiry_sequence = count()
+
+
+class CacheEntry:
+    """Pair {timeout:value} stored in a local cache, with slots to reduce the memory of each entry"""
+
+    __slots__ = ("timeout", "value")
+
+    def __init__(self, timeout: float, value: object):
+        self.timeout = timeout
+        self.value = value
+
+
+class TaggedCacheEntry(CacheEntry):
+    """Pair {timeout:value} stored in a local cache, with the tags used to invalidate it"""
+
+    __slots__ = ("tags",)
+
+    def __init__(self, timeout: float, value: object, tags: frozenset):
+        super().__init__(timeout, value)
+        self.tags = tags
+
+
+class SizedCacheEntry(CacheEntry):
+    """Pair {timeout:value} stored in a local cache, with the size (in bytes) of the value and its tags"""
+
+    __slots__ = ("bytes", "tags")
+
+    def __init__(
+        self, timeout: float, value: object, value_bytes: int, tags: frozenset = None
+    ):
+        super().__init__(timeout, value)
+        self.bytes = value_bytes
+        self.tags = tags if tags else frozenset()
+
 
 class BaseCacheEngine(ABC):
     """Abstract class of Base Cache"""
 
     DEFAULT_TIMEOUT = 300.0  # seconds
     DEFAULT_SIZE = 300  # max elements in cache
+    COUNTERS = ("hits", "misses", "evictions", "expirations")
 
     @abstractmethod
     def get(self, key: str):
@@ -58,17 +107,56 @@ class BaseCacheEngine(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def stats(self) -> dict:
+        """
+            Method that returns a snapshot of the cache statistics.
 
-class LocalCacheEngine(BaseCacheEngine):
-    """Subclass class of Base Cache"""
+            hits -> Number of get calls that found a valid key.
+            misses -> Number of get calls that did not find a valid key.
+            evictions -> Number of pairs {key:value} removed to respect the maximum size.
+            expirations -> Number of expired pairs {key:value} removed.
+            entries -> Number of pairs {key:value} currently stored.
+            bytes -> Approximate size (in bytes) of the stored values.
 
-    @abstractmethod
-    def size_regulator(self, size: int) -> None:
+        :return: [Dict] Cache statistics.
         """
-            Method that regulates the size of the cache.
+        raise NotImplementedError
+
+    def get_many(self, keys) -> dict:
+        """
+            Method to return the values of several keys stored in the cache.
+        The keys that do not exist are not included in the response.
+
+        :param keys: Keys stored in cache.
+        :return: [Dict] Pairs {key:value} found.
+        """
+        result = {}
+        for key in keys:
+            value = self.get(key)
+            if value is not None or self.exists(key):
+                result[key] = value
+        return result
 
+    def set_many(self, mapping: dict, timeout: float = None, size: int = None) -> None:
+        """
+            Method that update or create several pairs {key:value} in cache for the same limited time.
+
+        :param mapping: Pairs {key:value} to update or create.
+        :param timeout: Value that represents the time (in seconds) of permanence of the pairs {key:value}.
         :param size: Maximum number of objects in cache.
         """
+        for key, value in mapping.items():
+            self.set(key, value, timeout, size)
+
+    def delete_many(self, keys) -> None:
+        """
+            Method that deletes several keys of the cache.
+
+        :param keys: Keys to delete.
+        """
+        for key in keys:
+            self.delete(key)
 
     def normalize_timeout(self, timeout: float) -> float:
         """
@@ -91,46 +179,616 @@ class LocalCacheEngine(BaseCacheEngine):
         size = int(size) if size else self.DEFAULT_SIZE
         return size
 
+    @staticmethod
+    def normalize_key(key) -> str:
+        """
+            Method that returns the key as it is stored by the engines that serialize their keys. Keys are stored by
+        their repr, so they must have a stable representation (str, int, tuples of them, or the keys built by
+        make_cache_key).
+
+        :param key: Key stored in cache.
+        :return: [Str] Normalized key.
+        """
+        return repr(key)
+
+
+class LocalCacheEngine(BaseCacheEngine):
+    """Subclass class of Base Cache"""
+
+    @property
+    def reaped(self) -> int:
+        """
+            Number of expired pairs {key:value} removed from the cache.
+
+        :return: [Int] Number of pairs removed.
+        """
+        return self._get_counters()["expirations"]
+
+    @abstractmethod
+    def _get_cache(self) -> dict:
+        """
+            Method that returns the object where the pairs {key:value} are stored.
+
+        :return: [Dict] Cache.
+        """
+
+    @abstractmethod
+    def _get_counters(self) -> dict:
+        """
+            Method that returns the counters of the cache statistics.
+
+        :return: [Dict] Counters.
+        """
+
+    @abstractmethod
+    def size_regulator(self, size: int) -> None:
+        """
+            Method that regulates the size of the cache.
+
+        :param size: Maximum number of objects in cache.
+        """
+
+    @abstractmethod
+    def sweep_expired(self) -> int:
+        """
+            Method that removes all the expired pairs {key:value} of the cache.
+
+        :return: [Int] Number of pairs removed.
+        """
+
+    @abstractmethod
+    def invalidate_tag(self, tag) -> list:
+        """
+            Method that removes all the pairs {key:value} stored with a tag. The cost is proportional to the number
+        of keys stored with the tag, not to the size of the cache.
+
+        :param tag: Tag given when the pairs were set.
+        :return: [List] Keys removed.
+        """
+
+    def stats(self):
+        return {
+            **self._get_counters(),
+            "entries": len(self._get_cache()),
+            "bytes": self._get_bytes(),
+        }
+
+    def _get_bytes(self) -> int:
+        """
+            Method that returns the approximate size (in bytes) of the stored values.
+        By default it is a shallow estimate computed on demand.
+
+        :return: [Int] Approximate size in bytes.
+        """
+        return sum(
+            sys.getsizeof(entry.value) for entry in list(self._get_cache().values())
+        )
+
+    @staticmethod
+    def index_expiry(cache: dict, expiry_index: list, key, timeout: float) -> None:
+        """
+            Method that adds the normalized timeout of a key to the expiry index (min-heap) of a cache.
+        Index items of overwritten or deleted keys are discarded lazily, and the index is rebuilt when they
+        outnumber the live ones.
+
+        :param cache: Cache of the key.
+        :param expiry_index: Expiry index of the cache.
+        :param key: Key stored in cache.
+        :param timeout: Normalized timeout of the key.
+        """
+        heappush(expiry_index, (timeout, next(_expiry_sequence), key))
+        if len(expiry_index) > 2 * len(cache) + EXPIRY_INDEX_SLACK:
+            expiry_index[:] = [
+                (entry.timeout, next(_expiry_sequence), k) for k, entry in cache.items()
+            ]
+            heapify(expiry_index)
+
+    @staticmethod
+    def normalize_tags(tags) -> frozenset:
+        """
+            Method that normalizes the tags of a pair {key:value}. A single string is a single tag.
+
+        :param tags: Tag or iterable of tags.
+        :return: [Frozenset] Normalized tags.
+        """
+        return frozenset((tags,) if isinstance(tags, str) else tags or ())
+
+    @staticmethod
+    def index_tags(cache: dict, tag_index: dict, key, tags: frozenset) -> None:
+        """
+            Method that adds a key to the reverse index {tag:keys} of a cache.
+        Index keys of overwritten, deleted or evicted pairs are discarded lazily, and the keys of a tag are
+        pruned when they outnumber the live ones.
+
+        :param cache: Cache of the key.
+        :param tag_index: Tag index of the cache.
+        :param key: Key stored in cache.
+        :param tags: Normalized tags of the key.
+        """
+        for tag in tags:
+            keys = tag_index.setdefault(tag, set())
+            keys.add(key)
+            if len(keys) > 2 * len(cache) + EXPIRY_INDEX_SLACK:
+                tag_index[tag] = {
+                    k for k in keys if tag in getattr(cache.get(k), "tags", ())
+                }
+
+    @staticmethod
+    def pop_tag(cache: dict, tag_index: dict, tag) -> list:
+        """
+            Method that removes a tag from the reverse index of a cache and returns the keys stored with it.
+
+        :param cache: Cache of the keys.
+        :param tag_index: Tag index of the cache.
+        :param tag: Tag to remove.
+        :return: [List] Keys stored in cache with the tag.
+        """
+        return [
+            key
+            for key in tag_index.pop(tag, ())
+            if tag in getattr(cache.get(key), "tags", ())
+        ]
+
+    @staticmethod
+    def reap_expired(cache: dict, expiry_index: list) -> list:
+        """
+            Method that removes the expired pairs {key:value} of a cache using its expiry index.
+        Only the expired head of the index is visited, so the cost is proportional to the pairs removed.
+
+        :param cache: Cache to sweep.
+        :param expiry_index: Expiry index of the cache.
+        :return: [List] Entries removed.
+        """
+        now = time()
+        reaped = []
+        while expiry_index and expiry_index[0][0] <= now:
+            timeout, _, key = heappop(expiry_index)
+            entry = cache.get(key)
+            if entry is not None and entry.timeout == timeout:
+                del cache[key]
+                reaped.append(entry)
+        return reaped
+
 
 class InMemoryCacheEngine(LocalCacheEngine):
-    """Subclass of Local Cache - Cache in Memory"""
+    """
+    Subclass of Local Cache - Cache in Memory
+
+    The shallow size of the values is added to a running total when they are stored and subtracted when they are
+    removed, so stats does not visit the entries.
+    """
 
     def __init__(self):
         self.memory_cache = dict()
+        self.expiry_index = []
+        self.tag_index = dict()
+        self.counters = dict.fromkeys(self.COUNTERS, 0)
+        self.lock = threading.RLock()
+        self.total_bytes = 0
 
-    def get(self, key):
-        result = self.memory_cache.get(key)
-        return (
-            result["value"]
-            if result and result["timeout"] > time()
-            else self.delete(key)
+    def _get_cache(self):
+        return self.memory_cache
+
+    def _get_counters(self):
+        return self.counters
+
+    def _get_bytes(self):
+        return self.total_bytes
+
+    def _remove_bytes(self, entries) -> None:
+        """
+            Method that subtracts the size of the values of removed entries from the running total. The lock must
+        be held by the caller.
+
+        :param entries: Entries removed from the cache.
+        """
+        self.total_bytes = max(
+            self.total_bytes - sum(sys.getsizeof(entry.value) for entry in entries), 0
         )
 
-    def set(self, key, value, timeout=None, size=None):
-        self.size_regulator(self.normalize_size(size))
-        self.memory_cache[key] = {
-            "timeout": self.normalize_timeout(timeout),
-            "value": value,
-        }
+    def get(self, key):
+        with self.lock:
+            result = self.memory_cache.get(key)
+            if result and result.timeout > time():
+                self.counters["hits"] += 1
+                return result.value
+            self.counters["misses"] += 1
+            if result:
+                self.counters["expirations"] += 1
+            return self.delete(key)
+
+    def _store(self, key, value, timeout: float, tags: frozenset = None) -> None:
+        """
+            Method that stores a pair {key:value} and indexes its normalized timeout and tags. The lock must be held
+        by the caller.
+
+        :param key: Key to update or create.
+        :param value: Value to update or create.
+        :param timeout: Normalized timeout.
+        :param tags: Normalized tags.
+        """
+        previous = self.memory_cache.get(key)
+        if previous is not None:
+            self._remove_bytes((previous,))
+        if tags:
+            self.memory_cache[key] = TaggedCacheEntry(timeout, value, tags)
+            self.index_tags(self.memory_cache, self.tag_index, key, tags)
+        else:
+            self.memory_cache[key] = CacheEntry(timeout, value)
+        self.total_bytes += sys.getsizeof(value)
+        self.index_expiry(self.memory_cache, self.expiry_index, key, timeout)
+
+    def set(self, key, value, timeout=None, size=None, tags=None):
+        with self.lock:
+            timeout = self.normalize_timeout(timeout)
+            self.sweep_expired()
+            self.size_regulator(self.normalize_size(size))
+            self._store(key, value, timeout, self.normalize_tags(tags))
+
+    def get_many(self, keys):
+        keys = list(keys)
+        with self.lock:
+            now = time()
+            result = {}
+            for key in keys:
+                entry = self.memory_cache.get(key)
+                if entry and entry.timeout > now:
+                    result[key] = entry.value
+                elif entry:
+                    self.counters["expirations"] += 1
+                    self.delete(key)
+            self.counters["hits"] += len(result)
+            self.counters["misses"] += len(keys) - len(result)
+            return result
+
+    def set_many(self, mapping, timeout=None, size=None):
+        with self.lock:
+            timeout = self.normalize_timeout(timeout)
+            self.sweep_expired()
+            size = self.normalize_size(size)
+            # Room only for the new keys, then trimmed if the mapping exceeds size
+            new_keys = sum(key not in self.memory_cache for key in mapping)
+            self.size_regulator(max(size - new_keys, 0))
+            for key, value in mapping.items():
+                self._store(key, value, timeout)
+            self.size_regulator(size)
+
+    def delete_many(self, keys):
+        with self.lock:
+            for key in keys:
+                self.delete(key)
 
     def exists(self, key):
-        return (
-            True
-            if key in self.memory_cache and self.memory_cache[key]["timeout"] > time()
-            else False
+        with self.lock:
+            return (
+                True
+                if key in self.memory_cache and self.memory_cache[key].timeout > time()
+                else False
+            )
+
+    def delete(self, key):
+        with self.lock:
+            entry = self.memory_cache.pop(key, None)
+            if entry is not None:
+                self._remove_bytes((entry,))
+
+    def clear(self):
+        with self.lock:
+            self.memory_cache = {}
+            self.expiry_index = []
+            self.tag_index = {}
+            self.total_bytes = 0
+
+    def size_regulator(self, size):
+        with self.lock:
+            if len(self.memory_cache) > size:
+                count = len(self.memory_cache) - size
+                self._remove_bytes(
+                    [self.memory_cache.popitem()[1] for _ in range(count)]
+                )
+                self.counters["evictions"] += count
+
+    def sweep_expired(self):
+        with self.lock:
+            reaped = self.reap_expired(self.memory_cache, self.expiry_index)
+            self._remove_bytes(reaped)
+            self.counters["expirations"] += len(reaped)
+            return len(reaped)
+
+    def invalidate_tag(self, tag):
+        with self.lock:
+            keys = self.pop_tag(self.memory_cache, self.tag_index, tag)
+            for key in keys:
+                self.delete(key)
+            return keys
+
+    def stats(self):
+        with self.lock:
+            return super().stats()
+
+
+class LRUCacheEngine(InMemoryCacheEngine):
+    """Subclass of In Memory Cache - Cache in Memory with Least Recently Used eviction"""
+
+    def __init__(self):
+        super().__init__()
+        self.memory_cache = OrderedDict()
+
+    def get(self, key):
+        with self.lock:
+            result = self.memory_cache.get(key)
+            if result and result.timeout > time():
+                self.counters["hits"] += 1
+                self.memory_cache.move_to_end(key)
+                return result.value
+            self.counters["misses"] += 1
+            if result:
+                self.counters["expirations"] += 1
+            return self.delete(key)
+
+    def _store(self, key, value, timeout, tags=None):
+        super()._store(key, value, timeout, tags)
+        self.memory_cache.move_to_end(key)
+
+    def set(self, key, value, timeout=None, size=None, tags=None):
+        with self.lock:
+            timeout = self.normalize_timeout(timeout)
+            self.sweep_expired()
+            self._store(key, value, timeout, self.normalize_tags(tags))
+            self.size_regulator(self.normalize_size(size))
+
+    def get_many(self, keys):
+        with self.lock:
+            result = super().get_many(keys)
+            for key in result:
+                self.memory_cache.move_to_end(key)
+            return result
+
+    def set_many(self, mapping, timeout=None, size=None):
+        with self.lock:
+            timeout = self.normalize_timeout(timeout)
+            self.sweep_expired()
+            for key, value in mapping.items():
+                self._store(key, value, timeout)
+            self.size_regulator(self.normalize_size(size))
+
+    def clear(self):
+        with self.lock:
+            self.memory_cache = OrderedDict()
+            self.expiry_index = []
+            self.tag_index = {}
+            self.total_bytes = 0
+
+    def size_regulator(self, size):
+        with self.lock:
+            while len(self.memory_cache) > size:
+                self._remove_bytes((self.memory_cache.popitem(last=False)[1],))
+                self.counters["evictions"] += 1
+
+
+def deep_sizeof(value: object) -> int:
+    """
+        Method that returns the size (in bytes) of an object and all the objects it contains.
+    Containers (dict, list, tuple, set, frozenset) and object attributes are visited once.
+
+    :param value: Object to measure.
+    :return: [Int] Size in bytes.
+    """
+    seen = set()
+    pending = [value]
+    size = 0
+    while pending:
+        obj = pending.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isinstance(obj, (str, bytes, bytearray)):
+            continue
+        if isinstance(obj, dict):
+            pending.extend(obj.keys())
+            pending.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            pending.extend(obj)
+        elif hasattr(obj, "__dict__"):
+            pending.append(vars(obj))
+    return size
+
+
+def dataframe_sizeof(value: object) -> int:
+    """
+        Method that returns the size (in bytes) of a pandas DataFrame or Series, including the objects it holds.
+    Any other object is measured with deep_sizeof.
+
+    :param value: Object to measure.
+    :return: [Int] Size in bytes.
+    """
+    memory_usage = getattr(value, "memory_usage", None)
+    if memory_usage is None:
+        return deep_sizeof(value)
+    usage = memory_usage(deep=True)
+    return int(usage.sum() if hasattr(usage, "sum") else usage)
+
+
+def bytes_sizeof(value: object) -> int:
+    """
+        Method that returns the length of a bytes-like or string object.
+    Any other object is measured with sys.getsizeof.
+
+    :param value: Object to measure.
+    :return: [Int] Size in bytes.
+    """
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return memoryview(value).nbytes
+    if isinstance(value, str):
+        return len(value.encode())
+    return sys.getsizeof(value)
+
+
+class MemoryBoundedCacheEngine(LRUCacheEngine):
+    """
+    Subclass of LRU Cache - Cache in Memory bounded by the total size (in bytes) of the values
+
+    The size of each value is measured once, when it is set, with a pluggable sizer (deep_sizeof, dataframe_sizeof,
+    bytes_sizeof or any callable returning bytes). The least recently used pairs {key:value} are evicted until the
+    total size is under the budget. Values bigger than the whole budget are not stored.
+    """
+
+    DEFAULT_MAX_BYTES = 64 * 1024 * 1024  # max bytes in cache
+
+    def __init__(self, max_bytes: int = None, sizer=deep_sizeof):
+        super().__init__()
+        self.max_bytes = int(max_bytes) if max_bytes else self.DEFAULT_MAX_BYTES
+        self.sizer = sizer
+        self.total_bytes = 0
+
+    def _get_bytes(self):
+        return self.total_bytes
+
+    def _store(self, key, value, timeout, tags=None):
+        self.delete(key)
+        value_bytes = self.sizer(value)
+        if value_bytes > self.max_bytes:
+            return
+        self.memory_cache[key] = SizedCacheEntry(timeout, value, value_bytes, tags)
+        self.total_bytes += value_bytes
+        self.index_expiry(self.memory_cache, self.expiry_index, key, timeout)
+        if tags:
+            self.index_tags(self.memory_cache, self.tag_index, key, tags)
+
+    def delete(self, key):
+        with self.lock:
+            entry = self.memory_cache.pop(key, None)
+            if entry is not None:
+                self.total_bytes -= entry.bytes
+
+    def clear(self):
+        with self.lock:
+            super().clear()
+            self.total_bytes = 0
+
+    def size_regulator(self, size):
+        with self.lock:
+            while self.memory_cache and (
+                len(self.memory_cache) > size or self.total_bytes > self.max_bytes
+            ):
+                _, entry = self.memory_cache.popitem(last=False)
+                self.total_bytes -= entry.bytes
+                self.counters["evictions"] += 1
+
+    def sweep_expired(self):
+        with self.lock:
+            reaped = self.reap_expired(self.memory_cache, self.expiry_index)
+            self.total_bytes -= sum(entry.bytes for entry in reaped)
+            self.counters["expirations"] += len(reaped)
+            return len(reaped)
+
+
+class ShardedCacheEngine(LocalCacheEngine):
+    """
+    Subclass of Local Cache - Cache in Memory split into lock-striped shards
+
+    Each key is assigned to a shard by its hash, and every shard is an independent thread-safe engine with its own
+    lock, so threads working on different shards do not contend. The maximum size is split evenly between shards.
+    """
+
+    DEFAULT_SHARDS = 16
+
+    def __init__(self, shards: int = None, shard_class: type = LRUCacheEngine):
+        shards = int(shards) if shards else self.DEFAULT_SHARDS
+        self.shards = [shard_class() for _ in range(shards)]
+
+    def _get_cache(self):
+        return ChainMap(*[shard._get_cache() for shard in self.shards])
+
+    def _get_counters(self):
+        return {
+            counter: sum(shard._get_counters()[counter] for shard in self.shards)
+            for counter in self.COUNTERS
+        }
+
+    def _get_shard(self, key) -> InMemoryCacheEngine:
+        """
+            Method that returns the shard where a key is stored.
+
+        :param key: Key stored in cache.
+        :return: [InMemoryCacheEngine] Shard of the key.
+        """
+        return self.shards[hash(key) % len(self.shards)]
+
+    def _get_shard_size(self, size: int) -> int:
+        """
+            Method that returns the maximum number of objects in each shard.
+
+        :param size: Maximum number of objects in cache.
+        :return: [Int] Maximum number of objects in each shard.
+        """
+        return -(-self.normalize_size(size) // len(self.shards))
+
+    def _group_by_shard(self, keys) -> dict:
+        """
+            Method that groups keys by the shard where they are stored.
+
+        :param keys: Keys stored in cache.
+        :return: [Dict] Keys by shard index.
+        """
+        groups = {}
+        for key in keys:
+            groups.setdefault(hash(key) % len(self.shards), []).append(key)
+        return groups
+
+    def get(self, key):
+        return self._get_shard(key).get(key)
+
+    def get_many(self, keys):
+        result = {}
+        for shard, shard_keys in self._group_by_shard(keys).items():
+            result.update(self.shards[shard].get_many(shard_keys))
+        return result
+
+    def set_many(self, mapping, timeout=None, size=None):
+        shard_size = self._get_shard_size(size)
+        for shard, shard_keys in self._group_by_shard(mapping).items():
+            self.shards[shard].set_many(
+                {key: mapping[key] for key in shard_keys}, timeout, shard_size
+            )
+
+    def delete_many(self, keys):
+        for shard, shard_keys in self._group_by_shard(keys).items():
+            self.shards[shard].delete_many(shard_keys)
+
+    def set(self, key, value, timeout=None, size=None, tags=None):
+        self._get_shard(key).set(
+            key, value, timeout, self._get_shard_size(size), tags=tags
         )
 
+    def exists(self, key):
+        return self._get_shard(key).exists(key)
+
     def delete(self, key):
-        if self.exists(key):
-            del self.memory_cache[key]
+        self._get_shard(key).delete(key)
 
     def clear(self):
-        self.memory_cache = {}
+        for shard in self.shards:
+            shard.clear()
 
     def size_regulator(self, size):
-        if len(self.memory_cache) > size:
-            count = len(self.memory_cache) - size
-            list(map(lambda i: self.memory_cache.popitem(), range(count)))
+        shard_size = self._get_shard_size(size)
+        for shard in self.shards:
+            shard.size_regulator(shard_size)
+
+    def sweep_expired(self):
+        return sum(shard.sweep_expired() for shard in self.shards)
+
+    def invalidate_tag(self, tag):
+        return [key for shard in self.shards for key in shard.invalidate_tag(tag)]
+
+    def stats(self):
+        shards_stats = [shard.stats() for shard in self.shards]
+        return {
+            stat: sum(shard_stats[stat] for shard_stats in shards_stats)
+            for stat in shards_stats[0]
+        }
 
 
 class ThreadCacheEngine(LocalCacheEngine):
@@ -148,63 +806,838 @@ class ThreadCacheEngine(LocalCacheEngine):
             self.clear()
             return threading.current_thread().thread_local_cache
 
+    def _get_thread_local_expiry_index(self) -> list:
+        """
+            Method that returns the expiry index of the cache of the current thread.
+
+        :return: [List] Expiry index of current thread.
+        """
+        try:
+            return threading.current_thread().thread_local_cache_expiry_index
+        except AttributeError:
+            self.clear()
+            return threading.current_thread().thread_local_cache_expiry_index
+
+    def _get_thread_local_tag_index(self) -> dict:
+        """
+            Method that returns the tag index of the cache of the current thread.
+
+        :return: [Dict] Tag index of current thread.
+        """
+        try:
+            return threading.current_thread().thread_local_cache_tag_index
+        except AttributeError:
+            self.clear()
+            return threading.current_thread().thread_local_cache_tag_index
+
+    def _get_cache(self):
+        return self._get_thread_local_cache()
+
+    def _get_counters(self):
+        try:
+            return threading.current_thread().thread_local_cache_counters
+        except AttributeError:
+            threading.current_thread().thread_local_cache_counters = dict.fromkeys(
+                self.COUNTERS, 0
+            )
+            return threading.current_thread().thread_local_cache_counters
+
     def get(self, key):
         result = self._get_thread_local_cache().get(key)
-        return (
-            result["value"]
-            if result and result["timeout"] > time()
-            else self.delete(key)
-        )
+        counters = self._get_counters()
+        if result and result.timeout > time():
+            counters["hits"] += 1
+            return result.value
+        counters["misses"] += 1
+        if result:
+            counters["expirations"] += 1
+        return self.delete(key)
 
-    def set(self, key, value, timeout=None, size=None):
+    def set(self, key, value, timeout=None, size=None, tags=None):
+        timeout = self.normalize_timeout(timeout)
+        tags = self.normalize_tags(tags)
+        self.sweep_expired()
         self.size_regulator(self.normalize_size(size))
-        self._get_thread_local_cache()[key] = {
-            "timeout": self.normalize_timeout(timeout),
-            "value": value,
-        }
+        cache = self._get_thread_local_cache()
+        if tags:
+            cache[key] = TaggedCacheEntry(timeout, value, tags)
+            self.index_tags(cache, self._get_thread_local_tag_index(), key, tags)
+        else:
+            cache[key] = CacheEntry(timeout, value)
+        self.index_expiry(cache, self._get_thread_local_expiry_index(), key, timeout)
+
+    def get_many(self, keys):
+        keys = list(keys)
+        cache = self._get_thread_local_cache()
+        counters = self._get_counters()
+        now = time()
+        result = {}
+        for key in keys:
+            entry = cache.get(key)
+            if entry and entry.timeout > now:
+                result[key] = entry.value
+            elif entry:
+                counters["expirations"] += 1
+                del cache[key]
+        counters["hits"] += len(result)
+        counters["misses"] += len(keys) - len(result)
+        return result
+
+    def set_many(self, mapping, timeout=None, size=None):
+        timeout = self.normalize_timeout(timeout)
+        self.sweep_expired()
+        size = self.normalize_size(size)
+        cache = self._get_thread_local_cache()
+        # Room only for the new keys, then trimmed if the mapping exceeds size
+        new_keys = sum(key not in cache for key in mapping)
+        self.size_regulator(max(size - new_keys, 0))
+        expiry_index = self._get_thread_local_expiry_index()
+        for key, value in mapping.items():
+            cache[key] = CacheEntry(timeout, value)
+            self.index_expiry(cache, expiry_index, key, timeout)
+        self.size_regulator(size)
+
+    def delete_many(self, keys):
+        cache = self._get_thread_local_cache()
+        for key in keys:
+            cache.pop(key, None)
 
     def exists(self, key):
         return (
             True
             if key in self._get_thread_local_cache()
-            and self._get_thread_local_cache()[key]["timeout"] > time()
+            and self._get_thread_local_cache()[key].timeout > time()
             else False
         )
 
     def delete(self, key):
-        if self.exists(key):
-            del self._get_thread_local_cache()[key]
+        self._get_thread_local_cache().pop(key, None)
 
     def clear(self):
         threading.current_thread().thread_local_cache = {}
+        threading.current_thread().thread_local_cache_expiry_index = []
+        threading.current_thread().thread_local_cache_tag_index = {}
 
     def size_regulator(self, size):
         if len(self._get_thread_local_cache()) > size:
             count = len(self._get_thread_local_cache()) - size
             list(map(lambda i: self._get_thread_local_cache().popitem(), range(count)))
+            self._get_counters()["evictions"] += count
+
+    def sweep_expired(self):
+        reaped = len(
+            self.reap_expired(
+                self._get_thread_local_cache(), self._get_thread_local_expiry_index()
+            )
+        )
+        self._get_counters()["expirations"] += reaped
+        return reaped
+
+    def invalidate_tag(self, tag):
+        cache = self._get_thread_local_cache()
+        keys = self.pop_tag(cache, self._get_thread_local_tag_index(), tag)
+        for key in keys:
+            del cache[key]
+        return keys
+
+
+class TieredCacheEngine(LocalCacheEngine):
+    """
+    Subclass of Local Cache - Cache in two tiers: a small cache per thread (L1) in front of a shared cache (L2)
+
+    Reads are served from the L1 of the current thread without locks and, on miss, from the shared L2, promoting
+    the pair {key:value} to L1. Writes and deletes go through to L2 and are recorded in an invalidation log, so
+    every thread drops its stale L1 copies on its next access. L1 copies live at most l1_timeout seconds, which
+    bounds how long a pair expired in L2 can still be served from L1.
+    """
+
+    DEFAULT_L1_SIZE = 32  # max elements in the cache of each thread
+    DEFAULT_L1_TIMEOUT = 1.0  # seconds
+    INVALIDATION_LOG_SIZE = 1024  # writes remembered to invalidate L1 copies by key
+
+    def __init__(
+        self,
+        l2: LocalCacheEngine = None,
+        l1_size: int = None,
+        l1_timeout: float = None,
+    ):
+        self.l2 = l2 if l2 is not None else LRUCacheEngine()
+        self.l1_size = int(l1_size) if l1_size else self.DEFAULT_L1_SIZE
+        self.l1_timeout = float(l1_timeout) if l1_timeout else self.DEFAULT_L1_TIMEOUT
+        self.generation = 0
+        self.invalidations = deque(maxlen=self.INVALIDATION_LOG_SIZE)
+        self.lock = threading.Lock()
+        self._local = threading.local()
+        self._threads_counters = []
+
+    def _get_l1(self) -> OrderedDict:
+        """
+            Method that returns the L1 cache of the current thread, dropping the pairs {key:value} written by
+        other threads since its last access.
+
+        :return: [OrderedDict] L1 cache of current thread.
+        """
+        local = self._local
+        if not hasattr(local, "cache"):
+            with self.lock:
+                local.cache = OrderedDict()
+                local.generation = self.generation
+                local.counters = dict.fromkeys(("l1_hits", "l2_hits", "misses"), 0)
+                self._threads_counters.append(local.counters)
+        elif local.generation != self.generation:
+            with self.lock:
+                self._sync_l1(local)
+        return local.cache
+
+    def _sync_l1(self, local: threading.local) -> None:
+        """
+            Method that drops from the L1 cache of a thread the keys written since its last synchronization.
+        The lock must be held by the caller.
+
+        :param local: Thread local data of the thread.
+        """
+        pending = self.generation - local.generation
+        if pending > len(self.invalidations):
+            local.cache.clear()
+        else:
+            for key in islice(reversed(self.invalidations), pending):
+                local.cache.pop(key, None)
+        local.generation = self.generation
+
+    def _invalidate(self, key) -> None:
+        """
+            Method that records a write of a key, so the other threads drop their L1 copies.
+
+        :param key: Key written.
+        """
+        self.invalidations.append(key)
+        self.generation += 1
+
+    def _set_l1(self, l1: OrderedDict, key, value, timeout: float) -> None:
+        """
+            Method that stores a copy of a pair {key:value} in the L1 cache of the current thread.
+
+        :param l1: L1 cache of current thread.
+        :param key: Key to store.
+        :param value: Value to store.
+        :param timeout: Normalized timeout of the pair in L2.
+        """
+        l1[key] = CacheEntry(min(timeout, time() + self.l1_timeout), value)
+        l1.move_to_end(key)
+        while len(l1) > self.l1_size:
+            l1.popitem(last=False)
+
+    def _get_cache(self):
+        return self.l2._get_cache()
+
+    def _get_counters(self):
+        return self.l2._get_counters()
+
+    def get(self, key):
+        l1 = self._get_l1()
+        counters = self._local.counters
+        result = l1.get(key)
+        if result and result.timeout > time():
+            counters["l1_hits"] += 1
+            l1.move_to_end(key)
+            return result.value
+        if result:
+            del l1[key]
+        value = self.l2.get(key)
+        if value is None and not self.l2.exists(key):
+            counters["misses"] += 1
+            return None
+        counters["l2_hits"] += 1
+        self._set_l1(l1, key, value, self.normalize_timeout(self.l1_timeout))
+        return value
+
+    def set(self, key, value, timeout=None, size=None, tags=None):
+        l1 = self._get_l1()
+        with self.lock:
+            self._sync_l1(self._local)
+            self.l2.set(key, value, timeout, size, tags=tags)
+            self._invalidate(key)
+            self._local.generation = self.generation
+            self._set_l1(l1, key, value, self.normalize_timeout(timeout))
+
+    def exists(self, key):
+        result = self._get_l1().get(key)
+        if result and result.timeout > time():
+            return True
+        return self.l2.exists(key)
+
+    def delete(self, key):
+        with self.lock:
+            self.l2.delete(key)
+            self._invalidate(key)
+
+    def clear(self):
+        with self.lock:
+            self.l2.clear()
+            self.invalidations.clear()
+            self.generation += self.INVALIDATION_LOG_SIZE + 1
+
+    def size_regulator(self, size):
+        self.l2.size_regulator(size)
+
+    def sweep_expired(self):
+        return self.l2.sweep_expired()
+
+    def invalidate_tag(self, tag):
+        with self.lock:
+            keys = self.l2.invalidate_tag(tag)
+            for key in keys:
+                self._invalidate(key)
+            return keys
+
+    def stats(self):
+        """
+            Method that returns a snapshot of the cache statistics, including the hit rates of each tier.
+
+            l1_hits -> Number of get calls served from the L1 cache of a thread.
+            l2_hits -> Number of get calls served from the shared L2 cache.
+            l1_hit_ratio -> Ratio of get calls served from L1.
+            l2_hit_ratio -> Ratio of the get calls that missed L1 served from L2.
+
+        :return: [Dict] Cache statistics.
+        """
+        with self.lock:
+            threads_counters = [dict(counters) for counters in self._threads_counters]
+        l1_hits = sum(counters["l1_hits"] for counters in threads_counters)
+        l2_hits = sum(counters["l2_hits"] for counters in threads_counters)
+        misses = sum(counters["misses"] for counters in threads_counters)
+        return {
+            **self.l2.stats(),
+            "hits": l1_hits + l2_hits,
+            "misses": misses,
+            "l1_hits": l1_hits,
+            "l2_hits": l2_hits,
+            "l1_hit_ratio": l1_hits / max(l1_hits + l2_hits + misses, 1),
+            "l2_hit_ratio": l2_hits / max(l2_hits + misses, 1),
+        }
+
+
+class CachePeriodicTask(threading.Thread):
+    """
+    Background thread that periodically runs a task over a shared cache engine.
+
+    The engine must be thread-safe (e.g. InMemoryCacheEngine), so periodic tasks are not suitable for
+    ThreadCacheEngine, whose cache belongs to a single thread.
+    """
+
+    DEFAULT_INTERVAL = 60.0  # seconds
+
+    def __init__(self, engine: BaseCacheEngine, interval: float = None):
+        super().__init__(
+            name=f"{type(engine).__name__}{type(self).__name__}", daemon=True
+        )
+        self.engine = engine
+        self.interval = float(interval) if interval else self.DEFAULT_INTERVAL
+        self._stop_event = threading.Event()
+
+    def task(self) -> None:
+        """
+        Method that runs the periodic task over the engine.
+        """
+        raise NotImplementedError
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            self.task()
+
+    def stop(self) -> None:
+        """
+        Method that stops the periodic task and waits for it to finish.
+        """
+        self._stop_event.set()
+        if self.is_alive():
+            self.join()
+
+
+class CacheSweeper(CachePeriodicTask):
+    """Periodic task that removes the expired pairs {key:value} of a shared cache engine"""
+
+    def task(self):
+        self.engine.sweep_expired()
+
+
+class CacheStatsReporter(CachePeriodicTask):
+    """Periodic task that logs the statistics of a shared cache engine"""
+
+    def __init__(
+        self,
+        engine: BaseCacheEngine,
+        interval: float = None,
+        logger_name: str = LoggingHandlerCore.LOGGER_BASIC_NAME,
+    ):
+        super().__init__(engine, interval)
+        self.logger = LoggingHandlerCore().get_logger(logger_name=logger_name)
+
+    def task(self):
+        self.logger.info(
+            f"Cache stats - {type(self.engine).__name__}: {self.engine.stats()}"
+        )
+
+
+class CacheRegistry:
+    """Process-wide registry of named cache engines"""
+
+    DEFAULT_NAME = "default"
+
+    _engines = dict()
+    _lock = threading.Lock()
+    # Namespaces of the cache keys by function, kept while the functions exist
+    _namespaces = weakref.WeakKeyDictionary()
+    _namespace_counts = dict()
+
+    @classmethod
+    def get_engine(
+        cls, name: str = DEFAULT_NAME, engine_class: type = LRUCacheEngine
+    ) -> BaseCacheEngine:
+        """
+            Method that returns the shared cache engine registered with a name.
+        If there is no engine with this name, it is created with the given class and registered.
+
+        :param name: Name of the shared cache engine.
+        :param engine_class: Class of the cache engine to create if it does not exist.
+        :return: [BaseCacheEngine] Shared cache engine.
+        """
+        engine = cls._engines.get(name)
+        if engine is None:
+            with cls._lock:
+                engine = cls._engines.get(name)
+                if engine is None:
+                    engine = engine_class()
+                    cls._engines[name] = engine
+        return engine
+
+    @classmethod
+    def register_engine(cls, name: str, engine: BaseCacheEngine) -> None:
+        """
+            Method that registers a cache engine with a name, replacing any engine with the same name.
+
+        :param name: Name of the shared cache engine.
+        :param engine: Cache engine to share.
+        """
+        with cls._lock:
+            cls._engines[name] = engine
+
+    @classmethod
+    def remove_engine(cls, name: str) -> None:
+        """
+            Method that removes the shared cache engine registered with a name.
+
+        :param name: Name of the shared cache engine.
+        """
+        with cls._lock:
+            cls._engines.pop(name, None)
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+        Method that removes all shared cache engines.
+        """
+        with cls._lock:
+            cls._engines = dict()
+
+    @classmethod
+    def get_namespace(cls, function) -> str:
+        """
+            Method that returns the namespace of the cache keys of a function: its qualified name, followed by a
+        number if other functions with the same qualified name were created before in the process (closures of a
+        factory, redefined functions or methods of classes created at runtime), so they never share entries. The
+        first function with a qualified name keeps it as it is, so its keys are the same in every process.
+
+        :param function: Function called.
+        :return: [Str] Namespace of the cache keys.
+        """
+        name = f"{function.__module__}.{function.__qualname__}"
+        try:
+            namespace = cls._namespaces.get(function)
+        except TypeError:
+            # Functions without weak references, e.g. builtins, are unique by name
+            return name
+        if namespace is None:
+            with cls._lock:
+                namespace = cls._namespaces.get(function)
+                if namespace is None:
+                    number = cls._namespace_counts.get(name, 0)
+                    cls._namespace_counts[name] = number + 1
+                    namespace = f"{name}#{number}" if number else name
+                    cls._namespaces[function] = namespace
+        return namespace
+
+
+def make_cache_key(function, args: tuple, kwargs: dict, typed: bool = False) -> tuple:
+    """
+        Method that returns a cache key derived from a function and the arguments of one of its calls.
+    The key is made up of the namespace of the function (see CacheRegistry.get_namespace) and the positional and
+    keyword arguments, so calls with different arguments are stored in different entries.
+
+        typed -> True: Arguments of different types are cached separately (e.g. 3 and 3.0).
+
+    :param function: Function called.
+    :param args: Positional arguments of the call.
+    :param kwargs: Keyword arguments of the call.
+    :param typed: Cache separately the arguments of different types.
+    :return: [Tuple] Cache key.
+    :raises TypeError: If any argument is unhashable.
+    """
+    key = (
+        CacheRegistry.get_namespace(function),
+        tuple(args),
+        tuple(sorted(kwargs.items())),
+    )
+    if typed:
+        key += (
+            tuple(type(value) for value in args),
+            tuple(type(value) for _, value in key[2]),
+        )
+    hash(key)
+    return key
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key into a single in-flight computation
+
+    The first caller of a key runs the function, and the callers that arrive while it is running wait for it and
+    receive its result, or its exception.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls = dict()
+
+    def do(self, key, function, *args, **kwargs):
+        """
+            Method that returns the result of a function, sharing it with the concurrent calls with the same key.
+
+        :param key: Key of the call.
+        :param function: Function to call.
+        :return: [Object] Result of the function.
+        :raises Exception: The exception raised by the function.
+        """
+        with self.lock:
+            call = self.calls.get(key)
+            leader = call is None
+            if leader:
+                call = {"event": threading.Event(), "value": None, "error": None}
+                self.calls[key] = call
+        if not leader:
+            call["event"].wait()
+            if call["error"] is not None:
+                raise call["error"]
+            return call["value"]
+        try:
+            call["value"] = function(*args, **kwargs)
+            return call["value"]
+        except BaseException as e:
+            call["error"] = e
+            raise e
+        finally:
+            with self.lock:
+                del self.calls[key]
+            call["event"].set()
+
+
+_NO_CACHE_KEY = object()
+_NO_VALUE = object()
+
+
+def _get_cache_key(key, key_function, typed, function, args, kwargs):
+    """
+        Method that returns the cache key of a call of a decorated function.
+    A fixed key has priority over the key function, and the key function over the derived key. If the key can not
+    be hashed, it returns a marker to call the function without caching.
+
+    :return: [Object] Cache key.
+    """
+    if key is not None:
+        return key
+    try:
+        if key_function is not None:
+            cache_key = key_function(*args, **kwargs)
+            hash(cache_key)
+            return cache_key
+        return make_cache_key(function, args, kwargs, typed)
+    except TypeError:
+        return _NO_CACHE_KEY
+
+
+def _get_cached_value(engine: BaseCacheEngine, cache_key):
+    """
+        Method that returns the value of a key, or a marker if the key is not stored. Unlike get, it tells apart a
+    stored None from a missing key.
+
+    :return: [Object] Value of key.
+    """
+    value = engine.get(cache_key)
+    if value is not None or engine.exists(cache_key):
+        return value
+    return _NO_VALUE
+
+
+def _set_cached_value(engine: BaseCacheEngine, cache_key, value, timeout, size, tags):
+    """
+        Method that stores the value of a call of a decorated function, with its tags if it has any, so engines
+    without tags support can be used by the decorators without tags.
+    """
+    if tags:
+        engine.set(cache_key, value, timeout, size, tags=tags)
+    else:
+        engine.set(cache_key, value, timeout, size)
+
+
+def _cached_call(
+    engine,
+    cache_key,
+    flight,
+    function,
+    args,
+    kwargs,
+    timeout,
+    size,
+    refresh=None,
+    tags=None,
+):
+    """
+        Method that returns the cached value of a call of a decorated function, calling the function on miss.
+    With single flight, the concurrent misses of the same key wait for one call of the function. With refresh
+    ahead, the values past their soft timeout are returned while they are recomputed in background.
+
+    :return: [Object] Result of the function.
+    """
+
+    def load():
+        record = _get_cached_value(engine, cache_key)
+        if refresh is None or record is _NO_VALUE:
+            return record
+        refresh.check(
+            engine, cache_key, record, function, args, kwargs, timeout, size, tags
+        )
+        return record["value"]
+
+    def store(result):
+        record = result if refresh is None else refresh.wrap(result)
+        _set_cached_value(engine, cache_key, record, timeout, size, tags)
+
+    def compute():
+        result = load()
+        if result is _NO_VALUE:
+            result = function(*args, **kwargs)
+            store(result)
+        return result
+
+    value = load()
+    if value is not _NO_VALUE:
+        return value
+    if flight is None:
+        value = function(*args, **kwargs)
+        store(value)
+        return value
+    value = flight.do(cache_key, compute)
+    if not engine.exists(cache_key):
+        store(value)
+    return value
+
+
+class RefreshAhead:
+    """
+    Recomputes in background the cached values past their soft timeout (stale-while-revalidate)
+
+    The values are stored with the time from which they must be refreshed. Until the hard timeout of the cache
+    engine, a stale value is still returned while a worker thread recomputes it, once per key at a time.
+    """
+
+    MAX_WORKERS = 4
+
+    _executor = None
+    _executor_lock = threading.Lock()
+
+    def __init__(self, refresh_after: float):
+        self.refresh_after = float(refresh_after)
+        self.lock = threading.Lock()
+        self.refreshing = set()
+        self.logger = LoggingHandlerCore().get_logger()
+
+    @classmethod
+    def get_executor(cls) -> ThreadPoolExecutor:
+        """
+            Method that returns the pool of worker threads shared by all refreshes.
+
+        :return: [ThreadPoolExecutor] Pool of worker threads.
+        """
+        if cls._executor is None:
+            with cls._executor_lock:
+                if cls._executor is None:
+                    cls._executor = ThreadPoolExecutor(
+                        max_workers=cls.MAX_WORKERS,
+                        thread_name_prefix="jimena-cache-refresh",
+                    )
+        return cls._executor
+
+    def wrap(self, value) -> dict:
+        """
+            Method that returns the record stored in cache for a value.
+
+        :param value: Value to store.
+        :return: [Dict] Record with the value and the time from which it must be refreshed.
+        """
+        return {"value": value, "refresh_at": time() + self.refresh_after}
+
+    def check(
+        self,
+        engine,
+        cache_key,
+        record,
+        function,
+        args,
+        kwargs,
+        timeout,
+        size,
+        tags=None,
+    ):
+        """
+        Method that schedules the refresh of a record past its soft timeout, unless it is already scheduled.
+        """
+        if record["refresh_at"] > time():
+            return
+        with self.lock:
+            if cache_key in self.refreshing:
+                return
+            self.refreshing.add(cache_key)
+        self.get_executor().submit(
+            self._refresh,
+            engine,
+            cache_key,
+            function,
+            args,
+            kwargs,
+            timeout,
+            size,
+            tags,
+        )
+
+    def _refresh(
+        self, engine, cache_key, function, args, kwargs, timeout, size, tags=None
+    ):
+        """
+            Method that recomputes a value and stores it in cache. If the function fails, the stale value is kept
+        until its hard timeout.
+        """
+        try:
+            _set_cached_value(
+                engine,
+                cache_key,
+                self.wrap(function(*args, **kwargs)),
+                timeout,
+                size,
+                tags,
+            )
+        except Exception as e:
+            self.logger.warning(
+                f"Refresh error of {function.__qualname__} - msg: {e} type: {type(e)}"
+            )
+        finally:
+            with self.lock:
+                self.refreshing.discard(cache_key)
 
 
 # Decorators
-def thread_local_cache(key, timeout=None, size=None):
+def thread_local_cache(
+    key=None,
+    timeout=None,
+    size=None,
+    key_function=None,
+    typed=False,
+    single_flight=False,
+    tags=None,
+):
     def thread_local_cache_decorator(function):
+        if inspect.iscoroutinefunction(function):
+            raise TypeError(
+                f"{function.__qualname__} is a coroutine function, "
+                f"use async_local_cache instead"
+            )
+        flight = SingleFlight() if single_flight else None
+
+        @wraps(function)
         def thread_local_cache_decorator_function(*args, **kwargs):
-            value = function(*args, **kwargs)
-            ThreadCacheEngine().set(key, value, timeout, size)
-            return value
+            cache_key = _get_cache_key(key, key_function, typed, function, args, kwargs)
+            if cache_key is _NO_CACHE_KEY:
+                return function(*args, **kwargs)
+            return _cached_call(
+                ThreadCacheEngine(),
+                cache_key,
+                flight,
+                function,
+                args,
+                kwargs,
+                timeout,
+                size,
+                tags=tags,
+            )
 
         return thread_local_cache_decorator_function
 
     return thread_local_cache_decorator
 
 
-# To enable the functionality of the InMemoryCacheEngine class, it must act as a Singleton
-def in_memory_local_cache(key, timeout=None, size=None):
+def in_memory_local_cache(
+    key=None,
+    timeout=None,
+    size=None,
+    name=None,
+    key_function=None,
+    typed=False,
+    single_flight=False,
+    refresh_after=None,
+    tags=None,
+):
+    # The size of each set trims the whole engine, so it is only set for the engines of a single function
+    if name is not None and size is not None:
+        raise ValueError(
+            f"size can not be set for the shared cache engine {name}, "
+            f"it is bounded by the size of the engine"
+        )
+    hard_timeout = float(timeout) if timeout else BaseCacheEngine.DEFAULT_TIMEOUT
+    if refresh_after is not None and not 0 < float(refresh_after) < hard_timeout:
+        raise ValueError(
+            f"refresh_after ({refresh_after}) must be between 0 and the timeout "
+            f"({hard_timeout})"
+        )
+
     def in_memory_local_cache_decorator(function):
+        if inspect.iscoroutinefunction(function):
+            raise TypeError(
+                f"{function.__qualname__} is a coroutine function, "
+                f"use async_local_cache instead"
+            )
+        flight = SingleFlight() if single_flight else None
+        refresh = RefreshAhead(refresh_after) if refresh_after is not None else None
+        # Without a name, the function has its own engine instead of a shared one
+        engine = LRUCacheEngine() if name is None else None
+
+        @wraps(function)
         def in_memory_local_cache_decorator_function(*args, **kwargs):
-            value = function(*args, **kwargs)
-            InMemoryCacheEngine().set(key, value, timeout, size)
-            return value
+            cache_key = _get_cache_key(key, key_function, typed, function, args, kwargs)
+            if cache_key is _NO_CACHE_KEY:
+                return function(*args, **kwargs)
+            return _cached_call(
+                engine if engine is not None else CacheRegistry.get_engine(name),
+                cache_key,
+                flight,
+                function,
+                args,
+                kwargs,
+                timeout,
+                size,
+                refresh,
+                tags,
+            )
 
+        in_memory_local_cache_decorator_function.cache_engine = engine
         return in_memory_local_cache_decorator_function
 
     return in_memory_local_cache_decorator
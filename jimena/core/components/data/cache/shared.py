@@ -0,0 +1,335 @@
+""" This module contains implementations of caching shared between processes of the same host """
+
+import fcntl
+import os
+import pickle
+import struct
+import tempfile
+import threading
+import zlib
+from multiprocessing import resource_tracker, shared_memory
+from time import time
+
+from jimena.core.components.data.cache.local import BaseCacheEngine
+
+
+class ProcessLock:
+    """
+    Lock shared by the threads of a process and by every process of the host that uses the same path
+
+    It holds a thread lock and an exclusive flock on the file (POSIX only). The file is reopened after a fork,
+    since flock locks are shared by the forked processes through the inherited file.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.lock = threading.RLock()
+        self._file = None
+        self._file_pid = None
+
+    def __enter__(self):
+        self.lock.acquire()
+        try:
+            if self._file_pid != os.getpid():
+                self._file = open(self.path, "a")
+                self._file_pid = os.getpid()
+            fcntl.flock(self._file, fcntl.LOCK_EX)
+        except BaseException:
+            self.lock.release()
+            raise
+        return self
+
+    def __exit__(self, *exc_info):
+        fcntl.flock(self._file, fcntl.LOCK_UN)
+        self.lock.release()
+
+    def close(self) -> None:
+        """
+        Method that closes the lock file of the current process.
+        """
+        with self.lock:
+            if self._file is not None and self._file_pid == os.getpid():
+                self._file.close()
+            self._file = None
+            self._file_pid = None
+
+
+class SharedMemoryCacheEngine(BaseCacheEngine):
+    """
+    Subclass of Base Cache - Cache in a shared memory block of the host
+
+    The pairs {key:value} are stored in a fixed-size hash table inside a multiprocessing.shared_memory block, so
+    every process that opens the engine with the same name (multiprocessing workers or unrelated processes) shares
+    one cache. The table is split in buckets of WAYS slots, a key can only live in the slots of its bucket and,
+    when they are all in use, the oldest stored pair of the bucket is evicted. Values are serialized with pickle
+    and the pairs bigger than a slot are not stored.
+
+    The capacity is fixed when the block is created, so the size argument of set is ignored. Access is serialized
+    with a ProcessLock on a file next to the block. The block outlives the processes using it until unlink is
+    called.
+    """
+
+    DEFAULT_NAME = "jimena-core-cache"
+    DEFAULT_SLOT_SIZE = 4096  # bytes of key and value by slot
+    WAYS = 8  # slots by bucket
+    MAGIC = b"JIMENA01"
+    HEADER = struct.Struct("<8sQQ4Q")  # magic, slots, slot size, counters
+    HEADER_SIZE = 64
+    METADATA = struct.Struct("<ddII")  # timeout, stored, key size, value size
+    EMPTY = 0  # hash of the empty slots
+
+    def __init__(self, name: str = None, size: int = None, slot_size: int = None):
+        self.name = name if name else self.DEFAULT_NAME
+        self.size = self.normalize_size(size)
+        self.slot_size = slot_size if slot_size else self.DEFAULT_SLOT_SIZE
+        self.slots = -(-self.size // self.WAYS) * self.WAYS
+        self.buckets = self.slots // self.WAYS
+        self.metadata_offset = self.HEADER_SIZE + 8 * self.slots
+        self.data_offset = self.metadata_offset + self.METADATA.size * self.slots
+        self.lock = ProcessLock(
+            os.path.join(tempfile.gettempdir(), f"{self.name}.lock")
+        )
+        with self.lock:
+            self.memory = self._open_memory()
+        self.buffer = self.memory.buf
+        # Typed views over the block: counters of the header and hash of each slot
+        self.counters = self.buffer[24:56].cast("Q")
+        self.hashes = self.buffer[self.HEADER_SIZE : self.metadata_offset].cast("Q")
+
+    def __reduce__(self):
+        return self.__class__, (self.name, self.size, self.slot_size)
+
+    def _open_memory(self) -> shared_memory.SharedMemory:
+        """
+            Method that creates the shared memory block or, if another process created it, attaches to it and
+        checks that it has the same layout. The lock must be held by the caller.
+
+        :return: [SharedMemory] Shared memory block.
+        :raises ValueError: The block exists with another layout.
+        """
+        total_size = self.data_offset + self.slot_size * self.slots
+        try:
+            memory = shared_memory.SharedMemory(self.name, create=True, size=total_size)
+            self.HEADER.pack_into(
+                memory.buf, 0, self.MAGIC, self.slots, self.slot_size, 0, 0, 0, 0
+            )
+        except FileExistsError:
+            memory = shared_memory.SharedMemory(self.name)
+        # The block is removed by unlink, not when the process that opened it exits
+        resource_tracker.unregister(memory._name, "shared_memory")
+        magic, slots, slot_size = self.HEADER.unpack_from(memory.buf, 0)[:3]
+        if (magic, slots, slot_size) != (self.MAGIC, self.slots, self.slot_size):
+            memory.close()
+            raise ValueError(
+                f"Shared memory block {self.name} exists with another layout - "
+                f"slots: {slots} slot size: {slot_size}"
+            )
+        return memory
+
+    @staticmethod
+    def normalize_key(key) -> bytes:
+        """
+            Method that returns the key as it is stored in the shared memory block, encoded.
+
+        :param key: Key stored in cache.
+        :return: [Bytes] Normalized key.
+        """
+        return BaseCacheEngine.normalize_key(key).encode("utf-8")
+
+    def hash_key(self, key: bytes) -> int:
+        """
+            Method that returns a hash of the normalized key that is stable between processes and never EMPTY.
+
+        :param key: Normalized key.
+        :return: [Int] Hash of key.
+        """
+        key_hash = zlib.crc32(key)
+        return key_hash if key_hash != self.EMPTY else 1
+
+    def _count(self, counter: str, amount: int = 1) -> None:
+        """
+            Method that increases a counter stored in the shared memory block. The lock must be held by the caller.
+
+        :param counter: Counter name, one of COUNTERS.
+        :param amount: Amount to increase.
+        """
+        self.counters[self.COUNTERS.index(counter)] += amount
+
+    def _get_metadata(self, slot: int) -> tuple:
+        """
+            Method that returns the metadata of a slot: timeout, stored time, key size and value size.
+
+        :param slot: Slot index.
+        :return: [Tuple] Metadata of slot.
+        """
+        return self.METADATA.unpack_from(
+            self.buffer, self.metadata_offset + slot * self.METADATA.size
+        )
+
+    def _find(self, key: bytes, key_hash: int):
+        """
+            Method that returns the slot of a key in its bucket and its metadata, or None if it is not stored.
+        The lock must be held by the caller.
+
+        :param key: Normalized key.
+        :param key_hash: Hash of key.
+        :return: [Tuple] Slot index and metadata.
+        """
+        first_slot = (key_hash % self.buckets) * self.WAYS
+        bucket = self.hashes[first_slot : first_slot + self.WAYS].tolist()
+        for way, slot_hash in enumerate(bucket):
+            if slot_hash != key_hash:
+                continue
+            slot = first_slot + way
+            metadata = self._get_metadata(slot)
+            data = self.data_offset + slot * self.slot_size
+            if metadata[2] == len(key) and self.buffer[data : data + len(key)] == key:
+                return slot, metadata
+        return None
+
+    def _get_free_slot(self, key_hash: int) -> int:
+        """
+            Method that returns a slot of the bucket of a key to store it: an empty slot, an expired slot or, when
+        the bucket is full, the oldest stored slot, which is evicted. The lock must be held by the caller.
+
+        :param key_hash: Hash of key.
+        :return: [Int] Slot index.
+        """
+        now = time()
+        first_slot = (key_hash % self.buckets) * self.WAYS
+        oldest_slot, oldest_stored = None, None
+        for slot in range(first_slot, first_slot + self.WAYS):
+            if self.hashes[slot] == self.EMPTY:
+                return slot
+            timeout, stored = self._get_metadata(slot)[:2]
+            if timeout <= now:
+                self._count("expirations")
+                return slot
+            if oldest_stored is None or stored < oldest_stored:
+                oldest_slot, oldest_stored = slot, stored
+        self._count("evictions")
+        return oldest_slot
+
+    def get(self, key):
+        key = self.normalize_key(key)
+        key_hash = self.hash_key(key)
+        with self.lock:
+            found = self._find(key, key_hash)
+            if found and found[1][0] > time():
+                self._count("hits")
+                data = self.data_offset + found[0] * self.slot_size + len(key)
+                value = self.buffer[data : data + found[1][3]].tobytes()
+            else:
+                self._count("misses")
+                if found:
+                    self._count("expirations")
+                    self.hashes[found[0]] = self.EMPTY
+                return None
+        return pickle.loads(value)
+
+    def set(self, key, value, timeout=None, size=None):
+        key = self.normalize_key(key)
+        value = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        key_hash = self.hash_key(key)
+        if len(key) + len(value) > self.slot_size:
+            # Not stored, so the previous value of the key must not be served
+            with self.lock:
+                found = self._find(key, key_hash)
+                if found:
+                    self.hashes[found[0]] = self.EMPTY
+            return
+        timeout = self.normalize_timeout(timeout)
+        with self.lock:
+            found = self._find(key, key_hash)
+            slot = found[0] if found else self._get_free_slot(key_hash)
+            data = self.data_offset + slot * self.slot_size
+            self.buffer[data : data + len(key)] = key
+            self.buffer[data + len(key) : data + len(key) + len(value)] = value
+            self.METADATA.pack_into(
+                self.buffer,
+                self.metadata_offset + slot * self.METADATA.size,
+                timeout,
+                time(),
+                len(key),
+                len(value),
+            )
+            self.hashes[slot] = key_hash
+
+    def exists(self, key):
+        key = self.normalize_key(key)
+        key_hash = self.hash_key(key)
+        with self.lock:
+            found = self._find(key, key_hash)
+            return True if found and found[1][0] > time() else False
+
+    def delete(self, key):
+        key = self.normalize_key(key)
+        key_hash = self.hash_key(key)
+        with self.lock:
+            found = self._find(key, key_hash)
+            if found:
+                self.hashes[found[0]] = self.EMPTY
+
+    def clear(self):
+        with self.lock:
+            self.buffer[self.HEADER_SIZE : self.metadata_offset] = bytes(
+                self.metadata_offset - self.HEADER_SIZE
+            )
+
+    def _get_used_slots(self) -> list:
+        """
+            Method that returns the slots in use and their metadata. The lock must be held by the caller.
+
+        :return: [List] Pairs of slot index and metadata.
+        """
+        return [
+            (slot, self._get_metadata(slot))
+            for slot, slot_hash in enumerate(self.hashes.tolist())
+            if slot_hash != self.EMPTY
+        ]
+
+    def sweep_expired(self) -> int:
+        """
+            Method that removes all the expired pairs {key:value} of the cache.
+
+        :return: [Int] Number of pairs removed.
+        """
+        with self.lock:
+            now = time()
+            expired = [
+                slot for slot, metadata in self._get_used_slots() if metadata[0] <= now
+            ]
+            for slot in expired:
+                self.hashes[slot] = self.EMPTY
+            self._count("expirations", len(expired))
+        return len(expired)
+
+    def stats(self):
+        with self.lock:
+            counters = self.counters.tolist()
+            used = self._get_used_slots()
+        return {
+            **dict(zip(self.COUNTERS, counters)),
+            "entries": len(used),
+            "bytes": sum(metadata[3] for _, metadata in used),
+        }
+
+    def close(self) -> None:
+        """
+        Method that detaches this process from the shared memory block.
+        """
+        with self.lock.lock:
+            self.counters.release()
+            self.hashes.release()
+            self.buffer = None
+            self.memory.close()
+        self.lock.close()
+
+    def unlink(self) -> None:
+        """
+        Method that removes the shared memory block, once every process has closed it.
+        """
+        resource_tracker.register(self.memory._name, "shared_memory")
+        self.memory.unlink()
+        if os.path.exists(self.lock.path):
+            os.remove(self.lock.path)
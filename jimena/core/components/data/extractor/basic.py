@@ -1,16 +1,226 @@
-import pandas as pd
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 
 from jimena.core.components.data.extractor.core import DataExtractorCore
 from jimena.core.components.tools.generic import ImportTools
 
 
 class DataExtractorPandas(DataExtractorCore, ImportTools):
+    """
+    Extractor of DataFrames with pandas
 
-    def __init__(self):
-        super().__init__()
-        if self.module_exists(module_name=pd.__name__):
-            self.csv = pd.read_csv
-            self.json = pd.read_json
+    pandas is imported on the first extraction instead of when this module is imported, so importing the
+    extractors does not pay its import time.
 
+    csv_chunks and json_chunks read big files as DataFrames of a bounded number of rows or memory, so the peak memory
+    does not depend on the size of the file. The next chunk is not read until the consumer asks for it, and an
+    optional transform is applied to a bounded number of chunks in parallel.
+    """
 
-DataExtractorPandas().csv("csv_file.csv")
+    PANDAS = "pandas"
+    CHUNK_ROWS = 100000  # rows by chunk by default
+    SAMPLE_ROWS = 1000  # rows of the first chunk when chunks are sized by memory
+    IN_FLIGHT_CHUNKS = 2  # chunks being transformed at once by default
+
+    def __init__(self, threaded_decompression: bool = False):
+        super().__init__(threaded_decompression=threaded_decompression)
+        self._pandas = None
+
+    def get_pandas(self):
+        """
+        Returns the pandas module, importing it on the first call.
+        :return: The pandas module.
+        :rtype: module
+        :raises ModuleNotFoundError: If pandas is not installed.
+        """
+        if self._pandas is None:
+            if not self.module_exists(module_name=self.PANDAS):
+                raise ModuleNotFoundError(
+                    f"No module named '{self.PANDAS}'", name=self.PANDAS
+                )
+            import pandas
+
+            self._pandas = pandas
+        return self._pandas
+
+    def csv(self, *args, **kwargs):
+        """
+        Extracts a DataFrame from a CSV file with pandas.read_csv, which receives all the arguments.
+        :return: The DataFrame extracted from the file.
+        :rtype: pandas.DataFrame
+        """
+        return self.get_pandas().read_csv(*args, **kwargs)
+
+    def json(self, *args, **kwargs):
+        """
+        Extracts a DataFrame from a JSON file with pandas.read_json, which receives all the arguments.
+        :return: The DataFrame extracted from the file.
+        :rtype: pandas.DataFrame
+        """
+        return self.get_pandas().read_json(*args, **kwargs)
+
+    def csv_chunks(
+        self,
+        path: str,
+        chunk_size: int = None,
+        memory_chunk: float = None,
+        usecols: list = None,
+        dtype=None,
+        transform=None,
+        max_in_flight: int = None,
+        **kwargs,
+    ):
+        """
+        Extracts the DataFrames of the chunks of a CSV file with pandas.read_csv, which receives the rest of the
+        arguments. usecols and dtype are applied by the parser, so the discarded columns are never converted.
+        :param path: The file path from which CSV data will be extracted.
+        :type path: str
+        :param chunk_size: Rows by chunk. By default CHUNK_ROWS, unless memory_chunk is given.
+        :type chunk_size: int
+        :param memory_chunk: Amount of memory (in MB) desired by chunk. The rows of each chunk are estimated from
+            the memory used by the previous one.
+        :type memory_chunk: float
+        :param usecols: Columns to keep, by name or by index.
+        :type usecols: list
+        :param dtype: Type of the columns, as accepted by pandas.read_csv.
+        :type dtype: dict or type
+        :param transform: Function applied to each chunk, whose results are yielded instead of the chunks.
+        :type transform: callable
+        :param max_in_flight: Maximum number of chunks being transformed at once. By default IN_FLIGHT_CHUNKS.
+        :type max_in_flight: int
+        :return: The chunks, or their transforms, in the order of the file.
+        :rtype: generator of pandas.DataFrame
+        :raises ModuleNotFoundError: If pandas is not installed.
+        """
+        try:
+            reader = self.get_pandas().read_csv(
+                path,
+                chunksize=chunk_size or self.SAMPLE_ROWS,
+                usecols=usecols,
+                dtype=dtype,
+                **kwargs,
+            )
+            with reader:
+
+                def read(rows: int):
+                    try:
+                        return reader.get_chunk(rows)
+                    except StopIteration:
+                        return None
+
+                chunks = self._read_chunks(read, chunk_size, memory_chunk)
+                yield from self._transform_chunks(chunks, transform, max_in_flight)
+        except Exception as e:
+            self.logger.error(f"Unrecognized error - msg: {e} type: {type(e)}")
+            raise e
+
+    def json_chunks(
+        self,
+        path: str,
+        chunk_size: int = None,
+        memory_chunk: float = None,
+        usecols: list = None,
+        dtype=None,
+        transform=None,
+        max_in_flight: int = None,
+    ):
+        """
+        Extracts the DataFrames of the chunks of a JSON Lines file, one object per line. The lines are parsed by
+        json_lines_extractor and only the usecols columns are converted to DataFrame.
+        :param path: The file path from which JSON Lines data will be extracted.
+        :type path: str
+        :param chunk_size: Rows by chunk. By default CHUNK_ROWS, unless memory_chunk is given.
+        :type chunk_size: int
+        :param memory_chunk: Amount of memory (in MB) desired by chunk. The rows of each chunk are estimated from
+            the memory used by the previous one.
+        :type memory_chunk: float
+        :param usecols: Columns to keep, by name.
+        :type usecols: list
+        :param dtype: Type of the columns, as accepted by pandas.DataFrame.astype.
+        :type dtype: dict or type
+        :param transform: Function applied to each chunk, whose results are yielded instead of the chunks.
+        :type transform: callable
+        :param max_in_flight: Maximum number of chunks being transformed at once. By default IN_FLIGHT_CHUNKS.
+        :type max_in_flight: int
+        :return: The chunks, or their transforms, in the order of the file.
+        :rtype: generator of pandas.DataFrame
+        :raises ModuleNotFoundError: If pandas is not installed.
+        """
+        try:
+            pandas = self.get_pandas()
+            records = self.json_lines_extractor(path)
+
+            def read(rows: int):
+                chunk = list(islice(records, rows))
+                if not chunk:
+                    return None
+                chunk = pandas.DataFrame(chunk, columns=usecols)
+                return chunk.astype(dtype) if dtype is not None else chunk
+
+            chunks = self._read_chunks(read, chunk_size, memory_chunk)
+            yield from self._transform_chunks(chunks, transform, max_in_flight)
+        except Exception as e:
+            self.logger.error(f"Unrecognized error - msg: {e} type: {type(e)}")
+            raise e
+
+    def get_chunk_rows(self, chunk, memory_chunk: float) -> int:
+        """
+        Returns the rows of the chunks that fit in the memory desired by chunk, estimated from the memory used by
+        the rows of a chunk.
+        :param chunk: The chunk used to estimate the memory of each row.
+        :type chunk: pandas.DataFrame
+        :param memory_chunk: Amount of memory (in MB) desired by chunk.
+        :type memory_chunk: float
+        :return: Rows by chunk, at least 1.
+        :rtype: int
+        """
+        row_bytes = chunk.memory_usage(index=True, deep=True).sum() / max(len(chunk), 1)
+        return max(1, int(memory_chunk * 1024**2 / max(row_bytes, 1)))
+
+    def _read_chunks(self, read, chunk_size: int = None, memory_chunk: float = None):
+        """
+        Yields the chunks returned by read until it returns None. When they are sized by memory, the first chunk
+        has SAMPLE_ROWS rows and the rest are sized by the previous one.
+        :param read: Function that receives the number of rows and returns the next chunk, or None at the end.
+        :type read: callable
+        :return: The chunks.
+        :rtype: generator of pandas.DataFrame
+        """
+        if chunk_size is None and memory_chunk is None:
+            chunk_size = self.CHUNK_ROWS
+        rows = chunk_size or self.SAMPLE_ROWS
+        while (chunk := read(rows)) is not None:
+            if chunk_size is None:
+                rows = self.get_chunk_rows(chunk, memory_chunk)
+            yield chunk
+
+    def _transform_chunks(self, chunks, transform=None, max_in_flight: int = None):
+        """
+        Yields the transform of each chunk in order. The transforms run on a pool of threads and the next chunk
+        is only read while less than max_in_flight chunks are being transformed.
+        :param chunks: The chunks.
+        :type chunks: iterator of pandas.DataFrame
+        :param transform: Function applied to each chunk. If None, the chunks are yielded as they are.
+        :type transform: callable
+        :param max_in_flight: Maximum number of chunks being transformed at once. By default IN_FLIGHT_CHUNKS.
+        :type max_in_flight: int
+        :return: The transforms of the chunks.
+        :rtype: generator
+        """
+        if transform is None:
+            yield from chunks
+            return
+        max_in_flight = max_in_flight or self.IN_FLIGHT_CHUNKS
+        executor = ThreadPoolExecutor(max_workers=max_in_flight)
+        pending = deque()
+        try:
+            for chunk in chunks:
+                pending.append(executor.submit(transform, chunk))
+                del chunk
+                if len(pending) >= max_in_flight:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,239 @@
+""" This module contains the cache of the data extracted from files """
+
+import glob
+import hashlib
+import importlib
+import os
+import pickle
+import re
+import sys
+from collections.abc import Iterator
+from contextlib import suppress
+
+from jimena.core.components.data.extractor.core import DataExtractorCore
+from jimena.core.components.tools.system import SystemTools
+
+
+class DataExtractorCache(DataExtractorCore):
+    """
+    Extractor that caches the data extracted from each file on local disk
+
+    The cache of a file is keyed by the fingerprint of the file (its path, size and modification time, or a hash of
+    its content) together with the extractor and its arguments, so it is used until the file changes. Tables
+    (pyarrow.Table and pandas.DataFrame) are stored in Feather or Parquet files with pyarrow, and Feather files are
+    read back mapped in memory, so reading a cached table does not copy it. The rest of the data, or every result
+    when pyarrow is not installed or a table can not be converted, is stored with pickle. The previous caches of a
+    file are removed when it is cached again, and a cache that can not be written is skipped. By default the
+    folder is the "extracts" cache folder of the user, and each cache is checked with SystemTools.check_private_path
+    before it is read.
+    """
+
+    FINGERPRINTS = ("stat", "content")
+    FORMATS = {"feather": ".arrow", "parquet": ".parquet", "pickle": ".pickle"}
+    # Changed when the stored files change, so the previous ones are not read
+    VERSION = 1
+    # Names of the caches: hash of the file and the extractor, then the fingerprint of the file
+    CACHE_NAME = re.compile(r"[0-9a-f]{32}-[0-9a-f]{32}\.(arrow|parquet|pickle)")
+
+    def __init__(
+        self,
+        folder: str = None,
+        fingerprint: str = "stat",
+        table_format: str = "feather",
+        threaded_decompression: bool = False,
+    ):
+        super().__init__(threaded_decompression=threaded_decompression)
+        if fingerprint not in self.FINGERPRINTS:
+            raise ValueError(
+                f"Invalid fingerprint {fingerprint} - valid: {list(self.FINGERPRINTS)}"
+            )
+        if table_format not in ("feather", "parquet"):
+            raise ValueError(
+                f"Invalid table format {table_format} - valid: ['feather', 'parquet']"
+            )
+        self.system_tools = SystemTools()
+        self.folder = (
+            folder
+            if folder
+            else self.system_tools.get_user_cache_folder_path("extracts")
+        )
+        self.fingerprint = fingerprint
+        self.table_format = table_format
+
+    def get_fingerprint(self, path: str) -> str:
+        """
+        Returns the fingerprint of a file: a hash of its size and modification time, or of its content.
+        :param path: The file path.
+        :type path: str
+        :return: The fingerprint.
+        :rtype: str
+        :raises FileNotFoundError: If the file specified by the path does not exist.
+        """
+        if self.fingerprint == "stat":
+            stat = os.stat(path)
+            return hashlib.blake2b(
+                repr((stat.st_size, stat.st_mtime_ns)).encode("utf-8"), digest_size=16
+            ).hexdigest()
+        digest = hashlib.blake2b(digest_size=16)
+        with open(path, "rb") as file:
+            while block := file.read(self.CHUNK_SIZE):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def get_cache_path(self, path: str, extractor: str, kwargs: dict) -> str:
+        """
+        Returns the path of the cache of a file without its extension, named after the file, the extractor and its
+        arguments, followed by the fingerprint of the file.
+        :param path: The file path.
+        :type path: str
+        :param extractor: The name of the extractor.
+        :type extractor: str
+        :param kwargs: The arguments of the extractor.
+        :type kwargs: dict
+        :return: The path of the cache.
+        :rtype: str
+        """
+        source = repr(
+            (self.VERSION, os.path.abspath(path), extractor, sorted(kwargs.items()))
+        )
+        source = hashlib.blake2b(source.encode("utf-8"), digest_size=16).hexdigest()
+        return os.path.join(self.folder, f"{source}-{self.get_fingerprint(path)}")
+
+    def extract(self, path: str, extractor: str = "csv_columnar_extractor", **kwargs):
+        """
+        Extracts the data of a file with an extractor, reading it from the cache if the file has not changed since
+        it was cached. The streaming extractors are consumed into a list. Only tables are cached in Feather or
+        Parquet, e.g. csv_columnar_extractor with output="arrow"; the results of the rest of the extractors are
+        pickled.
+        :param path: The file path from which data will be extracted.
+        :type path: str
+        :param extractor: The name of the extractor of DataExtractorCore, "csv_columnar_extractor" by default.
+        :type extractor: str
+        :param kwargs: The arguments of the extractor, which must have a stable repr.
+        :return: The data extracted from the file.
+        :rtype: pyarrow.Table, pandas.DataFrame, dict or list
+        :raises FileNotFoundError: If the file specified by the path does not exist.
+        :raises PermissionError: If the program does not have permission to read the file.
+        """
+        try:
+            cache_path = self.get_cache_path(path, extractor, kwargs)
+            for extension in self.FORMATS.values():
+                if os.path.exists(cache_path + extension):
+                    return self._read(cache_path + extension)
+            data = getattr(self, extractor)(path, **kwargs)
+            if isinstance(data, Iterator):
+                data = list(data)
+            try:
+                self._write(cache_path, data)
+            except Exception as e:
+                # The cache is an optimization, so the data is returned without it
+                self.logger.warning(f"Cache not written: {cache_path} - msg: {e}")
+            return data
+        except Exception as e:
+            self.logger.error(f"Unrecognized error - msg: {e} type: {type(e)}")
+            raise e
+
+    def _get_table(self, data):
+        """
+        Returns the data as a pyarrow.Table if it is a table and pyarrow is installed, otherwise None.
+        :param data: The extracted data.
+        :return: The table.
+        :rtype: pyarrow.Table
+        """
+        pa = self.get_optional_module("pyarrow")
+        if pa is None:
+            return None
+        if isinstance(data, pa.Table):
+            return data
+        # pandas is not imported if the extractors have not imported it
+        pandas = sys.modules.get("pandas")
+        if pandas is not None and isinstance(data, pandas.DataFrame):
+            try:
+                return pa.Table.from_pandas(data)
+            except (pa.ArrowException, ValueError, TypeError) as e:
+                # e.g. columns of mixed types, which are pickled
+                self.logger.warning(f"DataFrame not converted to Arrow - msg: {e}")
+        return None
+
+    def _write(self, cache_path: str, data) -> None:
+        """
+        Writes the cache of a file, replacing its previous caches. It is written to a temporary file that is
+        renamed, so concurrent readers never read a partial cache.
+        :param cache_path: The path of the cache without its extension.
+        :type cache_path: str
+        :param data: The extracted data.
+        """
+        os.makedirs(self.folder, mode=0o700, exist_ok=True)
+        table = self._get_table(data)
+        table_format = self.table_format if table is not None else "pickle"
+        final_path = cache_path + self.FORMATS[table_format]
+        temporary_path = f"{final_path}.{os.getpid()}.tmp"
+        try:
+            if table_format == "feather":
+                feather = self._import_arrow_module("pyarrow.feather")
+                # Uncompressed, so it can be mapped in memory
+                feather.write_feather(table, temporary_path, compression="uncompressed")
+            elif table_format == "parquet":
+                parquet = self._import_arrow_module("pyarrow.parquet")
+                parquet.write_table(table, temporary_path)
+            else:
+                with open(temporary_path, "wb") as file:
+                    pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL)
+            source = os.path.basename(cache_path).split("-")[0]
+            for previous_path in glob.glob(os.path.join(self.folder, f"{source}-*")):
+                # Another process may be replacing them too
+                if not previous_path.endswith(".tmp"):
+                    with suppress(FileNotFoundError):
+                        os.remove(previous_path)
+            os.replace(temporary_path, final_path)
+        finally:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+
+    def _read(self, cache_path: str):
+        """
+        Reads the cache of a file. Feather files are mapped in memory and Parquet files are read from a mapping.
+        Tables written from a pandas.DataFrame are returned as pandas.DataFrame.
+        :param cache_path: The path of the cache with its extension.
+        :type cache_path: str
+        :return: The extracted data.
+        :rtype: pyarrow.Table, pandas.DataFrame, dict or list
+        :raises PermissionError: If the cache is owned by another user.
+        """
+        self.system_tools.check_private_path(cache_path)
+        if cache_path.endswith(self.FORMATS["pickle"]):
+            with open(cache_path, "rb") as file:
+                return pickle.load(file)
+        if cache_path.endswith(self.FORMATS["feather"]):
+            feather = self._import_arrow_module("pyarrow.feather")
+            table = feather.read_table(cache_path, memory_map=True)
+        else:
+            parquet = self._import_arrow_module("pyarrow.parquet")
+            table = parquet.read_table(cache_path, memory_map=True)
+        if table.schema.pandas_metadata is not None:
+            return table.to_pandas()
+        return table
+
+    def _import_arrow_module(self, module_name: str):
+        """
+        Returns a submodule of pyarrow.
+        :param module_name: The submodule name, e.g. "pyarrow.feather".
+        :type module_name: str
+        :return: The submodule.
+        :rtype: module
+        :raises ModuleNotFoundError: If pyarrow is not installed.
+        """
+        if self.get_optional_module("pyarrow") is None:
+            raise ModuleNotFoundError("No module named 'pyarrow'", name="pyarrow")
+        return importlib.import_module(module_name)
+
+    def clear(self) -> None:
+        """
+        Removes the caches of every file. The other files of the folder are kept.
+        """
+        if not os.path.isdir(self.folder):
+            return
+        for name in os.listdir(self.folder):
+            if self.CACHE_NAME.fullmatch(name):
+                with suppress(FileNotFoundError):
+                    os.remove(os.path.join(self.folder, name))
@@ -0,0 +1,85 @@
+""" This module contains the reader of compressed files used by the extractors """
+
+import io
+import queue
+import threading
+
+
+class ReadAheadReader(io.RawIOBase):
+    """
+    Binary reader that reads a stream in a background thread
+
+    The blocks of the stream are read ahead into a bounded queue, so the decompression of a compressed file runs in
+    parallel with the parsing of the blocks already read (zlib, bz2, lzma and zstandard release the GIL while
+    decompressing). At most blocks blocks are kept in memory. The errors of the stream are raised by the read that
+    reaches them.
+    """
+
+    BLOCKS = 4  # blocks read ahead by default
+
+    def __init__(self, file, block_size: int, blocks: int = None):
+        super().__init__()
+        self.file = file
+        self.block_size = block_size
+        self._blocks = queue.Queue(maxsize=blocks if blocks else self.BLOCKS)
+        self._block = memoryview(b"")
+        self._eof = False
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._read_blocks, daemon=True)
+        self._thread.start()
+
+    def _read_blocks(self) -> None:
+        """
+        Method that reads the blocks of the stream into the queue until its end, an error or close.
+        """
+        try:
+            while not self._stopped.is_set():
+                block = self.file.read(self.block_size)
+                self._put(block)
+                if not block:
+                    return
+        except Exception as e:
+            self._put(e)
+
+    def _put(self, item) -> None:
+        """
+            Method that puts a block or an error in the queue, waiting while it is full unless the reader is closed.
+
+        :param item: Block or error.
+        """
+        while not self._stopped.is_set():
+            try:
+                self._blocks.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if not self._block:
+            if self._eof:
+                return 0
+            block = self._blocks.get()
+            if isinstance(block, Exception):
+                self._eof = True
+                raise block
+            if not block:
+                self._eof = True
+                return 0
+            self._block = memoryview(block)
+        size = min(len(buffer), len(self._block))
+        buffer[:size] = self._block[:size]
+        self._block = self._block[size:]
+        return size
+
+    def close(self) -> None:
+        """
+        Method that stops the background thread and closes the stream.
+        """
+        if not self.closed:
+            self._stopped.set()
+            self._thread.join()
+            self.file.close()
+        super().close()
@@ -1,13 +1,179 @@
 import csv
+import importlib
+import io
 import json
+import math
+import os
+import re
+from array import array
+from contextlib import nullcontext
+from itertools import islice
 
 from jimena.core.components.data.core import JDataCore
+from jimena.core.components.data.extractor.compressed import ReadAheadReader
+from jimena.core.components.data.extractor.mapped import MappedLines
+from jimena.core.components.tools.generic import ImportTools
 
 
 class DataExtractorCore(JDataCore):
 
-    def __init__(self):
+    CHUNK_SIZE = 64 * 1024  # characters read at once by the streaming extractors
+    WHITESPACE = re.compile(r"[ \t\n\r]*")
+    JSON_TRUNCATED_SIZE = 16  # characters before the end of the text where a JSON error may be a truncation
+    COLUMN_TYPES = {int: "int", float: "float", bool: "bool", str: "str"}
+    BOOL_VALUES = {
+        "true": True,
+        "false": False,
+        "": None,
+    }  # lowercase values of bool columns
+    COLUMNAR_OUTPUTS = {"arrow": "pyarrow", "numpy": "numpy", "python": None}
+    COMPRESSIONS = {
+        ".gz": "gzip",
+        ".gzip": "gzip",
+        ".bz2": "bz2",
+        ".xz": "xz",
+        ".lzma": "xz",
+        ".zst": "zstd",
+        ".zstd": "zstd",
+    }
+    # Full signatures, so text files starting like a short magic number are not taken as compressed
+    MAGIC_BYTES = {
+        "gzip": re.compile(rb"\x1f\x8b\x08"),  # deflate
+        "bz2": re.compile(
+            rb"BZh[1-9](1AY&SY|\x17rE8P\x90)"
+        ),  # first block or end of stream
+        "xz": re.compile(rb"\xfd7zXZ\x00"),
+        "zstd": re.compile(rb"\x28\xb5\x2f\xfd"),
+    }
+    MAGIC_SIZE = 10  # bytes read to detect the compression
+    COMPRESSION_MODULES = {
+        "gzip": "gzip",
+        "bz2": "bz2",
+        "xz": "lzma",
+        "zstd": "zstandard",
+    }
+
+    _optional_modules = {}
+
+    def __init__(self, threaded_decompression: bool = False):
         super().__init__()
+        self.threaded_decompression = threaded_decompression
+
+    @classmethod
+    def get_optional_module(cls, module_name: str):
+        """
+        Returns an optional dependency, importing it on the first call. If it is not installed, it is warned only
+        once.
+        :param module_name: The module name.
+        :type module_name: str
+        :return: The module, or None if it is not installed.
+        :rtype: module
+        """
+        if module_name not in cls._optional_modules:
+            cls._optional_modules[module_name] = (
+                importlib.import_module(module_name)
+                if ImportTools().module_exists(module_name=module_name)
+                else None
+            )
+        return cls._optional_modules[module_name]
+
+    def get_compression(self, path: str):
+        """
+        Returns the compression of a file, given by its extension or, if it has no compression extension, by its
+        first bytes.
+        :param path: The file path.
+        :type path: str
+        :return: "gzip", "bz2", "xz", "zstd" or None if the file is not compressed.
+        :rtype: str
+        :raises FileNotFoundError: If the file specified by the path does not exist.
+        """
+        compression = self.COMPRESSIONS.get(os.path.splitext(path)[1].lower())
+        if compression is not None:
+            return compression
+        with open(path, "rb") as file:
+            return self._get_magic_compression(file.read(self.MAGIC_SIZE))
+
+    def _get_magic_compression(self, header: bytes):
+        """
+        Returns the compression of a file given by its first bytes.
+        :param header: The first bytes of the file.
+        :type header: bytes
+        :return: "gzip", "bz2", "xz", "zstd" or None if the file is not compressed.
+        :rtype: str
+        """
+        for compression, magic in self.MAGIC_BYTES.items():
+            if magic.match(header):
+                return compression
+        return None
+
+    def open_file(self, path: str, newline: str = None, binary: bool = False):
+        """
+        Opens a file to read it, decompressing it while it is read if it is compressed with gzip, bz2, xz or zstd
+        (zstd requires zstandard). The compression is given by the extension or, without a compression extension,
+        by the first bytes of the file, and a file that can not be decompressed is read as plain. If
+        threaded_decompression is True, compressed files are decompressed ahead in a background thread.
+        :param path: The file path.
+        :type path: str
+        :param newline: The newline argument of open.
+        :type newline: str
+        :param binary: If True, the file is opened in binary mode.
+        :type binary: bool
+        :return: The file object.
+        :rtype: file object
+        :raises FileNotFoundError: If the file specified by the path does not exist.
+        :raises ModuleNotFoundError: If the file is compressed with zstd and zstandard is not installed.
+        """
+        compression = self.COMPRESSIONS.get(os.path.splitext(path)[1].lower())
+        if compression is None:
+            file = open(path, "rb")
+            # The first bytes are read from the buffer of the file that is returned if it is not compressed
+            compression = self._get_magic_compression(
+                file.peek(self.MAGIC_SIZE)[: self.MAGIC_SIZE]
+            )
+            if compression is None:
+                return file if binary else io.TextIOWrapper(file, newline=newline)
+            file.close()
+            file = self._open_compressed(path, compression)
+            try:
+                file.peek(1)
+            except Exception as e:
+                # A plain file that starts like a compressed one is read as it is
+                self.logger.warning(
+                    f"File {path} is not {compression} compressed - msg: {e}"
+                )
+                file.close()
+                return open(path, "rb" if binary else "r", newline=newline)
+        else:
+            file = self._open_compressed(path, compression)
+        if self.threaded_decompression:
+            file = io.BufferedReader(ReadAheadReader(file, self.CHUNK_SIZE))
+        return file if binary else io.TextIOWrapper(file, newline=newline)
+
+    def _open_compressed(self, path: str, compression: str):
+        """
+        Opens a compressed file to read it decompressed.
+        :param path: The file path.
+        :type path: str
+        :param compression: "gzip", "bz2", "xz" or "zstd".
+        :type compression: str
+        :return: The binary file object, with peek.
+        :rtype: file object
+        :raises ModuleNotFoundError: If the file is compressed with zstd and zstandard is not installed.
+        """
+        module_name = self.COMPRESSION_MODULES[compression]
+        if compression != "zstd":
+            return importlib.import_module(module_name).open(path, "rb")
+        zstandard = self.get_optional_module(module_name)
+        if zstandard is None:
+            raise ModuleNotFoundError(
+                f"No module named '{module_name}'", name=module_name
+            )
+        # Files written by parallel compressors have many frames
+        return io.BufferedReader(
+            zstandard.ZstdDecompressor().stream_reader(
+                open(path, "rb"), read_across_frames=True, closefd=True
+            )
+        )
 
     def json_extractor(self, path: str):
         """
@@ -21,13 +187,169 @@ class DataExtractorCore(JDataCore):
         :raises json.JSONDecodeError: If the file does not contain valid JSON data.
         """
         try:
-            with open(path, "r") as file:
+            with self.open_file(path) as file:
                 data = json.load(file)
                 return data
         except Exception as e:
             self.logger.error(f"Unrecognized error - msg: {e} type: {type(e)}")
             raise e
 
+    def json_lines_extractor(self, path: str, batch_size: int = None):
+        """
+        Extracts the records of a JSON Lines (NDJSON) file given its path, yielding them while the file is read.
+        Blank lines are skipped.
+        :param path: The file path from which JSON Lines data will be extracted.
+        :type path: str
+        :param batch_size: Number of records of each yielded batch. By default records are yielded one by one.
+        :type batch_size: int
+        :return: The records extracted from the file, or lists of records if batch_size is given.
+        :rtype: generator
+        :raises FileNotFoundError: If the file specified by the path does not exist.
+        :raises PermissionError: If the program does not have permission to read the file.
+        :raises json.JSONDecodeError: If a line does not contain valid JSON data.
+        """
+        try:
+            with self.open_file(path) as file:
+                yield from self._batch(self._json_lines(file), batch_size)
+        except Exception as e:
+            self.logger.error(f"Unrecognized error - msg: {e} type: {type(e)}")
+            raise e
+
+    @staticmethod
+    def _json_lines(file):
+        """
+        Yields the records of the lines of a JSON Lines file.
+        :param file: The file opened in text mode.
+        :return: The records of the file.
+        :rtype: generator
+        :raises json.JSONDecodeError: If a line does not contain valid JSON data.
+        """
+        for line_number, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                raise json.JSONDecodeError(
+                    f"{e.msg} in line {line_number}", e.doc, e.pos
+                )
+
+    def json_stream_extractor(
+        self, path: str, batch_size: int = None, chunk_size: int = None
+    ):
+        """
+        Extracts the items of a JSON file whose top-level value is an array given its path, parsing and yielding
+        them while the file is read, so only one item at a time is held in memory.
+        :param path: The file path from which JSON data will be extracted.
+        :type path: str
+        :param batch_size: Number of items of each yielded batch. By default items are yielded one by one.
+        :type batch_size: int
+        :param chunk_size: Number of characters read at once. By default CHUNK_SIZE.
+        :type chunk_size: int
+        :return: The items of the array, or lists of items if batch_size is given.
+        :rtype: generator
+        :raises FileNotFoundError: If the file specified by the path does not exist.
+        :raises PermissionError: If the program does not have permission to read the file.
+        :raises json.JSONDecodeError: If the file does not contain a valid JSON array.
+        """
+        try:
+            with self.open_file(path) as file:
+                items = self._json_array_items(file, chunk_size or self.CHUNK_SIZE)
+                yield from self._batch(items, batch_size)
+        except Exception as e:
+            self.logger.error(f"Unrecognized error - msg: {e} type: {type(e)}")
+            raise e
+
+    def _json_array_items(self, file, chunk_size: int):
+        """
+        Yields the items of the top-level JSON array of a file, reading it in chunks. The chunk read grows with
+        the pending text, so items bigger than a chunk are parsed in linear time.
+        :param file: The file opened in text mode.
+        :param chunk_size: Number of characters read at once.
+        :type chunk_size: int
+        :return: The items of the array.
+        :rtype: generator
+        :raises json.JSONDecodeError: If the file does not contain a valid JSON array.
+        """
+        decoder = json.JSONDecoder()
+        buffer, position, eof = "", 0, False
+        # Characters and lines of the file before the buffer, and offset of the line where the buffer starts
+        consumed, lines, line_start = 0, 0, 0
+
+        def read() -> bool:
+            nonlocal buffer, position, eof, consumed, lines, line_start
+            newlines = buffer.count("\n", 0, position)
+            if newlines:
+                lines += newlines
+                line_start = consumed + buffer.rfind("\n", 0, position) + 1
+            consumed += position
+            chunk = file.read(max(chunk_size, len(buffer) - position))
+            buffer, position, eof = buffer[position:] + chunk, 0, not chunk
+            return not eof
+
+        def error(msg: str, index: int) -> json.JSONDecodeError:
+            # The position, line and column are the ones in the file, not in the buffer
+            newline = buffer.rfind("\n", 0, index)
+            pos = consumed + index
+            lineno = lines + buffer.count("\n", 0, index) + 1
+            colno = pos - (consumed + newline + 1 if newline != -1 else line_start) + 1
+            e = json.JSONDecodeError(msg, buffer, index)
+            e.pos, e.lineno, e.colno = pos, lineno, colno
+            e.args = (f"{msg}: line {lineno} column {colno} (char {pos})",)
+            return e
+
+        state = "start"
+        while True:
+            position = self.WHITESPACE.match(buffer, position).end()
+            if position == len(buffer):
+                if not read():
+                    if state == "end":
+                        return
+                    # The same errors as json.loads for a truncated array
+                    raise error(
+                        (
+                            "Expecting ',' delimiter"
+                            if state == "separator"
+                            else "Expecting value"
+                        ),
+                        position,
+                    )
+                continue
+            char = buffer[position]
+            if state == "end":
+                # Only whitespace may follow the array, as in json.loads
+                raise error("Extra data", position)
+            if state == "start":
+                if char != "[":
+                    raise error("Expecting '['", position)
+                position, state = position + 1, "first"
+            elif state == "separator" or (state == "first" and char == "]"):
+                if char == "]":
+                    position, state = position + 1, "end"
+                    continue
+                if char != ",":
+                    raise error("Expecting ',' delimiter", position)
+                position, state = position + 1, "item"
+            else:
+                try:
+                    item, end = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError as e:
+                    # Only an error at the end of the buffer may be a truncated item, e.g. "tru" or "[1, 2",
+                    # so malformed items are raised without reading the rest of the file
+                    truncated = e.msg.startswith("Unterminated string") or (
+                        len(buffer) - e.pos <= self.JSON_TRUNCATED_SIZE
+                    )
+                    if eof or not truncated:
+                        raise error(e.msg, e.pos) from None
+                    read()
+                    continue
+                # An item at the end of the buffer may be truncated, e.g. a number
+                if not eof and self.WHITESPACE.match(buffer, end).end() == len(buffer):
+                    read()
+                    continue
+                yield item
+                position, state = end, "separator"
+
     def csv_extractor(self, path: str):
         """
         Extracts data from a CSV file given its path.
@@ -39,7 +361,7 @@ class DataExtractorCore(JDataCore):
         :raises PermissionError: If the program does not have permission to read the file.
         """
         try:
-            with open(path, "r") as file:
+            with self.open_file(path) as file:
                 csv_data = csv.reader(file)
                 data = []
                 for raw in csv_data:
@@ -49,6 +371,286 @@ class DataExtractorCore(JDataCore):
             self.logger.error(f"Unrecognized error - msg: {e} type: {type(e)}")
             raise e
 
+    def csv_stream_extractor(
+        self,
+        path: str,
+        batch_size: int = None,
+        header: bool = False,
+        columns: list = None,
+    ):
+        """
+        Extracts data from a CSV file given its path, yielding the rows while the file is read instead of
+        returning them in a list, so the memory used does not depend on the size of the file.
+        :param path: The file path from which CSV data will be extracted.
+        :type path: str
+        :param batch_size: Number of rows of each yielded batch. By default rows are yielded one by one.
+        :type batch_size: int
+        :param header: If True, the first row is the header and each row is yielded as a dict {column:value}.
+        :type header: bool
+        :param columns: Columns to keep, by name if the file has header or by index. The rest are discarded.
+        :type columns: list
+        :return: The rows extracted from the CSV file, or lists of rows if batch_size is given.
+        :rtype: generator of lists or dicts
+        :raises FileNotFoundError: If the file specified by the path does not exist.
+        :raises PermissionError: If the program does not have permission to read the file.
+        :raises ValueError: If a column given by name is not in the header.
+        """
+        try:
+            with self.open_file(path, newline="") as file:
+                csv_data = csv.reader(file)
+                names = next(csv_data, []) if header else None
+                indexes = self._get_csv_column_indexes(names, columns)
+                if indexes is not None:
+                    csv_data = ([raw[i] for i in indexes] for raw in csv_data)
+                    names = [names[i] for i in indexes] if header else None
+                if header:
+                    csv_data = (dict(zip(names, raw)) for raw in csv_data)
+                yield from self._batch(csv_data, batch_size)
+        except Exception as e:
+            self.logger.error(f"Unrecognized error - msg: {e} type: {type(e)}")
+            raise e
+
+    def csv_columnar_extractor(
+        self,
+        path: str,
+        header: bool = True,
+        columns: list = None,
+        schema: dict = None,
+        output: str = None,
+    ):
+        """
+        Extracts the columns of a CSV file given its path with typed values, so they can be filtered with
+        vectorized operations instead of checking each value. The type of each column (int, float, bool or str)
+        is given by schema or inferred from its values. Missing values are NaN in float columns and None in bool
+        columns, and int columns with missing values are inferred as float.
+        :param path: The file path from which CSV data will be extracted.
+        :type path: str
+        :param header: If True, the first row is the header. Otherwise columns are named f0, f1...
+        :type header: bool
+        :param columns: Columns to keep, by name or by index. The rest are discarded while reading.
+        :type columns: list
+        :param schema: Type of the columns {column:type}, as int, float, bool, str or their names.
+        :type schema: dict
+        :param output: "arrow" for a pyarrow.Table, "numpy" for a dict {column:numpy.ndarray} or "python" for a
+            dict {column:array.array} with lists for bool and str columns. By default the first one installed.
+        :type output: str
+        :return: The typed columns extracted from the CSV file.
+        :rtype: pyarrow.Table or dict
+        :raises FileNotFoundError: If the file specified by the path does not exist.
+        :raises PermissionError: If the program does not have permission to read the file.
+        :raises ValueError: If a column is not in the file or a value does not match the type of its column.
+        :raises ModuleNotFoundError: If the library of the output is not installed.
+        """
+        try:
+            output = self._get_columnar_output(output)
+            with self.open_file(path, newline="") as file:
+                first_row = next(csv.reader(file), [])
+            names = first_row if header else [f"f{i}" for i in range(len(first_row))]
+            indexes = self._get_csv_column_indexes(names, columns)
+            if indexes is None:
+                indexes = list(range(len(names)))
+            selected = [names[i] for i in indexes]
+            schema = {
+                column: self.COLUMN_TYPES.get(column_type, column_type)
+                for column, column_type in (schema or {}).items()
+            }
+            if output == "arrow":
+                return self._csv_arrow_table(path, header, names, selected, schema)
+            values = [[] for _ in indexes]
+            rows = self.csv_stream_extractor(path, columns=indexes)
+            for raw in islice(rows, 1 if header else 0, None):
+                for column_values, value in zip(values, raw):
+                    column_values.append(value)
+            result = {
+                name: self._to_column(column_values, schema.get(name), name)
+                for name, column_values in zip(selected, values)
+            }
+            if output == "numpy":
+                return {
+                    name: self._to_numpy_column(column)
+                    for name, column in result.items()
+                }
+            return result
+        except Exception as e:
+            self.logger.error(f"Unrecognized error - msg: {e} type: {type(e)}")
+            raise e
+
+    def _get_columnar_output(self, output: str = None) -> str:
+        """
+        Returns the output of the columnar extraction: the one given, or the first one installed.
+        :param output: "arrow", "numpy", "python" or None.
+        :type output: str
+        :return: The output.
+        :rtype: str
+        :raises ValueError: If the output is not valid.
+        :raises ModuleNotFoundError: If the library of the output is not installed.
+        """
+        if output is None:
+            for output, module_name in self.COLUMNAR_OUTPUTS.items():
+                if module_name is None or self.get_optional_module(module_name):
+                    return output
+        if output not in self.COLUMNAR_OUTPUTS:
+            raise ValueError(
+                f"Invalid output {output} - valid: {list(self.COLUMNAR_OUTPUTS)}"
+            )
+        module_name = self.COLUMNAR_OUTPUTS[output]
+        if module_name is not None and self.get_optional_module(module_name) is None:
+            raise ModuleNotFoundError(
+                f"No module named '{module_name}'", name=module_name
+            )
+        return output
+
+    def _csv_arrow_table(
+        self, path: str, header: bool, names: list, selected: list, schema: dict
+    ):
+        """
+        Reads the columns of a CSV file into a pyarrow.Table with the multithreaded parser of pyarrow. Compressed
+        files are decompressed by open_file.
+        :return: The table with the selected columns.
+        :rtype: pyarrow.Table
+        """
+        pa = self.get_optional_module("pyarrow")
+        pa_csv = importlib.import_module("pyarrow.csv")
+        arrow_types = {
+            "int": pa.int64(),
+            "float": pa.float64(),
+            "bool": pa.bool_(),
+            "str": pa.string(),
+        }
+        source = (
+            self.open_file(path, binary=True)
+            if self.get_compression(path) is not None
+            else nullcontext(path)
+        )
+        with source as file:
+            return pa_csv.read_csv(
+                file,
+                read_options=pa_csv.ReadOptions(column_names=None if header else names),
+                convert_options=pa_csv.ConvertOptions(
+                    include_columns=selected,
+                    column_types={
+                        name: arrow_types[column_type]
+                        for name, column_type in schema.items()
+                    },
+                ),
+            )
+
+    @classmethod
+    def _infer_column_type(cls, values: list) -> str:
+        """
+        Infers the type of a column of a CSV file from its values, ignoring the missing ones.
+        :param values: The values of the column.
+        :type values: list of str
+        :return: "int", "float", "bool" or "str".
+        :rtype: str
+        """
+        present = [value for value in values if value != ""]
+        if present and all(value.lower() in cls.BOOL_VALUES for value in present):
+            return "bool"
+        for column_type, parse in (("int", int), ("float", float)):
+            try:
+                for value in present:
+                    parse(value)
+            except ValueError:
+                continue
+            if column_type == "int" and len(present) < len(values):
+                return "float"
+            return column_type
+        return "str"
+
+    def _to_column(self, values: list, column_type: str, name: str):
+        """
+        Converts the values of a column of a CSV file to its type.
+        :param values: The values of the column.
+        :type values: list of str
+        :param column_type: "int", "float", "bool", "str" or None to infer it.
+        :type column_type: str
+        :param name: The column name.
+        :type name: str
+        :return: array.array of int64 or float64 for numbers, and lists for bool and str.
+        :rtype: array or list
+        :raises ValueError: If a value does not match the type of the column.
+        """
+        column_type = column_type or self._infer_column_type(values)
+        if column_type == "int":
+            if "" in values:
+                raise ValueError(f"Missing values in int column {name}")
+            return array("q", map(int, values))
+        if column_type == "float":
+            return array("d", (float(v) if v != "" else math.nan for v in values))
+        if column_type == "bool":
+            try:
+                return [self.BOOL_VALUES[v.lower()] for v in values]
+            except KeyError as e:
+                raise ValueError(
+                    f"Invalid value {e.args[0]!r} of bool column {name} - valid: "
+                    f"{list(self.BOOL_VALUES)}"
+                ) from None
+        if column_type == "str":
+            return values
+        raise ValueError(
+            f"Invalid type {column_type} of column {name} - valid: "
+            f"{list(self.COLUMN_TYPES.values())}"
+        )
+
+    def _to_numpy_column(self, column):
+        """
+        Converts a typed column to a numpy array. Number arrays are wrapped without copying them.
+        :param column: The typed column.
+        :type column: array or list
+        :return: The column as numpy array.
+        :rtype: numpy.ndarray
+        """
+        np = self.get_optional_module("numpy")
+        if isinstance(column, array):
+            return np.frombuffer(
+                column, dtype=np.int64 if column.typecode == "q" else np.float64
+            )
+        if column and all(isinstance(value, bool) for value in column):
+            return np.array(column, dtype=bool)
+        return np.array(column, dtype=object)
+
+    @staticmethod
+    def _get_csv_column_indexes(names: list, columns: list):
+        """
+        Returns the indexes of the columns to keep of a CSV file.
+        :param names: The header of the CSV file, or None if it has no header.
+        :type names: list
+        :param columns: Columns to keep, by name or by index.
+        :type columns: list
+        :return: The indexes of the columns, or None to keep all of them.
+        :rtype: list of int
+        :raises ValueError: If a column given by name is not in the header, or the file has no header.
+        """
+        if columns is None:
+            return None
+        if names is None and not all(isinstance(column, int) for column in columns):
+            raise ValueError(
+                f"Columns given by name require a header - columns: {columns}"
+            )
+        return [
+            column if isinstance(column, int) else names.index(column)
+            for column in columns
+        ]
+
+    @staticmethod
+    def _batch(items, batch_size: int = None):
+        """
+        Yields the items of an iterable, or lists of batch_size items if it is given.
+        :param items: The items to yield.
+        :type items: iterable
+        :param batch_size: Number of items of each batch.
+        :type batch_size: int
+        :return: The items or the batches of items.
+        :rtype: generator
+        """
+        if not batch_size:
+            yield from items
+            return
+        items = iter(items)
+        while batch := list(islice(items, batch_size)):
+            yield batch
+
     def generic_extractor(self, path: str):
         """
         Extracts data from a file given its path.
@@ -60,9 +662,29 @@ class DataExtractorCore(JDataCore):
         :raises PermissionError: If the program does not have permission to read the file.
         """
         try:
-            with open(path, "r") as file:
+            with self.open_file(path) as file:
                 data = file.readlines()
                 return data
         except Exception as e:
             self.logger.error(f"Unrecognized error - msg: {e} type: {type(e)}")
             raise e
+
+    def generic_mapped_extractor(self, path: str, encoding: str = "utf-8"):
+        """
+        Extracts data from a file given its path, mapping it in memory instead of reading it. The lines are
+        decoded lazily while iterating, can be accessed by number in O(1) and are also available as byte slices
+        without copies. It must be closed after use, or used as a context manager.
+        :param path: The file path from which data will be extracted.
+        :type path: str
+        :param encoding: The encoding used to decode the lines.
+        :type encoding: str
+        :return: The lines of the file.
+        :rtype: MappedLines
+        :raises FileNotFoundError: If the file specified by the path does not exist.
+        :raises PermissionError: If the program does not have permission to read the file.
+        """
+        try:
+            return MappedLines(path, encoding=encoding)
+        except Exception as e:
+            self.logger.error(f"Unrecognized error - msg: {e} type: {type(e)}")
+            raise e
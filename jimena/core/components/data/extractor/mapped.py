@@ -0,0 +1,106 @@
+""" This module contains the reader of files mapped in memory used by the extractors """
+
+import mmap
+import os
+from array import array
+
+from jimena.core.components.data.core import JDataCore
+
+
+class MappedLines(JDataCore):
+    """
+    Lines of a file mapped in memory
+
+    The file is not read into memory: the lines are decoded lazily while iterating, and the byte slices returned by
+    iter_bytes and line_bytes are views of the mapping, without copies. The first random access builds an index
+    with the offset of each line, after which any line is accessed in O(1). Lines are split by "\\n", which is kept
+    at the end of each line like in readlines.
+
+    The byte slices must be released before closing, since a mapping with exported views can not be closed.
+    """
+
+    def __init__(self, path: str, encoding: str = "utf-8"):
+        super().__init__()
+        self.path = path
+        self.encoding = encoding
+        self._index = None
+        with open(path, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            # Empty files can not be mapped
+            self._mmap = (
+                mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+            )
+        self.buffer = memoryview(self._mmap if self._mmap is not None else b"")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __iter__(self):
+        for line in self.iter_bytes():
+            yield str(line, self.encoding)
+
+    def __len__(self):
+        return len(self._get_index()) - 1
+
+    def __getitem__(self, number):
+        if isinstance(number, slice):
+            return [self[i] for i in range(*number.indices(len(self)))]
+        return str(self.line_bytes(number), self.encoding)
+
+    def iter_bytes(self):
+        """
+            Method that yields the lines of the file as views of the mapping, without decoding or copying them.
+
+        :return: [Generator] Lines as memoryview.
+        """
+        position, size = 0, len(self.buffer)
+        while position < size:
+            end = self._mmap.find(b"\n", position)
+            end = size if end < 0 else end + 1
+            yield self.buffer[position:end]
+            position = end
+
+    def line_bytes(self, number: int) -> memoryview:
+        """
+            Method that returns a line of the file as a view of the mapping. Negative numbers count from the end.
+
+        :param number: Line number, starting at 0.
+        :return: [Memoryview] Line.
+        :raises IndexError: If the file has no such line.
+        """
+        index = self._get_index()
+        lines = len(index) - 1
+        if not -lines <= number < lines:
+            raise IndexError(f"Line {number} out of range - lines: {lines}")
+        number = number % lines
+        return self.buffer[index[number] : index[number + 1]]
+
+    def _get_index(self) -> array:
+        """
+            Method that returns the offset of the start of each line, followed by the size of the file.
+        It is built on the first call.
+
+        :return: [Array] Offsets of the lines.
+        """
+        if self._index is None:
+            index = array("q", [0])
+            size = len(self.buffer)
+            position = self._mmap.find(b"\n") if size else -1
+            while position >= 0:
+                index.append(position + 1)
+                position = self._mmap.find(b"\n", position + 1)
+            if index[-1] != size:
+                index.append(size)
+            self._index = index
+        return self._index
+
+    def close(self) -> None:
+        """
+        Method that closes the mapping of the file.
+        """
+        self.buffer.release()
+        if self._mmap is not None:
+            self._mmap.close()
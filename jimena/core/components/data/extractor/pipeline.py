@@ -0,0 +1,175 @@
+""" This module contains the pipeline that extracts the data of many files in parallel """
+
+import glob
+import os
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import partial
+from itertools import islice
+
+from jimena.core.components.data.extractor.core import DataExtractorCore
+from jimena.core.components.tools.system import ResourcesTools
+
+
+def _extract_file(pipeline_class: type, settings: dict, path: str):
+    """
+    Extracts the data of a file with a pipeline of pipeline_class built with settings. It is a module function, so
+    it can be sent to the worker processes, which build their own pipeline since its logger can not be sent.
+    """
+    return pipeline_class(**settings).extract_file(path)
+
+
+class DataExtractorPipeline(DataExtractorCore, ResourcesTools):
+    """
+    Pipeline that extracts the data of the files of a folder or a glob pattern in parallel
+
+    Each file is parsed with the extractor of its extension (generic_extractor by default) on a pool of threads,
+    or of processes for CPU-bound parsing, sized by the available memory. The worker processes build a pipeline of
+    the same class with the arguments of get_settings. The results are yielded while they are ready, in completion
+    or input order, and only a bounded number of files is in flight at a time.
+    """
+
+    EXTRACTORS = {
+        ".csv": "csv_extractor",
+        ".json": "json_extractor",
+        ".jsonl": "json_lines_extractor",
+        ".ndjson": "json_lines_extractor",
+    }
+    IN_FLIGHT_BY_WORKER = 2  # files submitted ahead by worker
+
+    def __init__(self, threaded_decompression: bool = False):
+        super().__init__(threaded_decompression=threaded_decompression)
+
+    def get_settings(self) -> dict:
+        """
+        Returns the arguments that build a pipeline like this one in the worker processes. Subclasses with other
+        arguments extend it.
+        :return: The arguments of the pipeline.
+        :rtype: dict
+        """
+        return {"threaded_decompression": self.threaded_decompression}
+
+    def get_source_files(self, source: str) -> list:
+        """
+        Returns the files of a folder, including its subfolders, or the files matching a glob pattern.
+        :param source: The folder path or the glob pattern ("**" matches any subfolder).
+        :type source: str
+        :return: The file paths, sorted.
+        :rtype: list of str
+        """
+        if os.path.isdir(source):
+            return sorted(self.get_files_in_local_folder(source))
+        return sorted(
+            path for path in glob.glob(source, recursive=True) if os.path.isfile(path)
+        )
+
+    def extract_file(self, path: str):
+        """
+        Extracts the data of a file with the extractor of its extension, ignoring the compression extension. The
+        streaming extractors are consumed, so the result can be sent between processes.
+        :param path: The file path from which data will be extracted.
+        :type path: str
+        :return: The data extracted from the file.
+        :rtype: dict or list
+        """
+        root, extension = os.path.splitext(path)
+        if extension.lower() in self.COMPRESSIONS:
+            extension = os.path.splitext(root)[1]
+        extension = extension.lower()
+        extractor = getattr(self, self.EXTRACTORS.get(extension, "generic_extractor"))
+        data = extractor(path)
+        return list(data) if isinstance(data, Iterator) else data
+
+    def get_max_workers(
+        self, files: int, processes: bool = False, memory_thread: int = 500
+    ) -> int:
+        """
+        Returns the size of the pool: the workers that fit in the available memory, limited to the CPU cores for
+        processes and to the number of files.
+        :param files: Number of files to extract.
+        :type files: int
+        :param processes: If True, the pool is of processes.
+        :type processes: bool
+        :param memory_thread: Amount of memory (in MB) desired to allocate per worker.
+        :type memory_thread: int
+        :return: Number of workers, at least 1.
+        :rtype: int
+        """
+        workers = self.max_threads_by_memory(memory_thread=memory_thread)
+        if processes:
+            workers = min(workers, os.cpu_count() or 1)
+        return max(1, min(workers, files))
+
+    def extract(
+        self,
+        source: str,
+        ordered: bool = False,
+        processes: bool = False,
+        max_workers: int = None,
+        memory_thread: int = 500,
+        skip_errors: bool = False,
+    ):
+        """
+        Extracts the data of the files of a folder or a glob pattern in parallel, yielding each file path with
+        its data while they are ready.
+        :param source: The folder path or the glob pattern ("**" matches any subfolder).
+        :type source: str
+        :param ordered: If True, the results are yielded in the order of the file paths, otherwise as they complete.
+        :type ordered: bool
+        :param processes: If True, the files are parsed on a pool of processes instead of threads.
+        :type processes: bool
+        :param max_workers: Size of the pool. By default it is computed by get_max_workers.
+        :type max_workers: int
+        :param memory_thread: Amount of memory (in MB) desired to allocate per worker.
+        :type memory_thread: int
+        :param skip_errors: If True, the files that can not be extracted are logged and skipped.
+        :type skip_errors: bool
+        :return: Pairs (path, data).
+        :rtype: generator of tuples
+        :raises Exception: The error of the first file that can not be extracted, unless skip_errors is True.
+        """
+        paths = self.get_source_files(source)
+        workers = max_workers or self.get_max_workers(
+            len(paths), processes=processes, memory_thread=memory_thread
+        )
+        if processes:
+            # Imported on use, since it imports multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            executor = ProcessPoolExecutor(max_workers=workers)
+            extract_file = partial(_extract_file, type(self), self.get_settings())
+        else:
+            executor = ThreadPoolExecutor(max_workers=workers)
+            extract_file = self.extract_file
+        pending_paths = iter(paths)
+        futures = {}
+        pending = deque()
+        try:
+            while True:
+                for path in islice(
+                    pending_paths, workers * self.IN_FLIGHT_BY_WORKER - len(futures)
+                ):
+                    future = executor.submit(extract_file, path)
+                    futures[future] = path
+                    if ordered:
+                        pending.append(future)
+                if not futures:
+                    break
+                if ordered:
+                    done = [pending.popleft()]
+                else:
+                    done = wait(futures, return_when=FIRST_COMPLETED).done
+                for future in done:
+                    path = futures.pop(future)
+                    try:
+                        data = future.result()
+                    except Exception as e:
+                        # The error is already logged by the extractor
+                        if not skip_errors:
+                            raise e
+                        self.logger.warning(f"Skipped file: {path} - msg: {e}")
+                        continue
+                    yield path, data
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
@@ -264,6 +264,57 @@ class SystemTools(JCore):
             self.logger.error(f"Unrecognized error - msg: {e} type: {type(e)}")
             raise e
 
+    def check_private_path(self, path: Union[str, Path]) -> None:
+        """
+        Check that a path is owned by the current user and, if it is a folder, that other users can not access it.
+
+        Files that are unpickled, like the caches, must only be writable by the current user, since unpickling runs
+        the code chosen by whoever wrote them, so this method is called before reading them. The check is skipped
+        on platforms without user ids.
+
+        :param path: The path to be checked.
+        :type path: Union[str, Path]
+        :raises PermissionError: If the path is owned by another user or the folder can be accessed by others.
+        """
+        if not hasattr(os, "getuid"):
+            return
+        stat = os.stat(path)
+        if stat.st_uid != os.getuid():
+            raise PermissionError(
+                f"{path} is not owned by the current user - owner uid: {stat.st_uid}"
+            )
+        if os.path.isdir(path) and stat.st_mode & 0o077:
+            raise PermissionError(
+                f"{path} can be accessed by other users - mode: {oct(stat.st_mode)}"
+            )
+
+    def get_user_cache_folder_path(self, name: str) -> str:
+        """
+        Returns a private cache folder of the current user, creating it if it does not exist.
+
+        The folder is $XDG_CACHE_HOME/jimena-core/<name>, or ~/.cache/jimena-core/<name>, and it is created with
+        mode 0o700, so the cached data can not be read or replaced by other users.
+
+        :param name: The name of the cache folder.
+        :type name: str
+        :return: The path of the folder.
+        :rtype: str
+        :raises PermissionError: If the folder is owned by another user or the folder can be accessed by others.
+        """
+        try:
+            base_path = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+                os.path.expanduser("~"), ".cache"
+            )
+            folder_path = base_path
+            for folder in ["jimena-core", name]:
+                folder_path = os.path.join(folder_path, folder)
+                os.makedirs(folder_path, mode=0o700, exist_ok=True)
+                self.check_private_path(folder_path)
+            return folder_path
+        except Exception as e:
+            self.logger.error(f"Unrecognized error - msg: {e} type: {type(e)}")
+            raise e
+
 
 class ResourcesTools(SystemTools):
     """
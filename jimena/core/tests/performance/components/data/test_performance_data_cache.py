@@ -0,0 +1,248 @@
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+import tracemalloc
+from unittest import TestCase
+
+from jimena.core.components.data.cache.local import (
+    CacheEntry,
+    InMemoryCacheEngine,
+    LRUCacheEngine,
+    ShardedCacheEngine,
+)
+from jimena.core.components.data.cache.disk import DiskCacheEngine
+from jimena.core.components.data.cache.shared import SharedMemoryCacheEngine
+from jimena.core.components.handler.logging import LoggingHandlerCore
+
+
+def func_get_latency(engine, keys: int, operations: int, queue) -> None:
+    """
+    Reads keys of the engine in a worker process, once to warm it up and then measuring, and puts the mean latency
+    by hit (in seconds) in queue.
+    """
+    for i in range(keys):
+        engine.get(i)
+    initial_time = time.perf_counter()
+    hits = sum(engine.get(i % keys) is not None for i in range(operations))
+    queue.put((time.perf_counter() - initial_time) / operations if hits else None)
+
+
+class TestPerformanceDataCache(TestCase):
+    """
+    Performance tests for the local cache engines.
+
+    This test class measures the throughput of the local cache engines and logs the results, so they can be compared
+    between engines and changes. The assertions only check that the workloads complete correctly.
+    """
+
+    THREADS = [1, 2, 4, 8, 16, 32]
+    OPERATIONS_BY_THREAD = 2000
+    KEYS = 1000
+    PROCESSES = [1, 2, 4]
+    # Number of entries of the memory benchmarks, e.g. JIMENA_BENCHMARK_ENTRIES="100000"
+    ENTRIES = [
+        int(entries)
+        for entries in os.environ.get(
+            "JIMENA_BENCHMARK_ENTRIES", "100000,1000000"
+        ).split(",")
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.logger = LoggingHandlerCore().get_logger()
+
+    def setUp(self) -> None:
+        """
+        Set up method called before each test case execution.
+        """
+        super().setUp()
+
+    def tearDown(self) -> None:
+        """
+        Set up method called after each test case execution.
+        """
+        pass
+
+    def _throughput(self, engine, threads: int) -> float:
+        """
+        Runs a mixed workload (one set every four operations) on several threads and returns the operations per
+        second.
+        """
+        barrier = threading.Barrier(threads + 1)
+
+        def func_worker(worker):
+            barrier.wait()
+            for i in range(self.OPERATIONS_BY_THREAD):
+                key = (worker * 7919 + i) % self.KEYS
+                if i % 4 == 0:
+                    engine.set(key, i, size=self.KEYS)
+                else:
+                    engine.get(key)
+
+        workers = [
+            threading.Thread(target=func_worker, args=(i,)) for i in range(threads)
+        ]
+        for worker in workers:
+            worker.start()
+        barrier.wait()
+        initial_time = time.perf_counter()
+        for worker in workers:
+            worker.join()
+        final_time = time.perf_counter()
+        return threads * self.OPERATIONS_BY_THREAD / (final_time - initial_time)
+
+    def test_performance_data_cache_single_lock_vs_sharded_contention(self):
+        results = []
+        for threads in self.THREADS:
+            single_lock = self._throughput(LRUCacheEngine(), threads)
+            sharded = self._throughput(ShardedCacheEngine(), threads)
+            results.append((threads, single_lock, sharded))
+            self.logger.info(
+                f"Threads: {threads} - Single lock: {single_lock:,.0f} ops/s - "
+                f"Sharded: {sharded:,.0f} ops/s - Ratio: {sharded / single_lock:.2f}"
+            )
+        self.assertEqual(len(self.THREADS), len(results))
+        self.assertTrue(all(r[1] > 0 and r[2] > 0 for r in results))
+
+    @staticmethod
+    def _bytes_by_entry(factory, entries: int) -> float:
+        """
+        Returns the bytes allocated by each object built with factory, measured with tracemalloc.
+        """
+        tracemalloc.start()
+        objects = [factory(float(i), i) for i in range(entries)]
+        allocated, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return (allocated - objects.__sizeof__()) / len(objects)
+
+    @staticmethod
+    def _time_by_entry(factory, read, entries: int) -> tuple:
+        """
+        Returns the time (in seconds) of setting and of getting each entry built with factory in a mapping, with
+        the steps of the local engines: build and store the entry, then check its timeout and read its value with
+        read.
+        """
+        cache = {}
+        timeout = time.time() + 300
+        initial_time = time.perf_counter()
+        for i in range(entries):
+            cache[i] = factory(timeout, i)
+        set_time = time.perf_counter() - initial_time
+        initial_time = time.perf_counter()
+        now = time.time()
+        for i in range(entries):
+            entry = cache.get(i)
+            read(entry, now)
+        get_time = time.perf_counter() - initial_time
+        return set_time / entries, get_time / entries
+
+    def test_performance_data_cache_entry_representation(self):
+        for entries in self.ENTRIES:
+            representations = {
+                "dict": (
+                    lambda timeout, value: {"timeout": timeout, "value": value},
+                    lambda entry, now: (
+                        entry["value"] if entry["timeout"] > now else None
+                    ),
+                ),
+                "slots": (
+                    CacheEntry,
+                    lambda entry, now: entry.value if entry.timeout > now else None,
+                ),
+            }
+            results = {}
+            for name, (factory, read) in representations.items():
+                results[name] = (
+                    self._bytes_by_entry(factory, entries),
+                    *self._time_by_entry(factory, read, entries),
+                )
+            engine = InMemoryCacheEngine()
+            initial_time = time.perf_counter()
+            for i in range(entries):
+                engine.set(i, i, size=entries)
+            set_time = time.perf_counter() - initial_time
+            initial_time = time.perf_counter()
+            for i in range(entries):
+                engine.get(i)
+            get_time = time.perf_counter() - initial_time
+            for name, (entry_bytes, entry_set_time, entry_get_time) in results.items():
+                self.logger.info(
+                    f"Entries: {entries} - {name}: {entry_bytes:.0f} bytes by entry - "
+                    f"Set: {entry_set_time * 1e9:.0f} ns/op - "
+                    f"Get: {entry_get_time * 1e9:.0f} ns/op"
+                )
+            self.logger.info(
+                f"Entries: {entries} - InMemoryCacheEngine with slots - "
+                f"Set: {set_time / entries * 1e9:.0f} ns/op - "
+                f"Get: {get_time / entries * 1e9:.0f} ns/op"
+            )
+            self.assertLess(results["slots"][0], results["dict"][0])
+            self.assertEqual(entries, engine.stats()["hits"])
+
+    def test_performance_data_cache_bulk_vs_single_key(self):
+        for entries in self.ENTRIES:
+            mapping = {i: i for i in range(entries)}
+            single = InMemoryCacheEngine()
+            initial_time = time.perf_counter()
+            for key, value in mapping.items():
+                single.set(key, value, size=entries)
+            for key in mapping:
+                single.get(key)
+            single_time = time.perf_counter() - initial_time
+            bulk = InMemoryCacheEngine()
+            initial_time = time.perf_counter()
+            bulk.set_many(mapping, size=entries)
+            result = bulk.get_many(mapping)
+            bulk_time = time.perf_counter() - initial_time
+            self.logger.info(
+                f"Entries: {entries} - Single key: {single_time * 1e3:.1f} ms - "
+                f"Bulk: {bulk_time * 1e3:.1f} ms - Ratio: {single_time / bulk_time:.2f}"
+            )
+            self.assertEqual(mapping, result)
+
+    def _cross_process_latency(self, engine, processes: int) -> float:
+        """
+        Fills the engine in this process, reads it from several worker processes and returns the mean latency by
+        hit (in seconds).
+        """
+        for i in range(self.KEYS):
+            engine.set(i, {"id": i, "name": f"name-{i}"}, size=self.KEYS)
+        context = multiprocessing.get_context()
+        queue = context.Queue()
+        workers = [
+            context.Process(
+                target=func_get_latency,
+                args=(engine, self.KEYS, self.OPERATIONS_BY_THREAD, queue),
+            )
+            for _ in range(processes)
+        ]
+        for worker in workers:
+            worker.start()
+        latencies = [queue.get(timeout=120) for _ in workers]
+        for worker in workers:
+            worker.join()
+        self.assertNotIn(None, latencies)
+        return sum(latencies) / len(latencies)
+
+    def test_performance_data_cache_shared_memory_cross_process_hit_latency(self):
+        with tempfile.TemporaryDirectory() as folder:
+            for processes in self.PROCESSES:
+                shared = SharedMemoryCacheEngine(
+                    name=f"jimena-core-benchmark-{os.getpid()}", size=self.KEYS
+                )
+                disk = DiskCacheEngine(path=os.path.join(folder, f"{processes}.sqlite"))
+                try:
+                    shared_latency = self._cross_process_latency(shared, processes)
+                    disk_latency = self._cross_process_latency(disk, processes)
+                finally:
+                    shared.close()
+                    shared.unlink()
+                    disk.close()
+                self.logger.info(
+                    f"Processes: {processes} - Hit latency: "
+                    f"shared memory {shared_latency * 1e6:.1f} us - "
+                    f"disk {disk_latency * 1e6:.1f} us"
+                )
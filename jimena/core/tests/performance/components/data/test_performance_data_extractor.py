@@ -0,0 +1,160 @@
+import bz2
+import gzip
+import importlib
+import importlib.util
+import lzma
+import os
+import tempfile
+import time
+import tracemalloc
+import unittest
+from unittest import TestCase
+
+from jimena.core.components.data.extractor.basic import DataExtractorPandas
+from jimena.core.components.data.extractor.cache import DataExtractorCache
+from jimena.core.components.data.extractor.core import DataExtractorCore
+from jimena.core.components.handler.logging import LoggingHandlerCore
+
+
+class TestPerformanceDataExtractor(TestCase):
+    """
+    Performance tests for the data extractors.
+
+    This test class measures the time and memory of the extractors on generated files and logs the results, so they
+    can be compared between extractors and changes.
+    """
+
+    # Number of rows of the generated files, e.g. JIMENA_BENCHMARK_ROWS="200000,2000000"
+    ROWS = [
+        int(rows)
+        for rows in os.environ.get("JIMENA_BENCHMARK_ROWS", "200000").split(",")
+    ]
+    CHUNK_ROWS = 10000
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.logger = LoggingHandlerCore().get_logger()
+
+    def setUp(self) -> None:
+        """
+        Set up method called before each test case execution.
+        """
+        super().setUp()
+        self.folder = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        """
+        Set up method called after each test case execution.
+        """
+        self.folder.cleanup()
+
+    def _write_csv(self, rows: int) -> str:
+        """
+        Writes a CSV file with rows of an int, a float and a str column and returns its path.
+        """
+        path = os.path.join(self.folder.name, f"rows_{rows}.csv")
+        with open(path, "w") as file:
+            file.write("id,price,name\n")
+            file.writelines(f"{i},{i * 0.25},name-{i % 1000}\n" for i in range(rows))
+        return path
+
+    @staticmethod
+    def _measure(function) -> tuple:
+        """
+        Returns the result of function with its time (in seconds) and its peak of memory (in bytes), measured with
+        tracemalloc.
+        """
+        tracemalloc.start()
+        initial_time = time.perf_counter()
+        result = function()
+        final_time = time.perf_counter()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return result, final_time - initial_time, peak
+
+    @unittest.skipUnless(importlib.util.find_spec("pandas"), "pandas is not installed")
+    def test_performance_data_extractor_pandas_chunks_peak_memory(self):
+        extractor = DataExtractorPandas()
+        # Imported before measuring, since pandas is imported on the first extraction
+        extractor.get_pandas()
+        for rows in self.ROWS:
+            path = self._write_csv(rows)
+            full, full_time, full_peak = self._measure(
+                lambda: extractor.csv(path)["price"].sum()
+            )
+            chunked, chunked_time, chunked_peak = self._measure(
+                lambda: sum(
+                    extractor.csv_chunks(
+                        path,
+                        chunk_size=self.CHUNK_ROWS,
+                        transform=lambda chunk: chunk["price"].sum(),
+                    )
+                )
+            )
+            self.logger.info(
+                f"Rows: {rows} - "
+                f"Full: {full_time:.3f} s {full_peak / 1024 ** 2:.1f} MB - "
+                f"Chunks of {self.CHUNK_ROWS}: {chunked_time:.3f} s "
+                f"{chunked_peak / 1024 ** 2:.1f} MB"
+            )
+            self.assertAlmostEqual(full, chunked, places=3)
+            self.assertLess(chunked_peak, full_peak)
+
+    def _write_compressed(self, path: str) -> dict:
+        """
+        Writes copies of the file compressed with each codec and returns their paths by codec.
+        """
+        modules = {"gzip": gzip, "bz2": bz2, "xz": lzma}
+        if importlib.util.find_spec("zstandard"):
+            modules["zstd"] = importlib.import_module("zstandard")
+        extensions = {"gzip": ".gz", "bz2": ".bz2", "xz": ".xz", "zstd": ".zst"}
+        paths = {}
+        with open(path, "rb") as source:
+            data = source.read()
+        for codec, module in modules.items():
+            paths[codec] = path + extensions[codec]
+            with module.open(paths[codec], "wb") as file:
+                file.write(data)
+        return paths
+
+    def test_performance_data_extractor_compressed_throughput(self):
+        for rows in self.ROWS:
+            path = self._write_csv(rows)
+            size = os.path.getsize(path)
+            sources = {"plain": path, **self._write_compressed(path)}
+            for codec, source in sources.items():
+                for threaded in (False, True) if codec != "plain" else (False,):
+                    extractor = DataExtractorCore(threaded_decompression=threaded)
+                    initial_time = time.perf_counter()
+                    result = sum(
+                        len(batch)
+                        for batch in extractor.csv_stream_extractor(
+                            source, batch_size=self.CHUNK_ROWS, header=True
+                        )
+                    )
+                    final_time = time.perf_counter()
+                    self.logger.info(
+                        f"Rows: {rows} - {codec}{' threaded' if threaded else ''}: "
+                        f"{os.path.getsize(source) / 1024 ** 2:.1f} MB - "
+                        f"{size / 1024 ** 2 / (final_time - initial_time):.1f} MB/s"
+                    )
+                    self.assertEqual(rows, result)
+
+    def test_performance_data_extractor_cache_rerun(self):
+        output = "arrow" if importlib.util.find_spec("pyarrow") else "python"
+        for rows in self.ROWS:
+            path = self._write_csv(rows)
+            extractor = DataExtractorCache(
+                folder=os.path.join(self.folder.name, "cache")
+            )
+            timings = []
+            for _ in range(2):
+                initial_time = time.perf_counter()
+                extractor.extract(path, "csv_columnar_extractor", output=output)
+                timings.append(time.perf_counter() - initial_time)
+            self.logger.info(
+                f"Rows: {rows} - Columnar {output} - "
+                f"Parsed and cached: {timings[0]:.3f} s - Cached: {timings[1]:.4f} s"
+            )
+            self.assertLess(timings[1], timings[0])
@@ -0,0 +1,78 @@
+import os
+import subprocess
+import sys
+from unittest import TestCase
+
+from jimena.core.components.handler.logging import LoggingHandlerCore
+
+
+class TestPerformanceImport(TestCase):
+    """
+    Performance tests for the import time of the package.
+
+    This test class measures with 'python -X importtime' the time needed to import the modules of the package in a
+    new interpreter, as short-lived processes do, and logs the results. The assertions check that no heavy optional
+    dependency is imported on import and that the import time is under a budget.
+    """
+
+    MODULES = [
+        "jimena.core",
+        "jimena.core.components.data.cache.local",
+        "jimena.core.components.data.extractor.core",
+        "jimena.core.components.data.extractor.basic",
+        "jimena.core.components.data.extractor.pipeline",
+    ]
+    HEAVY_MODULES = ["pandas", "numpy", "pyarrow"]
+    # Budget (in milliseconds) of the cumulative import time of each module, e.g. JIMENA_IMPORT_BUDGET_MS="200"
+    BUDGET_MS = float(os.environ.get("JIMENA_IMPORT_BUDGET_MS", "500"))
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.logger = LoggingHandlerCore().get_logger()
+
+    def setUp(self) -> None:
+        """
+        Set up method called before each test case execution.
+        """
+        super().setUp()
+
+    def tearDown(self) -> None:
+        """
+        Set up method called after each test case execution.
+        """
+        pass
+
+    @staticmethod
+    def _import_times(module: str) -> dict:
+        """
+        Imports a module in a new interpreter with -X importtime and returns the cumulative import time (in
+        microseconds) of every module imported.
+        """
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        )
+        times = {}
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "cumulative" in line:
+                continue
+            _, cumulative, name = line.split("|")
+            times[name.strip()] = int(cumulative)
+        return times
+
+    def test_performance_import_time(self):
+        for module in self.MODULES:
+            times = self._import_times(module)
+            self.logger.info(
+                f"Module: {module} - Import time: {times[module] / 1000:.1f} ms - "
+                f"Modules imported: {len(times)}"
+            )
+            self.assertEqual(
+                [],
+                [name for name in times if name.split(".")[0] in self.HEAVY_MODULES],
+            )
+            self.assertLess(times[module] / 1000, self.BUDGET_MS)
@@ -0,0 +1,805 @@
+import random
+import sys
+import threading
+import time
+from unittest import TestCase, mock
+
+from jimena.core.components.data.cache.local import (
+    CacheRegistry,
+    CacheStatsReporter,
+    CacheSweeper,
+    InMemoryCacheEngine,
+    LRUCacheEngine,
+    MemoryBoundedCacheEngine,
+    ShardedCacheEngine,
+    SingleFlight,
+    ThreadCacheEngine,
+    TieredCacheEngine,
+    bytes_sizeof,
+    dataframe_sizeof,
+    deep_sizeof,
+    in_memory_local_cache,
+    make_cache_key,
+    thread_local_cache,
+)
+
+
+class TestUnitDataCache(TestCase):
+    """
+    Unit tests for the local cache engines.
+
+    This test class is designed to validate the functionality of the local cache engines.
+    It contains individual test methods, each focusing on different aspects of the engines' behavior.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self) -> None:
+        """
+        Set up method called before each test case execution.
+        """
+        super().setUp()
+        self.key = "key"
+        self.value = {"color": "Red", "fruit": "Apple", "size": "Large"}
+        self.size = 3
+
+    def tearDown(self) -> None:
+        """
+        Set up method called after each test case execution.
+        """
+        CacheRegistry.clear()
+        ThreadCacheEngine().clear()
+
+    @staticmethod
+    def _hit_ratio(engine, size: int) -> float:
+        """
+        Warms the engine with cold keys and then replays a deterministic skewed workload (80% of the reads over
+        20% of the keys), returning the hit ratio.
+        """
+        generator = random.Random(30)
+        hot_keys = [f"hot-{i}" for i in range(20)]
+        cold_keys = [f"cold-{i}" for i in range(80)]
+        for key in cold_keys:
+            engine.set(key, key, size=size)
+        hits = 0
+        reads = 5000
+        for _ in range(reads):
+            if generator.random() < 0.8:
+                key = generator.choice(hot_keys)
+            else:
+                key = generator.choice(cold_keys)
+            if engine.exists(key):
+                engine.get(key)
+                hits += 1
+            else:
+                engine.set(key, key, size=size)
+        return hits / reads
+
+    def test_unit_data_cache_lru_get_valid_key(self):
+        engine = LRUCacheEngine()
+        engine.set(self.key, self.value)
+        self.assertEqual(self.value, engine.get(self.key))
+        self.assertTrue(engine.exists(self.key))
+
+    def test_unit_data_cache_lru_get_invalid_key(self):
+        engine = LRUCacheEngine()
+        self.assertIsNone(engine.get(self.key))
+        self.assertFalse(engine.exists(self.key))
+
+    def test_unit_data_cache_lru_get_expired_key(self):
+        engine = LRUCacheEngine()
+        engine.set(self.key, self.value, timeout=-1)
+        self.assertIsNone(engine.get(self.key))
+        self.assertNotIn(self.key, engine.memory_cache)
+
+    def test_unit_data_cache_lru_set_evicts_least_recently_used(self):
+        engine = LRUCacheEngine()
+        for key in ["a", "b", "c"]:
+            engine.set(key, key, size=self.size)
+        engine.get("a")
+        engine.set("d", "d", size=self.size)
+        self.assertEqual(self.size, len(engine.memory_cache))
+        self.assertTrue(engine.exists("a"))
+        self.assertFalse(engine.exists("b"))
+        self.assertTrue(engine.exists("d"))
+
+    def test_unit_data_cache_lru_delete_and_clear(self):
+        engine = LRUCacheEngine()
+        engine.set(self.key, self.value)
+        engine.delete(self.key)
+        self.assertFalse(engine.exists(self.key))
+        engine.set(self.key, self.value)
+        engine.clear()
+        self.assertEqual(0, len(engine.memory_cache))
+
+    def test_unit_data_cache_lru_hit_ratio_skewed_workload(self):
+        lru_hit_ratio = self._hit_ratio(LRUCacheEngine(), size=25)
+        in_memory_hit_ratio = self._hit_ratio(InMemoryCacheEngine(), size=25)
+        self.assertGreater(lru_hit_ratio, in_memory_hit_ratio)
+
+    def test_unit_data_cache_registry_get_engine_same_name(self):
+        engine = CacheRegistry.get_engine("registry")
+        self.assertIsInstance(engine, LRUCacheEngine)
+        self.assertIs(engine, CacheRegistry.get_engine("registry"))
+        self.assertIsNot(engine, CacheRegistry.get_engine("other"))
+
+    def test_unit_data_cache_registry_get_engine_class(self):
+        engine = CacheRegistry.get_engine("sharded", engine_class=ShardedCacheEngine)
+        self.assertIsInstance(engine, ShardedCacheEngine)
+        CacheRegistry.remove_engine("sharded")
+        self.assertNotIsInstance(
+            CacheRegistry.get_engine("sharded"), ShardedCacheEngine
+        )
+
+    def test_unit_data_cache_in_memory_local_cache_hit(self):
+        calls = []
+
+        @in_memory_local_cache(key=self.key)
+        def func_value():
+            calls.append(1)
+            return self.value
+
+        self.assertEqual(self.value, func_value())
+        self.assertEqual(self.value, func_value())
+        self.assertEqual(1, len(calls))
+        self.assertEqual(self.value, func_value.cache_engine.get(self.key))
+
+    def test_unit_data_cache_in_memory_local_cache_full(self):
+        calls = []
+
+        @in_memory_local_cache(size=2)
+        def func_value(number):
+            calls.append(number)
+            return number
+
+        for number in [1, 2, 3, 4, 3]:
+            func_value(number)
+        # The least recently used value is evicted, not the last computed one
+        self.assertEqual([1, 2, 3, 4], calls)
+
+    def test_unit_data_cache_in_memory_local_cache_sizes(self):
+        calls = []
+
+        @in_memory_local_cache(size=100)
+        def func_first(number):
+            calls.append(number)
+            return number
+
+        @in_memory_local_cache(size=2)
+        def func_second(number):
+            calls.append(-number)
+            return -number
+
+        for number in range(50):
+            func_first(number)
+        func_second(1)
+        func_second(2)
+        func_second(3)
+        for number in range(50):
+            func_first(number)
+        # The size of func_second only bounds its own engine
+        self.assertEqual(list(range(50)) + [-1, -2, -3], calls)
+        self.assertEqual(0, func_first.cache_engine.stats()["evictions"])
+        self.assertEqual(1, func_second.cache_engine.stats()["evictions"])
+        with self.assertRaises(ValueError):
+            in_memory_local_cache(size=2, name="shared")
+
+    def test_unit_data_cache_thread_local_cache_hit(self):
+        calls = []
+
+        @thread_local_cache(key=self.key)
+        def func_value():
+            calls.append(1)
+            return self.value
+
+        self.assertEqual(self.value, func_value())
+        self.assertEqual(self.value, func_value())
+        self.assertEqual(1, len(calls))
+
+    def test_unit_data_cache_make_cache_key_arguments(self):
+        def func_value(number1, number2=0):
+            return number1 + number2
+
+        key = make_cache_key(func_value, (1,), {"number2": 2})
+        self.assertEqual(key, make_cache_key(func_value, (1,), {"number2": 2}))
+        self.assertNotEqual(key, make_cache_key(func_value, (1,), {"number2": 3}))
+        self.assertIn(func_value.__qualname__, key[0])
+
+    def test_unit_data_cache_make_cache_key_same_qualname(self):
+        def func_factory(number, name=None):
+            @in_memory_local_cache(name=name)
+            def func_value():
+                return number
+
+            return func_value
+
+        self.assertEqual(1, func_factory(1, "factory")())
+        self.assertEqual(2, func_factory(2, "factory")())
+        self.assertEqual(1, func_factory(1)())
+        self.assertEqual(2, func_factory(2)())
+        first, second = func_factory(1), func_factory(2)
+        self.assertNotEqual(
+            make_cache_key(first.__wrapped__, (), {}),
+            make_cache_key(second.__wrapped__, (), {}),
+        )
+        self.assertEqual(
+            make_cache_key(first.__wrapped__, (), {}),
+            make_cache_key(first.__wrapped__, (), {}),
+        )
+
+    def test_unit_data_cache_make_cache_key_typed(self):
+        def func_value(number):
+            return number
+
+        self.assertEqual(
+            make_cache_key(func_value, (3,), {}), make_cache_key(func_value, (3.0,), {})
+        )
+        self.assertNotEqual(
+            make_cache_key(func_value, (3,), {}, typed=True),
+            make_cache_key(func_value, (3.0,), {}, typed=True),
+        )
+
+    def test_unit_data_cache_make_cache_key_unhashable(self):
+        with self.assertRaises(TypeError):
+            make_cache_key(len, ([1, 2],), {})
+
+    def test_unit_data_cache_in_memory_local_cache_arguments(self):
+        calls = []
+
+        @in_memory_local_cache()
+        def func_sum(number1, number2):
+            calls.append(1)
+            return number1 + number2
+
+        self.assertEqual(3, func_sum(1, 2))
+        self.assertEqual(5, func_sum(2, 3))
+        self.assertEqual(3, func_sum(1, 2))
+        self.assertEqual(2, len(calls))
+
+    def test_unit_data_cache_in_memory_local_cache_key_function(self):
+        calls = []
+
+        @in_memory_local_cache(key_function=lambda row_id, **kwargs: row_id)
+        def func_row(row_id, verbose=False):
+            calls.append(1)
+            return {"id": row_id}
+
+        self.assertEqual({"id": 1}, func_row(1))
+        self.assertEqual({"id": 1}, func_row(1, verbose=True))
+        self.assertEqual(1, len(calls))
+        self.assertTrue(func_row.cache_engine.exists(1))
+
+    def test_unit_data_cache_thread_local_cache_unhashable_arguments(self):
+        calls = []
+
+        @thread_local_cache()
+        def func_len(data):
+            calls.append(1)
+            return len(data)
+
+        self.assertEqual(2, func_len([1, 2]))
+        self.assertEqual(2, func_len([1, 2]))
+        self.assertEqual(2, len(calls))
+
+    def test_unit_data_cache_in_memory_sweep_expired(self):
+        engine = InMemoryCacheEngine()
+        engine.set("expired-1", 1, timeout=-1)
+        engine.set("expired-2", 2, timeout=-1)
+        engine.set(self.key, self.value)
+        self.assertEqual(1, len(engine.memory_cache))
+        self.assertEqual(2, engine.reaped)
+        self.assertEqual(0, engine.sweep_expired())
+        self.assertEqual(self.value, engine.get(self.key))
+
+    def test_unit_data_cache_in_memory_sweep_overwritten_key(self):
+        engine = InMemoryCacheEngine()
+        engine.set(self.key, 1, timeout=-1)
+        engine.set(self.key, self.value)
+        self.assertEqual(0, engine.sweep_expired())
+        self.assertEqual(self.value, engine.get(self.key))
+
+    def test_unit_data_cache_in_memory_expiry_index_rebuild(self):
+        engine = InMemoryCacheEngine()
+        for _ in range(500):
+            engine.set(self.key, self.value)
+        self.assertLessEqual(len(engine.expiry_index), 2 + 64)
+
+    def test_unit_data_cache_thread_sweep_expired(self):
+        engine = ThreadCacheEngine()
+        reaped = engine.reaped
+        engine.set("expired", 1, timeout=-1)
+        engine.set(self.key, self.value)
+        self.assertEqual(reaped + 1, engine.reaped)
+        self.assertFalse(engine.exists("expired"))
+        self.assertEqual(self.value, engine.get(self.key))
+
+    def test_unit_data_cache_sweeper(self):
+        engine = LRUCacheEngine()
+        engine.set(self.key, self.value, timeout=0.01)
+        sweeper = CacheSweeper(engine, interval=0.01)
+        sweeper.start()
+        try:
+            deadline = time.time() + 5
+            while engine.memory_cache and time.time() < deadline:
+                time.sleep(0.01)
+        finally:
+            sweeper.stop()
+        self.assertEqual(0, len(engine.memory_cache))
+        self.assertEqual(1, engine.reaped)
+        self.assertFalse(sweeper.is_alive())
+
+    def test_unit_data_cache_sharded_get_valid_key(self):
+        engine = ShardedCacheEngine(shards=4)
+        engine.set(self.key, self.value)
+        self.assertEqual(4, len(engine.shards))
+        self.assertEqual(self.value, engine.get(self.key))
+        self.assertTrue(engine.exists(self.key))
+        engine.delete(self.key)
+        self.assertIsNone(engine.get(self.key))
+
+    def test_unit_data_cache_sharded_size_regulator(self):
+        engine = ShardedCacheEngine(shards=4)
+        for i in range(100):
+            engine.set(i, i, size=20)
+        self.assertTrue(all(len(shard.memory_cache) <= 5 for shard in engine.shards))
+        engine.size_regulator(8)
+        self.assertLessEqual(sum(len(shard.memory_cache) for shard in engine.shards), 8)
+
+    def test_unit_data_cache_sharded_concurrent_threads(self):
+        engine = ShardedCacheEngine(shards=8)
+        errors = []
+
+        def func_worker(worker):
+            try:
+                for i in range(500):
+                    key = (worker, i % 50)
+                    engine.set(key, i, timeout=0.001 if i % 7 == 0 else None)
+                    engine.get(key)
+                    if i % 3 == 0:
+                        engine.delete(key)
+            except Exception as e:
+                errors.append(e)
+
+        workers = [threading.Thread(target=func_worker, args=(i,)) for i in range(8)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        self.assertEqual([], errors)
+        self.assertLessEqual(
+            sum(len(shard.memory_cache) for shard in engine.shards),
+            len(engine.shards) * engine._get_shard_size(None),
+        )
+
+    def test_unit_data_cache_in_memory_stats(self):
+        engine = InMemoryCacheEngine()
+        engine.set("expired", 1, timeout=-1)
+        engine.get("expired")
+        engine.set(self.key, self.value)
+        engine.get(self.key)
+        engine.get("missing")
+        for key in ["a", "b", "c", "d"]:
+            engine.set(key, key, size=self.size)
+        result = engine.stats()
+        self.assertEqual(1, result["hits"])
+        self.assertEqual(2, result["misses"])
+        self.assertEqual(1, result["expirations"])
+        self.assertEqual(1, result["evictions"])
+        self.assertEqual(len(engine.memory_cache), result["entries"])
+        self.assertGreater(result["bytes"], 0)
+
+    def test_unit_data_cache_stats_running_bytes(self):
+        for engine in [InMemoryCacheEngine(), LRUCacheEngine()]:
+            engine.set_many({key: key * 100 for key in "abcd"}, size=3)
+            engine.set("a", "a", size=3)
+            engine.set("expired", "expired", timeout=-1, size=10)
+            engine.delete("b")
+            engine.sweep_expired()
+            expected = sum(
+                sys.getsizeof(entry.value) for entry in engine.memory_cache.values()
+            )
+            self.assertEqual(expected, engine.stats()["bytes"], type(engine).__name__)
+            # The running total is used instead of visiting the entries
+            with mock.patch.object(sys, "getsizeof", side_effect=AssertionError):
+                self.assertEqual(expected, engine.stats()["bytes"])
+            engine.clear()
+            self.assertEqual(0, engine.stats()["bytes"])
+
+    def test_unit_data_cache_lru_stats(self):
+        engine = LRUCacheEngine()
+        for key in ["a", "b", "c", "d"]:
+            engine.set(key, key, size=self.size)
+        engine.get("d")
+        engine.get("a")
+        result = engine.stats()
+        self.assertEqual(1, result["hits"])
+        self.assertEqual(1, result["misses"])
+        self.assertEqual(1, result["evictions"])
+        self.assertEqual(self.size, result["entries"])
+
+    def test_unit_data_cache_sharded_stats(self):
+        engine = ShardedCacheEngine(shards=4)
+        for i in range(10):
+            engine.set(i, i)
+            engine.get(i)
+        engine.get("missing")
+        result = engine.stats()
+        self.assertEqual(10, result["hits"])
+        self.assertEqual(1, result["misses"])
+        self.assertEqual(10, result["entries"])
+        self.assertEqual(0, engine.reaped)
+
+    def test_unit_data_cache_thread_stats(self):
+        engine = ThreadCacheEngine()
+        hits = engine.stats()["hits"]
+        engine.set(self.key, self.value)
+        engine.get(self.key)
+        self.assertEqual(hits + 1, engine.stats()["hits"])
+        self.assertEqual(1, engine.stats()["entries"])
+
+    def test_unit_data_cache_stats_reporter(self):
+        engine = InMemoryCacheEngine()
+        engine.set(self.key, self.value)
+        reporter = CacheStatsReporter(engine, interval=0.01)
+        with self.assertLogs(reporter.logger, level="INFO") as logs:
+            reporter.task()
+        self.assertIn("'entries': 1", logs.output[0])
+
+    def test_unit_data_cache_deep_sizeof(self):
+        data = {"values": list(range(100))}
+        self.assertGreater(deep_sizeof(data), deep_sizeof({"values": []}))
+        self.assertGreater(deep_sizeof(self.value), len(self.value))
+
+    def test_unit_data_cache_bytes_sizeof(self):
+        self.assertEqual(4, bytes_sizeof(b"test"))
+        self.assertEqual(2, bytes_sizeof("ñ"))
+        self.assertEqual(10, bytes_sizeof(bytearray(10)))
+
+    def test_unit_data_cache_dataframe_sizeof(self):
+        class FrameLike:
+            def memory_usage(self, deep=False):
+                return 1024 if deep else 8
+
+        self.assertEqual(1024, dataframe_sizeof(FrameLike()))
+        self.assertEqual(deep_sizeof(self.value), dataframe_sizeof(self.value))
+
+    def test_unit_data_cache_memory_bounded_evicts_by_bytes(self):
+        engine = MemoryBoundedCacheEngine(max_bytes=250, sizer=bytes_sizeof)
+        for key in ["a", "b", "c"]:
+            engine.set(key, bytes(100))
+        self.assertFalse(engine.exists("a"))
+        self.assertTrue(engine.exists("b") and engine.exists("c"))
+        self.assertEqual(200, engine.total_bytes)
+        self.assertEqual(200, engine.stats()["bytes"])
+        self.assertEqual(1, engine.stats()["evictions"])
+
+    def test_unit_data_cache_memory_bounded_accounting(self):
+        engine = MemoryBoundedCacheEngine(max_bytes=1000, sizer=bytes_sizeof)
+        engine.set(self.key, bytes(100))
+        engine.set(self.key, bytes(50))
+        self.assertEqual(50, engine.total_bytes)
+        engine.set("expired", bytes(10), timeout=-1)
+        engine.set("other", bytes(20))
+        self.assertEqual(70, engine.total_bytes)
+        engine.delete(self.key)
+        self.assertEqual(20, engine.total_bytes)
+        engine.clear()
+        self.assertEqual(0, engine.total_bytes)
+
+    def test_unit_data_cache_memory_bounded_value_bigger_than_budget(self):
+        engine = MemoryBoundedCacheEngine(max_bytes=10, sizer=bytes_sizeof)
+        engine.set(self.key, bytes(100))
+        self.assertFalse(engine.exists(self.key))
+        self.assertEqual(0, engine.total_bytes)
+
+    def test_unit_data_cache_tiered_get_valid_key(self):
+        engine = TieredCacheEngine()
+        engine.set(self.key, self.value)
+        self.assertEqual(self.value, engine.get(self.key))
+        self.assertTrue(engine.exists(self.key))
+        self.assertIsNone(engine.get("missing"))
+        result = engine.stats()
+        self.assertEqual(1, result["l1_hits"])
+        self.assertEqual(0, result["l2_hits"])
+        self.assertEqual(1, result["misses"])
+        self.assertEqual(1, result["entries"])
+
+    def test_unit_data_cache_tiered_read_through_promotion(self):
+        engine = TieredCacheEngine()
+        engine.set(self.key, self.value)
+        results = []
+
+        def func_reader():
+            results.append(engine.get(self.key))
+            results.append(engine.get(self.key))
+
+        reader = threading.Thread(target=func_reader)
+        reader.start()
+        reader.join()
+        self.assertEqual([self.value, self.value], results)
+        result = engine.stats()
+        self.assertEqual(1, result["l2_hits"])
+        self.assertEqual(1, result["l1_hits"])
+        self.assertEqual(0.5, result["l1_hit_ratio"])
+        self.assertEqual(1.0, result["l2_hit_ratio"])
+
+    def test_unit_data_cache_tiered_write_invalidates_other_threads(self):
+        engine = TieredCacheEngine()
+        engine.set(self.key, 1)
+        step = threading.Barrier(2)
+        results = []
+
+        def func_reader():
+            results.append(engine.get(self.key))
+            step.wait()
+            step.wait()
+            results.append(engine.get(self.key))
+            step.wait()
+            step.wait()
+            results.append(engine.get(self.key))
+
+        reader = threading.Thread(target=func_reader)
+        reader.start()
+        step.wait()
+        engine.set(self.key, 2)
+        step.wait()
+        step.wait()
+        engine.delete(self.key)
+        step.wait()
+        reader.join()
+        self.assertEqual([1, 2, None], results)
+
+    def test_unit_data_cache_tiered_clear(self):
+        engine = TieredCacheEngine(l1_size=2)
+        for key in ["a", "b", "c"]:
+            engine.set(key, key)
+        self.assertEqual(2, len(engine._get_l1()))
+        engine.clear()
+        self.assertEqual(0, len(engine._get_l1()))
+        self.assertFalse(engine.exists("a"))
+
+    def _run_concurrently(self, function, threads: int = 8) -> list:
+        """
+        Calls a function at the same time from several threads and returns their results or exceptions.
+        """
+        barrier = threading.Barrier(threads)
+        results = []
+
+        def func_worker():
+            barrier.wait()
+            try:
+                results.append(function())
+            except Exception as e:
+                results.append(e)
+
+        workers = [threading.Thread(target=func_worker) for _ in range(threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        return results
+
+    def test_unit_data_cache_single_flight_exception(self):
+        flight = SingleFlight()
+        calls = []
+
+        def func_error():
+            calls.append(1)
+            time.sleep(0.1)
+            raise ValueError("error1")
+
+        results = self._run_concurrently(lambda: flight.do(self.key, func_error))
+        self.assertEqual(1, len(calls))
+        self.assertTrue(all(isinstance(r, ValueError) for r in results))
+        self.assertEqual({}, flight.calls)
+
+    def test_unit_data_cache_in_memory_local_cache_single_flight(self):
+        calls = []
+
+        @in_memory_local_cache(single_flight=True)
+        def func_row(row_id):
+            calls.append(row_id)
+            time.sleep(0.1)
+            return {"id": row_id}
+
+        results = self._run_concurrently(lambda: func_row(1))
+        self.assertEqual(1, len(calls))
+        self.assertEqual([{"id": 1}] * 8, results)
+
+    def test_unit_data_cache_thread_local_cache_single_flight(self):
+        calls = []
+
+        @thread_local_cache(single_flight=True)
+        def func_row(row_id):
+            calls.append(row_id)
+            time.sleep(0.1)
+            return {"id": row_id}
+
+        results = self._run_concurrently(lambda: (func_row(1), func_row(1)))
+        self.assertEqual(1, len(calls))
+        self.assertEqual([({"id": 1}, {"id": 1})] * 8, results)
+
+    def test_unit_data_cache_in_memory_local_cache_refresh_ahead(self):
+        calls = []
+
+        @in_memory_local_cache(timeout=10, refresh_after=0.05)
+        def func_version():
+            calls.append(1)
+            return len(calls)
+
+        self.assertEqual(1, func_version())
+        self.assertEqual(1, func_version())
+        time.sleep(0.1)
+        self.assertEqual(1, func_version())
+        deadline = time.time() + 5
+        while func_version() == 1 and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(2, func_version())
+        self.assertEqual(2, len(calls))
+
+    def test_unit_data_cache_in_memory_local_cache_refresh_ahead_error(self):
+        calls = []
+
+        @in_memory_local_cache(timeout=10, refresh_after=0.05)
+        def func_version():
+            calls.append(1)
+            if len(calls) > 1:
+                raise ValueError("error1")
+            return len(calls)
+
+        self.assertEqual(1, func_version())
+        time.sleep(0.1)
+        self.assertEqual(1, func_version())
+        deadline = time.time() + 5
+        while len(calls) < 2 and time.time() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.05)
+        self.assertEqual(1, func_version())
+
+    def test_unit_data_cache_in_memory_local_cache_refresh_ahead_invalid(self):
+        with self.assertRaises(ValueError):
+            in_memory_local_cache(timeout=1, refresh_after=5)
+
+    def test_unit_data_cache_get_many(self):
+        for engine in [
+            InMemoryCacheEngine(),
+            LRUCacheEngine(),
+            MemoryBoundedCacheEngine(),
+            ShardedCacheEngine(),
+            ThreadCacheEngine(),
+            TieredCacheEngine(),
+        ]:
+            engine.set_many({"a": 1, "b": None, "c": 3})
+            engine.set("expired", 4, timeout=-1)
+            result = engine.get_many(["a", "b", "expired", "missing"])
+            self.assertEqual({"a": 1, "b": None}, result, type(engine).__name__)
+
+    def test_unit_data_cache_set_many_size_regulator(self):
+        for engine in [InMemoryCacheEngine(), LRUCacheEngine(), ThreadCacheEngine()]:
+            engine.clear()
+            engine.set_many({i: i for i in range(3)}, size=5)
+            engine.set_many({i: i for i in range(3, 6)}, size=5)
+            self.assertEqual(5, engine.stats()["entries"], type(engine).__name__)
+            self.assertTrue(engine.exists(5))
+
+    def test_unit_data_cache_set_many_bigger_than_size(self):
+        for engine in [InMemoryCacheEngine(), LRUCacheEngine(), ThreadCacheEngine()]:
+            engine.clear()
+            engine.set_many({i: i for i in range(1000)}, size=10)
+            self.assertEqual(10, engine.stats()["entries"], type(engine).__name__)
+
+    def test_unit_data_cache_set_many_existing_key(self):
+        for engine in [InMemoryCacheEngine(), LRUCacheEngine(), ThreadCacheEngine()]:
+            engine.clear()
+            engine.set_many({i: i for i in range(5)}, size=5)
+            evictions = engine.stats()["evictions"]
+            engine.set_many({0: -1}, size=5)
+            self.assertEqual(
+                {0: -1, 1: 1, 2: 2, 3: 3, 4: 4},
+                engine.get_many(range(5)),
+                type(engine).__name__,
+            )
+            self.assertEqual(
+                evictions, engine.stats()["evictions"], type(engine).__name__
+            )
+
+    def test_unit_data_cache_set_many_lru_order(self):
+        engine = LRUCacheEngine()
+        engine.set_many({"a": 1, "b": 2, "c": 3}, size=3)
+        engine.get_many(["a"])
+        engine.set("d", 4, size=3)
+        self.assertFalse(engine.exists("b"))
+        self.assertTrue(engine.exists("a"))
+
+    def test_unit_data_cache_get_many_stats(self):
+        engine = InMemoryCacheEngine()
+        engine.set_many({"a": 1, "expired": 2}, timeout=-1)
+        engine.set("b", 3)
+        engine.get_many(["b", "expired", "missing"])
+        result = engine.stats()
+        self.assertEqual(1, result["hits"])
+        self.assertEqual(2, result["misses"])
+
+    def test_unit_data_cache_delete_many(self):
+        engine = MemoryBoundedCacheEngine(sizer=bytes_sizeof)
+        engine.set_many({"a": bytes(10), "b": bytes(20), "c": bytes(30)})
+        engine.delete_many(["a", "b", "missing"])
+        self.assertEqual({"c": bytes(30)}, engine.get_many(["a", "b", "c"]))
+        self.assertEqual(30, engine.total_bytes)
+
+    def test_unit_data_cache_invalidate_tag(self):
+        for engine in [
+            InMemoryCacheEngine(),
+            LRUCacheEngine(),
+            MemoryBoundedCacheEngine(),
+            ShardedCacheEngine(),
+            ThreadCacheEngine(),
+            TieredCacheEngine(),
+        ]:
+            engine.clear()
+            engine.set("users-1", 1, tags=("users",))
+            engine.set("users-orders", 2, tags=["users", "orders"])
+            engine.set("orders", 3, tags="orders")
+            engine.set("untagged", 4)
+            result = engine.invalidate_tag("users")
+            self.assertEqual({"users-1", "users-orders"}, set(result))
+            self.assertIsNone(engine.get("users-1"), type(engine).__name__)
+            self.assertFalse(engine.exists("users-orders"))
+            self.assertEqual(3, engine.get("orders"))
+            self.assertEqual(4, engine.get("untagged"))
+            self.assertEqual([], engine.invalidate_tag("users"))
+
+    def test_unit_data_cache_invalidate_tag_overwritten_key(self):
+        engine = LRUCacheEngine()
+        engine.set(self.key, self.value, tags="users")
+        engine.set(self.key, self.value, tags="orders")
+        self.assertEqual([], engine.invalidate_tag("users"))
+        self.assertTrue(engine.exists(self.key))
+        self.assertEqual([self.key], engine.invalidate_tag("orders"))
+
+    def test_unit_data_cache_tag_index_pruned(self):
+        engine = LRUCacheEngine()
+        for i in range(1000):
+            engine.set(i, i, size=10, tags="users")
+        self.assertLess(len(engine.tag_index["users"]), 100)
+        self.assertEqual(10, len(engine.invalidate_tag("users")))
+        self.assertEqual(0, engine.stats()["entries"])
+
+    def test_unit_data_cache_memory_bounded_invalidate_tag_accounting(self):
+        engine = MemoryBoundedCacheEngine(sizer=bytes_sizeof)
+        engine.set("a", bytes(10), tags="users")
+        engine.set("b", bytes(20))
+        engine.invalidate_tag("users")
+        self.assertEqual(20, engine.total_bytes)
+
+    def test_unit_data_cache_tiered_invalidate_tag_other_thread(self):
+        engine = TieredCacheEngine()
+        engine.set(self.key, self.value, tags="users")
+        self.assertEqual(self.value, engine.get(self.key))
+        thread = threading.Thread(target=engine.invalidate_tag, args=("users",))
+        thread.start()
+        thread.join()
+        self.assertIsNone(engine.get(self.key))
+
+    def test_unit_data_cache_in_memory_local_cache_tags(self):
+        calls = []
+
+        @in_memory_local_cache(tags="users", name="users")
+        def func_query(user_id):
+            calls.append(user_id)
+            return {"id": user_id}
+
+        @in_memory_local_cache(tags="users", name="users")
+        def func_query_name(user_id):
+            calls.append(-user_id)
+            return f"user-{user_id}"
+
+        func_query(1)
+        func_query(1)
+        func_query_name(1)
+        CacheRegistry.get_engine("users").invalidate_tag("users")
+        func_query(1)
+        func_query_name(1)
+        self.assertEqual([1, -1, 1, -1], calls)
@@ -0,0 +1,168 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+
+from jimena.core.components.data.cache.asynchronous import (
+    AsyncCacheEngine,
+    async_local_cache,
+)
+from jimena.core.components.data.cache.local import (
+    CacheRegistry,
+    in_memory_local_cache,
+)
+
+
+class TestUnitDataCacheAsynchronous(IsolatedAsyncioTestCase):
+    """
+    Unit tests for the asyncio cache engine and decorators.
+
+    This test class is designed to validate the functionality of the 'AsyncCacheEngine' class and its decorators.
+    It contains individual test methods, each focusing on different aspects of the class's behavior.
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up method called before each test case execution.
+        """
+        super().setUp()
+        self.key = "key"
+        self.value = {"color": "Red", "fruit": "Apple", "size": "Large"}
+
+    def tearDown(self) -> None:
+        """
+        Set up method called after each test case execution.
+        """
+        CacheRegistry.clear()
+
+    async def test_unit_data_cache_asynchronous_get_valid_key(self):
+        engine = AsyncCacheEngine()
+        await engine.set(self.key, self.value)
+        self.assertTrue(await engine.exists(self.key))
+        self.assertEqual(self.value, await engine.get(self.key))
+        await engine.delete(self.key)
+        self.assertIsNone(await engine.get(self.key))
+        self.assertEqual(1, engine.stats()["hits"])
+        self.assertEqual(1, engine.stats()["misses"])
+
+    async def test_unit_data_cache_asynchronous_get_expired_key(self):
+        engine = AsyncCacheEngine()
+        await engine.set(self.key, self.value, timeout=-1)
+        self.assertFalse(await engine.exists(self.key))
+        self.assertIsNone(await engine.get(self.key))
+        self.assertEqual(0, engine.stats()["entries"])
+
+    async def test_unit_data_cache_asynchronous_size(self):
+        engine = AsyncCacheEngine()
+        for key in ["a", "b", "c", "d"]:
+            await engine.set(key, key, size=3)
+        await engine.get("b")
+        await engine.set("e", "e", size=3)
+        self.assertFalse(await engine.exists("a"))
+        self.assertFalse(await engine.exists("c"))
+        self.assertTrue(await engine.exists("b"))
+        self.assertEqual(2, engine.stats()["evictions"])
+
+    async def test_unit_data_cache_asynchronous_get_or_compute_coalesces(self):
+        engine = AsyncCacheEngine()
+        calls = []
+
+        async def func_value():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return self.value
+
+        results = await asyncio.gather(
+            *[engine.get_or_compute(self.key, func_value) for _ in range(10)]
+        )
+        self.assertEqual([self.value] * 10, results)
+        self.assertEqual(1, len(calls))
+        self.assertEqual({}, engine.in_flight)
+
+    async def test_unit_data_cache_asynchronous_get_or_compute_exception(self):
+        engine = AsyncCacheEngine()
+        calls = []
+
+        async def func_error():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            raise ValueError("error1")
+
+        results = await asyncio.gather(
+            *[engine.get_or_compute(self.key, func_error) for _ in range(5)],
+            return_exceptions=True,
+        )
+        self.assertEqual(1, len(calls))
+        self.assertTrue(all(isinstance(r, ValueError) for r in results))
+        self.assertFalse(await engine.exists(self.key))
+
+    async def test_unit_data_cache_asynchronous_get_or_compute_cancelled(self):
+        engine = AsyncCacheEngine()
+        calls = []
+
+        async def func_value():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return self.value
+
+        first = asyncio.ensure_future(engine.get_or_compute(self.key, func_value))
+        await asyncio.sleep(0)
+        others = [
+            asyncio.ensure_future(engine.get_or_compute(self.key, func_value))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        first.cancel()
+        results = await asyncio.gather(*others)
+        self.assertTrue(first.cancelled())
+        self.assertEqual([self.value] * 3, results)
+        self.assertEqual(1, len(calls))
+        self.assertEqual(self.value, await engine.get(self.key))
+
+    async def test_unit_data_cache_asynchronous_async_local_cache(self):
+        calls = []
+
+        @async_local_cache()
+        async def func_row(row_id):
+            calls.append(row_id)
+            await asyncio.sleep(0.01)
+            return {"id": row_id}
+
+        results = await asyncio.gather(func_row(1), func_row(1), func_row(2))
+        self.assertEqual([{"id": 1}, {"id": 1}, {"id": 2}], results)
+        self.assertEqual({"id": 1}, await func_row(1))
+        self.assertEqual([1, 2], sorted(calls))
+
+    async def test_unit_data_cache_asynchronous_async_local_cache_sizes(self):
+        calls = []
+
+        @async_local_cache(size=100)
+        async def func_first(number):
+            calls.append(number)
+            return number
+
+        @async_local_cache(size=2)
+        async def func_second(number):
+            calls.append(-number)
+            return -number
+
+        for number in range(10):
+            await func_first(number)
+        for number in range(1, 4):
+            await func_second(number)
+        for number in range(10):
+            await func_first(number)
+        self.assertEqual(list(range(10)) + [-1, -2, -3], calls)
+        self.assertEqual(1, func_second.cache_engine.stats()["evictions"])
+        with self.assertRaises(ValueError):
+            async_local_cache(size=2, name="shared")
+
+    async def test_unit_data_cache_asynchronous_decorators_function_type(self):
+        async def func_coroutine():
+            return self.value
+
+        def func_sync():
+            return self.value
+
+        with self.assertRaises(TypeError):
+            in_memory_local_cache()(func_coroutine)
+        with self.assertRaises(TypeError):
+            async_local_cache()(func_sync)
@@ -0,0 +1,164 @@
+import os
+import tempfile
+from unittest import TestCase, mock
+
+from jimena.core.components.data.cache.disk import DiskCacheEngine
+from jimena.core.components.data.cache.local import (
+    CacheRegistry,
+    in_memory_local_cache,
+)
+
+
+class TestUnitDataCacheDisk(TestCase):
+    """
+    Unit tests for the 'DiskCacheEngine' class.
+
+    This test class is designed to validate the functionality of the 'DiskCacheEngine' class.
+    It contains individual test methods, each focusing on different aspects of the class's behavior.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self) -> None:
+        """
+        Set up method called before each test case execution.
+        """
+        super().setUp()
+        self.folder = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.folder.name, "cache.sqlite")
+        self.engine = DiskCacheEngine(path=self.path)
+        self.key = ("extract", "csv_file.csv")
+        self.value = {"color": "Red", "fruit": "Apple", "size": "Large"}
+
+    def tearDown(self) -> None:
+        """
+        Set up method called after each test case execution.
+        """
+        self.engine.close()
+        CacheRegistry.clear()
+        self.folder.cleanup()
+
+    def test_unit_data_cache_disk_get_valid_key(self):
+        self.engine.set(self.key, self.value)
+        self.assertTrue(self.engine.exists(self.key))
+        self.assertEqual(self.value, self.engine.get(self.key))
+
+    def test_unit_data_cache_disk_get_invalid_key(self):
+        self.assertFalse(self.engine.exists(self.key))
+        self.assertIsNone(self.engine.get(self.key))
+
+    def test_unit_data_cache_disk_get_expired_key(self):
+        self.engine.set(self.key, self.value, timeout=-1)
+        self.assertFalse(self.engine.exists(self.key))
+        self.assertIsNone(self.engine.get(self.key))
+        self.assertEqual(0, self.engine.stats()["entries"])
+
+    def test_unit_data_cache_disk_persistence(self):
+        self.engine.set(self.key, self.value)
+        self.engine.close()
+        engine = DiskCacheEngine(path=self.path)
+        try:
+            self.assertEqual(self.value, engine.get(self.key))
+        finally:
+            engine.close()
+
+    def test_unit_data_cache_disk_size_regulator(self):
+        for i in range(5):
+            self.engine.set(i, i, size=3)
+        self.assertFalse(self.engine.exists(0))
+        self.assertFalse(self.engine.exists(1))
+        self.assertTrue(self.engine.exists(4))
+        result = self.engine.stats()
+        self.assertEqual(3, result["entries"])
+        self.assertEqual(2, result["evictions"])
+
+    def test_unit_data_cache_disk_delete_and_clear(self):
+        self.engine.set(self.key, self.value)
+        self.engine.delete(self.key)
+        self.assertFalse(self.engine.exists(self.key))
+        self.engine.set(self.key, self.value)
+        self.engine.clear()
+        self.assertEqual(0, self.engine.stats()["entries"])
+
+    def test_unit_data_cache_disk_stats(self):
+        self.engine.set(self.key, self.value)
+        self.engine.get(self.key)
+        self.engine.get("missing")
+        result = self.engine.stats()
+        self.assertEqual(1, result["hits"])
+        self.assertEqual(1, result["misses"])
+        self.assertGreater(result["bytes"], 0)
+
+    def test_unit_data_cache_disk_in_memory_local_cache_warm_start(self):
+        calls = []
+
+        def func_extract(path):
+            calls.append(path)
+            return [path]
+
+        CacheRegistry.register_engine("disk", self.engine)
+        in_memory_local_cache(name="disk")(func_extract)("csv_file.csv")
+        CacheRegistry.register_engine("disk", DiskCacheEngine(path=self.path))
+        result = in_memory_local_cache(name="disk")(func_extract)("csv_file.csv")
+        CacheRegistry.get_engine("disk").close()
+        self.assertEqual(["csv_file.csv"], result)
+        self.assertEqual(1, len(calls))
+
+    def test_unit_data_cache_disk_bulk_operations(self):
+        self.engine.set_many({i: str(i) for i in range(1200)}, size=1000)
+        self.engine.set("expired", 1, timeout=-1)
+        result = self.engine.get_many([0, 1199, "expired", "missing"])
+        self.assertEqual({1199: "1199"}, result)
+        self.assertEqual(1000, self.engine.stats()["entries"])
+        self.engine.delete_many(range(1100, 1200))
+        self.assertEqual(900, self.engine.stats()["entries"])
+        self.assertEqual(1, self.engine.stats()["hits"])
+
+    def test_unit_data_cache_disk_entry_count(self):
+        self.engine.set_many({i: i for i in range(10)}, size=5)
+        self.engine.set(9, "replaced", size=5)
+        self.engine.set("expired", 1, timeout=-1)
+        self.engine.delete(8)
+        self.engine.get("expired")
+        (entries,) = (
+            self.engine._get_connection()
+            .execute("SELECT entries FROM cache_count")
+            .fetchone()
+        )
+        self.assertEqual(self.engine.stats()["entries"], entries)
+        self.assertEqual(4, entries)
+        self.engine.clear()
+        self.engine.close()
+        engine = DiskCacheEngine(path=self.path)
+        try:
+            engine.set("key", "value")
+            self.assertEqual(1, engine.stats()["entries"])
+            (entries,) = (
+                engine._get_connection()
+                .execute("SELECT entries FROM cache_count")
+                .fetchone()
+            )
+            self.assertEqual(1, entries)
+        finally:
+            engine.close()
+
+    def test_unit_data_cache_disk_private_path(self):
+        self.engine.set(self.key, self.value)
+        self.engine.close()
+        with mock.patch("os.getuid", return_value=os.stat(self.path).st_uid + 1):
+            with self.assertRaises(PermissionError):
+                DiskCacheEngine(path=self.path).get(self.key)
+
+    def test_unit_data_cache_disk_default_path(self):
+        with mock.patch.dict(os.environ, {"XDG_CACHE_HOME": self.folder.name}):
+            engine = DiskCacheEngine()
+        try:
+            folder = os.path.dirname(engine.path)
+            self.assertEqual(
+                os.path.join(self.folder.name, "jimena-core"), os.path.dirname(folder)
+            )
+            self.assertEqual(0o700, os.stat(folder).st_mode & 0o777)
+        finally:
+            engine.close()
@@ -0,0 +1,131 @@
+import multiprocessing
+import os
+from unittest import TestCase
+
+from jimena.core.components.data.cache.local import (
+    CacheRegistry,
+    in_memory_local_cache,
+)
+from jimena.core.components.data.cache.shared import SharedMemoryCacheEngine
+
+
+def func_worker(engine, key, queue):
+    queue.put(engine.get(key))
+    engine.set("worker", os.getpid())
+
+
+class TestUnitDataCacheShared(TestCase):
+    """
+    Unit tests for the 'SharedMemoryCacheEngine' class.
+
+    This test class is designed to validate the functionality of the 'SharedMemoryCacheEngine' class.
+    It contains individual test methods, each focusing on different aspects of the class's behavior.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self) -> None:
+        """
+        Set up method called before each test case execution.
+        """
+        super().setUp()
+        self.name = f"jimena-core-test-{os.getpid()}"
+        self.engine = SharedMemoryCacheEngine(name=self.name, size=64, slot_size=256)
+        self.key = ("extract", "csv_file.csv")
+        self.value = {"color": "Red", "fruit": "Apple", "size": "Large"}
+
+    def tearDown(self) -> None:
+        """
+        Set up method called after each test case execution.
+        """
+        self.engine.close()
+        self.engine.unlink()
+        CacheRegistry.clear()
+
+    def test_unit_data_cache_shared_get_valid_key(self):
+        self.engine.set(self.key, self.value)
+        self.assertTrue(self.engine.exists(self.key))
+        self.assertEqual(self.value, self.engine.get(self.key))
+
+    def test_unit_data_cache_shared_get_invalid_key(self):
+        self.assertFalse(self.engine.exists(self.key))
+        self.assertIsNone(self.engine.get(self.key))
+
+    def test_unit_data_cache_shared_get_expired_key(self):
+        self.engine.set(self.key, self.value, timeout=-1)
+        self.assertFalse(self.engine.exists(self.key))
+        self.assertIsNone(self.engine.get(self.key))
+        self.assertEqual(0, self.engine.stats()["entries"])
+        self.assertEqual(1, self.engine.stats()["expirations"])
+
+    def test_unit_data_cache_shared_attach_by_name(self):
+        self.engine.set(self.key, self.value)
+        engine = SharedMemoryCacheEngine(name=self.name, size=64, slot_size=256)
+        try:
+            self.assertEqual(self.value, engine.get(self.key))
+        finally:
+            engine.close()
+        with self.assertRaises(ValueError):
+            SharedMemoryCacheEngine(name=self.name, size=128, slot_size=256)
+
+    def test_unit_data_cache_shared_value_bigger_than_slot(self):
+        self.engine.set(self.key, bytes(1024))
+        self.assertFalse(self.engine.exists(self.key))
+
+    def test_unit_data_cache_shared_overwrite_bigger_than_slot(self):
+        self.engine.set(self.key, self.value)
+        self.engine.set(self.key, bytes(1024))
+        self.assertFalse(self.engine.exists(self.key))
+        self.assertIsNone(self.engine.get(self.key))
+        self.assertEqual(0, self.engine.stats()["entries"])
+
+    def test_unit_data_cache_shared_size_regulator(self):
+        for i in range(200):
+            self.engine.set(i, i)
+        result = self.engine.stats()
+        self.assertEqual(64, result["entries"])
+        self.assertEqual(136, result["evictions"])
+        self.assertTrue(self.engine.exists(199))
+
+    def test_unit_data_cache_shared_delete_and_clear(self):
+        self.engine.set(self.key, self.value)
+        self.engine.delete(self.key)
+        self.assertFalse(self.engine.exists(self.key))
+        self.engine.set(self.key, self.value)
+        self.engine.clear()
+        self.assertEqual(0, self.engine.stats()["entries"])
+
+    def test_unit_data_cache_shared_sweep_expired(self):
+        self.engine.set(self.key, self.value)
+        self.engine.set("expired", 1, timeout=-1)
+        self.assertEqual(1, self.engine.sweep_expired())
+        self.assertEqual(1, self.engine.stats()["entries"])
+
+    def test_unit_data_cache_shared_between_processes(self):
+        self.engine.set(self.key, self.value)
+        context = multiprocessing.get_context("spawn")
+        queue = context.Queue()
+        process = context.Process(
+            target=func_worker, args=(self.engine, self.key, queue)
+        )
+        process.start()
+        result = queue.get(timeout=30)
+        process.join(timeout=30)
+        self.assertEqual(self.value, result)
+        self.assertEqual(process.pid, self.engine.get("worker"))
+        self.assertEqual(2, self.engine.stats()["hits"])
+
+    def test_unit_data_cache_shared_in_memory_local_cache(self):
+        calls = []
+
+        @in_memory_local_cache(name="shared")
+        def func_extract(path):
+            calls.append(path)
+            return [path]
+
+        CacheRegistry.register_engine("shared", self.engine)
+        func_extract("csv_file.csv")
+        self.assertEqual(["csv_file.csv"], func_extract("csv_file.csv"))
+        self.assertEqual(1, len(calls))
@@ -1,3 +1,20 @@
+import bz2
+import gzip
+import importlib.util
+import io
+import json
+import lzma
+import math
+import os
+import tempfile
+import threading
+import time
+import unittest
+from array import array
+from collections.abc import Iterator
+from unittest import mock
+
+from jimena.core.components.data.extractor.basic import DataExtractorPandas
 from jimena.core.components.data.extractor.core import DataExtractorCore
 from jimena.core.tests.setup import JCoreTestCase
 
@@ -28,12 +45,36 @@ class TestUnitDataExtractor(JCoreTestCase):
                 paths_to_join=["json_file.json"],
             )
         )
+        self.test_resource_data_folder_json_lines_file = (
+            self.resource_tool_instance.join_paths(
+                initial_path=self.test_resource_data_folder,
+                paths_to_join=["json_lines_file.jsonl"],
+            )
+        )
+        self.test_resource_data_folder_json_array_file = (
+            self.resource_tool_instance.join_paths(
+                initial_path=self.test_resource_data_folder,
+                paths_to_join=["json_array_file.json"],
+            )
+        )
         self.test_resource_data_folder_path_csv = (
             self.resource_tool_instance.join_paths(
                 initial_path=self.test_resource_data_folder,
                 paths_to_join=["csv_file.csv"],
             )
         )
+        self.test_resource_data_folder_path_csv_header = (
+            self.resource_tool_instance.join_paths(
+                initial_path=self.test_resource_data_folder,
+                paths_to_join=["csv_file_header.csv"],
+            )
+        )
+        self.test_resource_data_folder_path_csv_typed = (
+            self.resource_tool_instance.join_paths(
+                initial_path=self.test_resource_data_folder,
+                paths_to_join=["csv_file_typed.csv"],
+            )
+        )
         self.test_resource_data_folder_path_generic = (
             self.resource_tool_instance.join_paths(
                 initial_path=self.test_resource_data_folder,
@@ -94,3 +135,504 @@ class TestUnitDataExtractor(JCoreTestCase):
             DataExtractorCore().generic_extractor(
                 self.test_resource_data_folder_invalid_path
             )
+
+    def test_unit_data_extractor_csv_stream_extractor_rows(self):
+        result = DataExtractorCore().csv_stream_extractor(
+            self.test_resource_data_folder_path_csv
+        )
+        self.assertIsInstance(result, Iterator)
+        self.assertEqual([["hi", "that", "is", "a", "test!"]], list(result))
+
+    def test_unit_data_extractor_csv_stream_extractor_header(self):
+        result = list(
+            DataExtractorCore().csv_stream_extractor(
+                self.test_resource_data_folder_path_csv_header, header=True
+            )
+        )
+        self.assertEqual(5, len(result))
+        self.assertEqual(
+            {"id": "3", "name": "kiwi, gold", "price": "1.25", "stock": "7"}, result[2]
+        )
+
+    def test_unit_data_extractor_csv_stream_extractor_columns(self):
+        result = list(
+            DataExtractorCore().csv_stream_extractor(
+                self.test_resource_data_folder_path_csv_header,
+                header=True,
+                columns=["name", "stock"],
+            )
+        )
+        self.assertEqual({"name": "apple", "stock": "10"}, result[0])
+        result = list(
+            DataExtractorCore().csv_stream_extractor(
+                self.test_resource_data_folder_path_csv_header, columns=[1]
+            )
+        )
+        self.assertEqual([["name"], ["apple"]], result[:2])
+
+    def test_unit_data_extractor_csv_stream_extractor_batches(self):
+        result = list(
+            DataExtractorCore().csv_stream_extractor(
+                self.test_resource_data_folder_path_csv_header,
+                batch_size=2,
+                header=True,
+            )
+        )
+        self.assertEqual([2, 2, 1], [len(batch) for batch in result])
+        self.assertEqual("fig", result[-1][0]["name"])
+
+    def test_unit_data_extractor_csv_stream_extractor_invalid_column(self):
+        with self.assertRaises(ValueError):
+            list(
+                DataExtractorCore().csv_stream_extractor(
+                    self.test_resource_data_folder_path_csv_header,
+                    header=True,
+                    columns=["color"],
+                )
+            )
+
+    def test_unit_data_extractor_csv_stream_extractor_column_name_without_header(self):
+        with self.assertRaises(ValueError) as context:
+            list(
+                DataExtractorCore().csv_stream_extractor(
+                    self.test_resource_data_folder_path_csv_header, columns=["id"]
+                )
+            )
+        self.assertIn("require a header", str(context.exception))
+
+    def test_unit_data_extractor_csv_stream_extractor_invalid_path(self):
+        with self.assertRaises(Exception):
+            list(
+                DataExtractorCore().csv_stream_extractor(
+                    self.test_resource_data_folder_invalid_path
+                )
+            )
+
+    def test_unit_data_extractor_csv_columnar_extractor_python(self):
+        result = DataExtractorCore().csv_columnar_extractor(
+            self.test_resource_data_folder_path_csv_typed, output="python"
+        )
+        self.assertEqual(["id", "name", "price", "stock", "active"], list(result))
+        self.assertEqual(array("q", [1, 2, 3, 4, 5]), result["id"])
+        self.assertEqual("kiwi, gold", result["name"][2])
+        self.assertEqual("d", result["price"].typecode)
+        self.assertTrue(math.isnan(result["price"][3]))
+        # Int columns with missing values are inferred as float
+        self.assertEqual("d", result["stock"].typecode)
+        self.assertEqual([True, False, True, False, True], result["active"])
+
+    def test_unit_data_extractor_csv_columnar_extractor_schema(self):
+        result = DataExtractorCore().csv_columnar_extractor(
+            self.test_resource_data_folder_path_csv_typed,
+            columns=["price", "id"],
+            schema={"id": float, "price": "str"},
+            output="python",
+        )
+        self.assertEqual(["price", "id"], list(result))
+        self.assertEqual(array("d", [1, 2, 3, 4, 5]), result["id"])
+        self.assertEqual("", result["price"][3])
+        with self.assertRaises(ValueError):
+            DataExtractorCore().csv_columnar_extractor(
+                self.test_resource_data_folder_path_csv_typed,
+                schema={"stock": int},
+                output="python",
+            )
+
+    def test_unit_data_extractor_csv_columnar_extractor_bool_schema(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "csv_file_bool.csv")
+            with open(path, "w") as file:
+                file.write("id,active\n1,True\n2,false\n3,\n")
+            result = DataExtractorCore().csv_columnar_extractor(
+                path, schema={"active": bool}, output="python"
+            )
+            self.assertEqual([True, False, None], result["active"])
+            with open(path, "a") as file:
+                file.write("4,yes\n")
+            with self.assertRaises(ValueError) as context:
+                DataExtractorCore().csv_columnar_extractor(
+                    path, schema={"active": bool}, output="python"
+                )
+            self.assertIn("'yes'", str(context.exception))
+        with self.assertRaises(ValueError):
+            DataExtractorCore().csv_columnar_extractor(
+                self.test_resource_data_folder_path_csv_typed,
+                schema={"name": bool},
+                output="python",
+            )
+
+    def test_unit_data_extractor_csv_columnar_extractor_without_header(self):
+        result = DataExtractorCore().csv_columnar_extractor(
+            self.test_resource_data_folder_path_csv_header,
+            header=False,
+            columns=[0],
+            output="python",
+        )
+        self.assertEqual({"f0": ["id", "1", "2", "3", "4", "5"]}, result)
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "numpy is not installed")
+    def test_unit_data_extractor_csv_columnar_extractor_numpy(self):
+        result = DataExtractorCore().csv_columnar_extractor(
+            self.test_resource_data_folder_path_csv_typed, output="numpy"
+        )
+        self.assertEqual("int64", result["id"].dtype.name)
+        self.assertEqual("float64", result["stock"].dtype.name)
+        self.assertEqual("bool", result["active"].dtype.name)
+        self.assertEqual([2, 4], result["id"][~result["active"]].tolist())
+
+    @unittest.skipUnless(
+        importlib.util.find_spec("pyarrow"), "pyarrow is not installed"
+    )
+    def test_unit_data_extractor_csv_columnar_extractor_arrow(self):
+        result = DataExtractorCore().csv_columnar_extractor(
+            self.test_resource_data_folder_path_csv_typed,
+            columns=["id", "price"],
+            schema={"id": float},
+            output="arrow",
+        )
+        self.assertEqual(["id", "price"], result.column_names)
+        self.assertEqual("double", str(result.schema.field("id").type))
+        self.assertEqual(1, result.column("price").null_count)
+
+    def test_unit_data_extractor_csv_columnar_extractor_invalid_output(self):
+        with self.assertRaises(ValueError):
+            DataExtractorCore().csv_columnar_extractor(
+                self.test_resource_data_folder_path_csv_typed, output="excel"
+            )
+        with mock.patch.dict(DataExtractorCore._optional_modules, {"numpy": None}):
+            with self.assertRaises(ModuleNotFoundError):
+                DataExtractorCore().csv_columnar_extractor(
+                    self.test_resource_data_folder_path_csv_typed, output="numpy"
+                )
+
+    def _write_compressed(self, source: str, folder: str, name: str, module) -> str:
+        """
+        Writes the content of source compressed with the open function of module into folder and returns its path.
+        """
+        path = os.path.join(folder, name)
+        with open(source, "rb") as source_file, module.open(path, "wb") as file:
+            file.write(source_file.read())
+        return path
+
+    def test_unit_data_extractor_compressed_files(self):
+        extractor = DataExtractorCore()
+        expected = list(
+            extractor.csv_stream_extractor(
+                self.test_resource_data_folder_path_csv_header, header=True
+            )
+        )
+        modules = {".gz": gzip, ".bz2": bz2, ".xz": lzma}
+        if importlib.util.find_spec("zstandard"):
+            modules[".zst"] = importlib.import_module("zstandard")
+        with tempfile.TemporaryDirectory() as folder:
+            for extension, module in modules.items():
+                path = self._write_compressed(
+                    self.test_resource_data_folder_path_csv_header,
+                    folder,
+                    f"csv_file_header.csv{extension}",
+                    module,
+                )
+                self.assertEqual(
+                    expected, list(extractor.csv_stream_extractor(path, header=True))
+                )
+            path = self._write_compressed(
+                self.test_resource_data_folder_json_lines_file,
+                folder,
+                "json_lines_file.jsonl.gz",
+                gzip,
+            )
+            self.assertEqual(3, len(list(extractor.json_lines_extractor(path))))
+
+    def test_unit_data_extractor_compressed_magic_bytes(self):
+        extractor = DataExtractorCore()
+        with tempfile.TemporaryDirectory() as folder:
+            path = self._write_compressed(
+                self.test_resource_data_folder_json_file, folder, "json_file.json", bz2
+            )
+            self.assertEqual("bz2", extractor.get_compression(path))
+            self.assertEqual(
+                extractor.json_extractor(self.test_resource_data_folder_json_file),
+                extractor.json_extractor(path),
+            )
+        self.assertIsNone(
+            extractor.get_compression(self.test_resource_data_folder_json_file)
+        )
+
+    def test_unit_data_extractor_compressed_magic_bytes_plain_file(self):
+        extractor = DataExtractorCore()
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "csv_file_magic.csv")
+            for content in ["BZh,col\n1,2\n", "BZh91AY&SY,col\n1,2\n", "\x1f\x8b\n"]:
+                with open(path, "w") as file:
+                    file.write(content)
+                self.assertEqual(
+                    [row.split(",") for row in content.splitlines()],
+                    extractor.csv_extractor(path),
+                )
+                self.assertEqual(
+                    content.splitlines(keepends=True), extractor.generic_extractor(path)
+                )
+            for mode in ["r", "rb"]:
+                with open(path, mode) as file:
+                    expected = file.read()
+                with extractor.open_file(path, binary=mode == "rb") as file:
+                    self.assertEqual(expected, file.read())
+
+    def test_unit_data_extractor_compressed_threaded_decompression(self):
+        extractor = DataExtractorCore(threaded_decompression=True)
+        with tempfile.TemporaryDirectory() as folder:
+            path = self._write_compressed(
+                self.test_resource_data_folder_json_array_file,
+                folder,
+                "json_array_file.json.xz",
+                lzma,
+            )
+            self.assertEqual(
+                list(
+                    extractor.json_stream_extractor(
+                        self.test_resource_data_folder_json_array_file
+                    )
+                ),
+                list(extractor.json_stream_extractor(path, chunk_size=8)),
+            )
+
+    def test_unit_data_extractor_compressed_zstd_without_zstandard(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "file.zst")
+            with open(path, "wb") as file:
+                file.write(b"\x28\xb5\x2f\xfd")
+            with mock.patch.dict(
+                DataExtractorCore._optional_modules, {"zstandard": None}
+            ):
+                with self.assertRaises(ModuleNotFoundError):
+                    DataExtractorCore().generic_extractor(path)
+
+    def test_unit_data_extractor_json_lines_extractor_valid_path(self):
+        result = DataExtractorCore().json_lines_extractor(
+            self.test_resource_data_folder_json_lines_file
+        )
+        self.assertIsInstance(result, Iterator)
+        result = list(result)
+        self.assertEqual(3, len(result))
+        self.assertEqual(
+            {"id": 3, "fruit": "Kiwi", "tags": ["green", "gold"]}, result[2]
+        )
+
+    def test_unit_data_extractor_json_lines_extractor_batches(self):
+        result = list(
+            DataExtractorCore().json_lines_extractor(
+                self.test_resource_data_folder_json_lines_file, batch_size=2
+            )
+        )
+        self.assertEqual([2, 1], [len(batch) for batch in result])
+
+    def test_unit_data_extractor_json_lines_extractor_invalid_line(self):
+        with self.assertRaises(json.JSONDecodeError) as context:
+            list(
+                DataExtractorCore().json_lines_extractor(
+                    self.test_resource_data_folder_path_csv
+                )
+            )
+        self.assertIn("line 1", context.exception.msg)
+
+    def test_unit_data_extractor_json_stream_extractor_valid_path(self):
+        with open(self.test_resource_data_folder_json_array_file) as file:
+            expected_result = json.load(file)
+        for chunk_size in [1, 3, 16, None]:
+            result = DataExtractorCore().json_stream_extractor(
+                self.test_resource_data_folder_json_array_file, chunk_size=chunk_size
+            )
+            self.assertIsInstance(result, Iterator)
+            self.assertEqual(expected_result, list(result))
+
+    def test_unit_data_extractor_json_stream_extractor_batches(self):
+        result = list(
+            DataExtractorCore().json_stream_extractor(
+                self.test_resource_data_folder_json_array_file, batch_size=4
+            )
+        )
+        self.assertEqual([4, 2], [len(batch) for batch in result])
+        self.assertEqual(["text, with [brackets]", None], result[1])
+
+    def test_unit_data_extractor_json_stream_extractor_not_array(self):
+        with self.assertRaises(json.JSONDecodeError):
+            list(
+                DataExtractorCore().json_stream_extractor(
+                    self.test_resource_data_folder_json_file
+                )
+            )
+
+    def test_unit_data_extractor_json_stream_extractor_trailing_data(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "json_array_file.json")
+            for content, valid in [
+                ("[1, 2] trailing garbage", False),
+                ("[1, 2]]", False),
+                ("[] 3", False),
+                ("[1, 2] \n\t ", True),
+            ]:
+                with open(path, "w") as file:
+                    file.write(content)
+                for chunk_size in [1, 3, None]:
+                    result = DataExtractorCore().json_stream_extractor(
+                        path, chunk_size=chunk_size
+                    )
+                    if valid:
+                        self.assertEqual([1, 2], list(result))
+                        continue
+                    with self.assertRaises(json.JSONDecodeError) as context:
+                        list(result)
+                    self.assertEqual("Extra data", context.exception.msg)
+
+    def test_unit_data_extractor_json_stream_extractor_invalid_item(self):
+        extractor = DataExtractorCore()
+        for content in ["[\n 1,\n x]", "[1,\n2]\n  x", '[1, "a\n"]', "[1, 2", "[", ""]:
+            with self.assertRaises(json.JSONDecodeError) as expected:
+                json.loads(content)
+            for chunk_size in [1, 3, None]:
+                with mock.patch.object(
+                    extractor, "open_file", return_value=io.StringIO(content)
+                ):
+                    with self.assertRaises(json.JSONDecodeError) as context:
+                        list(
+                            extractor.json_stream_extractor(
+                                "json_file.json", chunk_size=chunk_size
+                            )
+                        )
+                self.assertEqual(str(expected.exception), str(context.exception))
+        # A malformed item is raised without reading the rest of the file
+        file = io.StringIO("[1, x, " + "2, " * 100000 + "3]")
+        # Kept open to read its position
+        file.close = lambda: None
+        with mock.patch.object(extractor, "open_file", return_value=file):
+            with self.assertRaises(json.JSONDecodeError) as context:
+                list(extractor.json_stream_extractor("json_file.json", chunk_size=64))
+        self.assertEqual(4, context.exception.pos)
+        self.assertLess(file.tell(), 1024)
+
+    def test_unit_data_extractor_json_stream_extractor_invalid_path(self):
+        with self.assertRaises(Exception):
+            list(
+                DataExtractorCore().json_stream_extractor(
+                    self.test_resource_data_folder_invalid_path
+                )
+            )
+
+    def test_unit_data_extractor_generic_mapped_extractor_valid_path(self):
+        with DataExtractorCore().generic_mapped_extractor(
+            self.test_resource_data_folder_path_generic
+        ) as result:
+            self.assertEqual(["hi, that is a test!\n"], list(result))
+            self.assertEqual(1, len(result))
+            self.assertEqual("hi, that is a test!\n", result[-1])
+
+    def test_unit_data_extractor_generic_mapped_extractor_random_access(self):
+        lines = [f"line {i}\n" for i in range(1000)] + ["last line"]
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "generic_file.txt")
+            with open(path, "w") as file:
+                file.writelines(lines)
+            with DataExtractorCore().generic_mapped_extractor(path) as result:
+                self.assertEqual(lines, list(result))
+                self.assertEqual(1001, len(result))
+                self.assertEqual("line 500\n", result[500])
+                self.assertEqual("last line", result[-1])
+                self.assertEqual(lines[-3:], result[-3:])
+                line = result.line_bytes(10)
+                self.assertIsInstance(line, memoryview)
+                self.assertEqual(b"line 10\n", line)
+                line.release()
+                with self.assertRaises(IndexError):
+                    result[1001]
+
+    def test_unit_data_extractor_generic_mapped_extractor_bytes(self):
+        with DataExtractorCore().generic_mapped_extractor(
+            self.test_resource_data_folder_path_generic
+        ) as result:
+            lines = [bytes(line) for line in result.iter_bytes()]
+        self.assertEqual([b"hi, that is a test!\n"], lines)
+
+    def test_unit_data_extractor_generic_mapped_extractor_empty_file(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "generic_file.txt")
+            open(path, "w").close()
+            with DataExtractorCore().generic_mapped_extractor(path) as result:
+                self.assertEqual([], list(result))
+                self.assertEqual(0, len(result))
+
+    def test_unit_data_extractor_generic_mapped_extractor_invalid_path(self):
+        with self.assertRaises(Exception):
+            DataExtractorCore().generic_mapped_extractor(
+                self.test_resource_data_folder_invalid_path
+            )
+
+    def test_unit_data_extractor_pandas_without_pandas(self):
+        extractor = DataExtractorPandas()
+        with mock.patch.object(extractor, "module_exists", return_value=False):
+            with self.assertRaises(ModuleNotFoundError):
+                extractor.csv(self.test_resource_data_folder_path_csv)
+
+    @unittest.skipUnless(importlib.util.find_spec("pandas"), "pandas is not installed")
+    def test_unit_data_extractor_pandas_csv_chunks_rows(self):
+        result = list(
+            DataExtractorPandas().csv_chunks(
+                self.test_resource_data_folder_path_csv_typed,
+                chunk_size=2,
+                usecols=["id", "stock"],
+                dtype={"id": "float64"},
+            )
+        )
+        self.assertEqual([2, 2, 1], [len(chunk) for chunk in result])
+        self.assertEqual(["id", "stock"], list(result[0].columns))
+        self.assertEqual("float64", result[0]["id"].dtype.name)
+        self.assertEqual([5.0], result[-1]["id"].tolist())
+
+    @unittest.skipUnless(importlib.util.find_spec("pandas"), "pandas is not installed")
+    def test_unit_data_extractor_pandas_csv_chunks_memory(self):
+        extractor = DataExtractorPandas()
+        extractor.SAMPLE_ROWS = 2
+        result = list(
+            extractor.csv_chunks(
+                self.test_resource_data_folder_path_csv_typed, memory_chunk=1e-9
+            )
+        )
+        self.assertEqual([2, 1, 1, 1], [len(chunk) for chunk in result])
+
+    @unittest.skipUnless(importlib.util.find_spec("pandas"), "pandas is not installed")
+    def test_unit_data_extractor_pandas_csv_chunks_transform(self):
+        lock = threading.Lock()
+        in_flight = [0, 0]
+
+        def transform(chunk):
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight[0] -= 1
+            return chunk["id"].sum()
+
+        result = list(
+            DataExtractorPandas().csv_chunks(
+                self.test_resource_data_folder_path_csv_typed,
+                chunk_size=1,
+                transform=transform,
+                max_in_flight=2,
+            )
+        )
+        self.assertEqual([1, 2, 3, 4, 5], result)
+        self.assertLessEqual(in_flight[1], 2)
+
+    @unittest.skipUnless(importlib.util.find_spec("pandas"), "pandas is not installed")
+    def test_unit_data_extractor_pandas_json_chunks(self):
+        result = list(
+            DataExtractorPandas().json_chunks(
+                self.test_resource_data_folder_json_lines_file,
+                chunk_size=2,
+                usecols=["id"],
+                dtype="float64",
+            )
+        )
+        self.assertEqual([2, 1], [len(chunk) for chunk in result])
+        self.assertEqual([[1.0], [2.0]], result[0].values.tolist())
+        self.assertEqual(["id"], list(result[1].columns))
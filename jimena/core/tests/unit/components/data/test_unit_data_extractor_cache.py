@@ -0,0 +1,160 @@
+import importlib.util
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from jimena.core.components.data.extractor.cache import DataExtractorCache
+from jimena.core.tests.setup import JCoreTestCase
+
+
+class TestUnitDataExtractorCache(JCoreTestCase):
+    """
+    Unit tests for the 'DataExtractorCache' class.
+
+    This test class is designed to validate the functionality of the 'DataExtractorCache' class.
+    It contains individual test methods, each focusing on different aspects of the class's behavior.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self) -> None:
+        """
+        Set up method called before each test case execution.
+        """
+        super().setUp()
+        self.folder = tempfile.TemporaryDirectory()
+        self.cache_folder = os.path.join(self.folder.name, "cache")
+        self.path = os.path.join(self.folder.name, "csv_file_typed.csv")
+        shutil.copy(
+            self.resource_tool_instance.join_paths(
+                initial_path=self.test_resource_folder,
+                paths_to_join=["data", "csv_file_typed.csv"],
+            ),
+            self.path,
+        )
+
+    def tearDown(self) -> None:
+        """
+        Set up method called after each test case execution.
+        """
+        self.folder.cleanup()
+
+    def _extract(self, extractor: DataExtractorCache, **kwargs):
+        """
+        Extracts the CSV file with the cache and returns the data and the number of times it was parsed.
+        """
+        with mock.patch.object(
+            extractor, "csv_extractor", wraps=extractor.csv_extractor
+        ) as csv_extractor:
+            data = extractor.extract(self.path, "csv_extractor", **kwargs)
+        return data, csv_extractor.call_count
+
+    def test_unit_data_extractor_cache_hit(self):
+        extractor = DataExtractorCache(folder=self.cache_folder)
+        data, parsed = self._extract(extractor)
+        self.assertEqual(1, parsed)
+        cached, parsed = self._extract(extractor)
+        self.assertEqual(0, parsed)
+        self.assertEqual(data, cached)
+        self.assertEqual(["id", "name", "price", "stock", "active"], cached[0])
+        self.assertEqual(1, len(os.listdir(self.cache_folder)))
+        self.assertTrue(os.listdir(self.cache_folder)[0].endswith(".pickle"))
+
+    def test_unit_data_extractor_cache_source_changed(self):
+        extractor = DataExtractorCache(folder=self.cache_folder)
+        self._extract(extractor)
+        with open(self.path, "a") as file:
+            file.write("6,lime,0.4,1,true\n")
+        data, parsed = self._extract(extractor)
+        self.assertEqual(1, parsed)
+        self.assertEqual("lime", data[-1][1])
+        # The cache of the previous content is replaced
+        self.assertEqual(1, len(os.listdir(self.cache_folder)))
+
+    def test_unit_data_extractor_cache_content_fingerprint(self):
+        extractor = DataExtractorCache(folder=self.cache_folder, fingerprint="content")
+        self._extract(extractor)
+        stat = os.stat(self.path)
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        self.assertEqual(0, self._extract(extractor)[1])
+        self.assertEqual(
+            1, self._extract(DataExtractorCache(folder=self.cache_folder))[1]
+        )
+
+    def test_unit_data_extractor_cache_arguments(self):
+        extractor = DataExtractorCache(folder=self.cache_folder)
+        extractor.extract(self.path, "csv_stream_extractor", header=True)
+        data = extractor.extract(self.path, "csv_stream_extractor", columns=[1])
+        self.assertEqual([["name"], ["apple"]], data[:2])
+        self.assertEqual(2, len(os.listdir(self.cache_folder)))
+
+    @unittest.skipUnless(
+        importlib.util.find_spec("pyarrow"), "pyarrow is not installed"
+    )
+    def test_unit_data_extractor_cache_tables(self):
+        for table_format, extension in (("feather", ".arrow"), ("parquet", ".parquet")):
+            extractor = DataExtractorCache(
+                folder=os.path.join(self.cache_folder, table_format),
+                table_format=table_format,
+            )
+            data = extractor.extract(
+                self.path, "csv_columnar_extractor", output="arrow"
+            )
+            cached = extractor.extract(
+                self.path, "csv_columnar_extractor", output="arrow"
+            )
+            self.assertTrue(data.equals(cached))
+            self.assertTrue(os.listdir(extractor.folder)[0].endswith(extension))
+
+    def test_unit_data_extractor_cache_clear(self):
+        extractor = DataExtractorCache(folder=self.cache_folder)
+        self._extract(extractor)
+        with open(os.path.join(self.cache_folder, "notes.txt"), "w") as file:
+            file.write("kept")
+        extractor.clear()
+        self.assertEqual(["notes.txt"], os.listdir(self.cache_folder))
+        self.assertEqual(1, self._extract(extractor)[1])
+
+    def test_unit_data_extractor_cache_write_error(self):
+        with open(self.cache_folder, "w") as file:
+            file.write("not a folder")
+        extractor = DataExtractorCache(folder=self.cache_folder)
+        data, parsed = self._extract(extractor)
+        self.assertEqual(1, parsed)
+        self.assertEqual(["id", "name", "price", "stock", "active"], data[0])
+
+    @unittest.skipUnless(
+        importlib.util.find_spec("pyarrow") and importlib.util.find_spec("pandas"),
+        "pyarrow or pandas is not installed",
+    )
+    def test_unit_data_extractor_cache_mixed_types(self):
+        pandas = importlib.import_module("pandas")
+        extractor = DataExtractorCache(folder=self.cache_folder)
+        data = pandas.DataFrame({"value": [1, "apple", 2.5]})
+        with mock.patch.object(extractor, "csv_extractor", return_value=data):
+            extractor.extract(self.path, "csv_extractor")
+            cached = extractor.extract(self.path, "csv_extractor")
+        self.assertTrue(data.equals(cached))
+        self.assertTrue(os.listdir(self.cache_folder)[0].endswith(".pickle"))
+
+    def test_unit_data_extractor_cache_private_folder(self):
+        with mock.patch.dict(os.environ, {"XDG_CACHE_HOME": self.folder.name}):
+            extractor = DataExtractorCache()
+        self.assertEqual(
+            os.path.join(self.folder.name, "jimena-core", "extracts"), extractor.folder
+        )
+        self.assertEqual(0o700, os.stat(extractor.folder).st_mode & 0o777)
+        self._extract(extractor)
+        with mock.patch("os.getuid", return_value=os.getuid() + 1):
+            with self.assertRaises(PermissionError):
+                self._extract(extractor)
+
+    def test_unit_data_extractor_cache_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            DataExtractorCache(fingerprint="name")
+        with self.assertRaises(ValueError):
+            DataExtractorCache(table_format="csv")
@@ -0,0 +1,129 @@
+import gzip
+import json
+import os
+import tempfile
+
+from jimena.core.components.data.extractor.pipeline import DataExtractorPipeline
+from jimena.core.tests.setup import JCoreTestCase
+
+
+class DataExtractorPipelineText(DataExtractorPipeline):
+    """Pipeline that extracts the JSON files as text, with the extension of the sources"""
+
+    EXTRACTORS = {".json": "text_extractor"}
+
+    def text_extractor(self, path: str):
+        return [self.threaded_decompression, *self.generic_extractor(path)]
+
+
+class TestUnitDataExtractorPipeline(JCoreTestCase):
+    """
+    Unit tests for the 'DataExtractorPipeline' class.
+
+    This test class is designed to validate the functionality of the 'DataExtractorPipeline' class.
+    It contains individual test methods, each focusing on different aspects of the class's behavior.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self) -> None:
+        """
+        Set up method called before each test case execution.
+        """
+        super().setUp()
+        self.test_resource_data_folder = self.resource_tool_instance.join_paths(
+            initial_path=self.test_resource_folder, paths_to_join=["data"]
+        )
+        self.folder = tempfile.TemporaryDirectory()
+        self.paths = []
+        for i in range(12):
+            path = os.path.join(self.folder.name, f"file_{i:02}.json")
+            with open(path, "w") as file:
+                json.dump({"id": i}, file)
+            self.paths.append(path)
+
+    def tearDown(self) -> None:
+        """
+        Set up method called after each test case execution.
+        """
+        self.folder.cleanup()
+
+    def test_unit_data_extractor_pipeline_dispatch_by_extension(self):
+        result = dict(DataExtractorPipeline().extract(self.test_resource_data_folder))
+        self.assertEqual(
+            ["hi", "that", "is", "a", "test!"],
+            result[os.path.join(self.test_resource_data_folder, "csv_file.csv")][0],
+        )
+        self.assertEqual(
+            {"color": "Red", "fruit": "Apple", "size": "Large"},
+            result[os.path.join(self.test_resource_data_folder, "json_file.json")],
+        )
+        self.assertEqual(
+            3,
+            len(
+                result[
+                    os.path.join(
+                        self.test_resource_data_folder, "json_lines_file.jsonl"
+                    )
+                ]
+            ),
+        )
+        self.assertEqual(
+            ["hi, that is a test!\n"],
+            result[os.path.join(self.test_resource_data_folder, "generic_file.txt")],
+        )
+
+    def test_unit_data_extractor_pipeline_ordered(self):
+        result = list(
+            DataExtractorPipeline().extract(
+                self.folder.name, ordered=True, max_workers=4
+            )
+        )
+        self.assertEqual(self.paths, [path for path, _ in result])
+        self.assertEqual(list(range(12)), [data["id"] for _, data in result])
+
+    def test_unit_data_extractor_pipeline_glob(self):
+        result = DataExtractorPipeline().extract(
+            os.path.join(self.folder.name, "file_0*.json")
+        )
+        self.assertEqual(set(self.paths[:10]), {path for path, _ in result})
+
+    def test_unit_data_extractor_pipeline_processes(self):
+        result = dict(
+            DataExtractorPipeline().extract(
+                self.folder.name, processes=True, max_workers=2
+            )
+        )
+        self.assertEqual({"id": 11}, result[self.paths[11]])
+
+    def test_unit_data_extractor_pipeline_errors(self):
+        with open(os.path.join(self.folder.name, "file_99.json"), "w") as file:
+            file.write("{")
+        with self.assertRaises(json.JSONDecodeError):
+            list(DataExtractorPipeline().extract(self.folder.name))
+        result = list(
+            DataExtractorPipeline().extract(self.folder.name, skip_errors=True)
+        )
+        self.assertEqual(12, len(result))
+
+    def test_unit_data_extractor_pipeline_compressed(self):
+        path = os.path.join(self.folder.name, "file_99.csv.gz")
+        with gzip.open(path, "wt") as file:
+            file.write("id,name\n1,apple\n")
+        result = dict(DataExtractorPipeline().extract(self.folder.name))
+        self.assertEqual([["id", "name"], ["1", "apple"]], result[path])
+
+    def test_unit_data_extractor_pipeline_subclass(self):
+        for processes in [False, True]:
+            result = dict(
+                DataExtractorPipelineText(threaded_decompression=True).extract(
+                    self.folder.name, processes=processes, max_workers=2
+                )
+            )
+            self.assertEqual([True, '{"id": 11}'], result[self.paths[11]])
+
+    def test_unit_data_extractor_pipeline_max_workers(self):
+        self.assertEqual(1, DataExtractorPipeline().get_max_workers(1))
+        self.assertGreaterEqual(DataExtractorPipeline().get_max_workers(1000), 1)